@@ -0,0 +1,199 @@
+# benchmarks/db_pool.py
+"""
+Connection pooling benchmark.
+
+Simulates N worker processes (gunicorn / Celery prefork) with T threads each.
+Every "request" runs one short query followed by non-DB work, and the script
+compares three connection strategies:
+
+- persistent: one connection per thread, held for its lifetime (CONN_MAX_AGE > 0)
+- per-request: connect + disconnect around every request (CONN_MAX_AGE = 0)
+- pooled: per-process infrastructure.db_pool ConnectionPool shared by threads
+
+It reports throughput, failed requests and the peak number of client backends
+seen in pg_stat_activity.
+
+Usage (from backend/, against a disposable database):
+
+    python -m benchmarks.db_pool --workers 16 64 --threads 4 --duration 10
+"""
+import argparse
+import multiprocessing
+import os
+import threading
+import time
+
+import django
+import psycopg2
+
+_CONNECTIONS_SQL = """
+    SELECT count(*) FROM pg_stat_activity
+    WHERE datname = current_database() AND backend_type = 'client backend'
+"""
+
+
+def _connection_params() -> dict:
+    from django.db import connections
+
+    return connections["default"].get_connection_params()
+
+
+def _request(cursor, query_seconds: float) -> None:
+    cursor.execute("SELECT pg_sleep(%s)", [query_seconds])
+    cursor.fetchone()
+
+
+def _run_thread(mode, params, pool, args, deadline, counters, lock):
+    ops = errors = 0
+    held = None
+    while time.monotonic() < deadline:
+        try:
+            if mode == "persistent":
+                if held is None:
+                    held = psycopg2.connect(**params)
+                    held.autocommit = True
+                with held.cursor() as cursor:
+                    _request(cursor, args.query_ms / 1000)
+            elif mode == "per-request":
+                connection = psycopg2.connect(**params)
+                connection.autocommit = True
+                try:
+                    with connection.cursor() as cursor:
+                        _request(cursor, args.query_ms / 1000)
+                finally:
+                    connection.close()
+            else:
+
+                def connect():
+                    connection = psycopg2.connect(**params)
+                    connection.autocommit = True
+                    return connection
+
+                entry = pool.getconn(connect)
+                try:
+                    with entry.connection.cursor() as cursor:
+                        _request(cursor, args.query_ms / 1000)
+                finally:
+                    pool.putconn(entry)
+            ops += 1
+        except psycopg2.Error:
+            errors += 1
+            held = None
+            time.sleep(0.05)
+        # Non-DB part of the request (serialization, cache, provider calls)
+        time.sleep(args.work_ms / 1000)
+
+    if held is not None:
+        held.close()
+    with lock:
+        counters["ops"] += ops
+        counters["errors"] += errors
+
+
+def _run_worker(mode, args, start, results):
+    from infrastructure.db_pool.pool import ConnectionPool, PoolSettings
+
+    params = _connection_params()
+    pool = None
+    if mode == "pooled":
+        pool = ConnectionPool(
+            "benchmark", PoolSettings(max_size=args.pool_size, min_idle=0)
+        )
+
+    start.wait()
+    deadline = time.monotonic() + args.duration
+    counters = {"ops": 0, "errors": 0}
+    lock = threading.Lock()
+    threads = [
+        threading.Thread(
+            target=_run_thread,
+            args=(mode, params, pool, args, deadline, counters, lock),
+        )
+        for _ in range(args.threads)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if pool is not None:
+        pool.close_idle()
+    results.put(counters)
+
+
+def run(mode: str, workers: int, args) -> dict:
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    start = context.Event()
+    processes = [
+        context.Process(target=_run_worker, args=(mode, args, start, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    peak = 0
+    sampler = psycopg2.connect(**_connection_params())
+    sampler.autocommit = True
+    start.set()
+    started = time.monotonic()
+    deadline = started + args.duration
+    with sampler.cursor() as cursor:
+        while time.monotonic() < deadline:
+            cursor.execute(_CONNECTIONS_SQL)
+            peak = max(peak, cursor.fetchone()[0] - 1)  # minus the sampler
+            time.sleep(0.1)
+    sampler.close()
+
+    totals = {"ops": 0, "errors": 0}
+    for _ in processes:
+        counters = results.get()
+        totals["ops"] += counters["ops"]
+        totals["errors"] += counters["errors"]
+    for process in processes:
+        process.join()
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "throughput": totals["ops"] / args.duration,
+        "errors": totals["errors"],
+        "peak_connections": peak,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[16, 64])
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        default=["persistent", "per-request", "pooled"],
+        choices=["persistent", "per-request", "pooled"],
+    )
+    parser.add_argument("--pool-size", type=int, default=2)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--query-ms", type=float, default=2)
+    parser.add_argument("--work-ms", type=float, default=8)
+    args = parser.parse_args()
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.dev")
+    django.setup()
+
+    print(
+        f"threads/worker={args.threads} pool_size={args.pool_size} "
+        f"query={args.query_ms}ms work={args.work_ms}ms duration={args.duration}s"
+    )
+    print(f"{'mode':<12} {'workers':>7} {'req/s':>10} {'errors':>8} {'peak conns':>11}")
+    for workers in args.workers:
+        for mode in args.modes:
+            result = run(mode, workers, args)
+            print(
+                f"{result['mode']:<12} {result['workers']:>7} "
+                f"{result['throughput']:>10.1f} {result['errors']:>8} "
+                f"{result['peak_connections']:>11}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,517 @@
+# benchmarks/http_api.py
+"""
+HTTP API load benchmark.
+
+Drives a weighted mix of payout API calls against the real stack (gunicorn +
+Django + Postgres + Redis) from closed-loop client processes and reports
+throughput and latency percentiles per endpoint:
+
+- create: POST /api/payouts/ with a fresh idempotency key (201)
+- replay: POST /api/payouts/ with an existing key (200, idempotent replay)
+- list_cached: GET /api/payouts/ (first page, served from the cache)
+- list_uncached: GET /api/payouts/?created_to=<random> (cache miss every time)
+- detail: GET /api/payouts/<id>/
+- patch: PATCH /api/payouts/<id>/ as staff (NEW -> PROCESSING -> COMPLETED)
+
+Results are written as JSON so runs can be compared.
+
+Usage (from backend/, against a disposable database):
+
+    python manage.py generate_payouts --recipients 10000 --payouts 1000000
+    python -m benchmarks.http_api run --server-workers 4 --clients 16 \\
+        --duration 60 --output before.json
+    python -m benchmarks.http_api compare before.json after.json
+
+``run`` starts gunicorn with config.settings.benchmark (throttling off) unless
+``--url`` points at a running server; that server must use the same database
+and SECRET_KEY, since the staff session for PATCH is created directly in it.
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import django
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+BENCHMARK_ADMIN = "bench-admin"
+
+OPERATIONS = ("create", "replay", "list_cached", "list_uncached", "detail", "patch")
+DEFAULT_MIX = "create=10,replay=5,list_cached=30,list_uncached=10,detail=35,patch=10"
+EXPECTED_STATUS = {"create": 201}
+
+# Sizes of the id / key samples handed to the clients
+SAMPLE_SIZE = 5000
+PATCH_SAMPLE_SIZE = 50000
+
+
+def staff_session_headers() -> dict:
+    """Cookie / CSRF headers of a staff session created directly in the DB."""
+    from importlib import import_module
+
+    from django.conf import settings
+    from django.contrib.auth import (
+        BACKEND_SESSION_KEY,
+        HASH_SESSION_KEY,
+        SESSION_KEY,
+        get_user_model,
+    )
+    from django.utils.crypto import get_random_string
+
+    User = get_user_model()
+    user = User.objects.filter(username=BENCHMARK_ADMIN).first()
+    if user is None:
+        user = User.objects.create_user(username=BENCHMARK_ADMIN, is_staff=True)
+
+    session = import_module(settings.SESSION_ENGINE).SessionStore()
+    session[SESSION_KEY] = str(user.pk)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+
+    csrf_secret = get_random_string(32)
+    return {
+        "Cookie": (
+            f"{settings.SESSION_COOKIE_NAME}={session.session_key}; "
+            f"{settings.CSRF_COOKIE_NAME}={csrf_secret}"
+        ),
+        "X-CSRFToken": csrf_secret,
+    }
+
+
+def load_fixtures() -> dict:
+    """Ids and keys the clients draw their requests from."""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT id FROM payouts_recipient WHERE is_active")
+        recipient_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            """
+            SELECT id, idempotency_key, recipient_id, amount::text, currency
+            FROM payouts_payout
+            ORDER BY random()
+            LIMIT %s
+            """,
+            [SAMPLE_SIZE],
+        )
+        sample = cursor.fetchall()
+        cursor.execute(
+            "SELECT id FROM payouts_payout WHERE status = 'NEW' LIMIT %s",
+            [PATCH_SAMPLE_SIZE],
+        )
+        patch_ids = [row[0] for row in cursor.fetchall()]
+        cursor.execute("SELECT min(created_at), max(created_at) FROM payouts_payout")
+        oldest, newest = cursor.fetchone()
+        cursor.execute(
+            """
+            SELECT coalesce(sum(child.reltuples), 0)::bigint
+            FROM pg_inherits
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE pg_inherits.inhparent = 'payouts_payout'::regclass
+            """
+        )
+        payouts = cursor.fetchone()[0]
+
+    if not sample or not recipient_ids:
+        sys.exit("No payouts found, run `python manage.py generate_payouts` first")
+
+    return {
+        "recipient_ids": recipient_ids,
+        "payout_ids": [row[0] for row in sample],
+        "replays": [row[1:] for row in sample],
+        "patch_ids": patch_ids,
+        "created_range": (oldest.timestamp(), newest.timestamp()),
+        "dataset": {"payouts": payouts, "recipients": len(recipient_ids)},
+        "staff_headers": staff_session_headers(),
+    }
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}")
+        mix[name] = float(weight or 1)
+    return {name: weight for name, weight in mix.items() if weight > 0}
+
+
+class _RequestFactory:
+    """Builds (method, path, body, headers) for one client's operations."""
+
+    def __init__(self, index: int, fixtures: dict, rng: random.Random, run_id: str):
+        self.index = index
+        self.fixtures = fixtures
+        self.rng = rng
+        self.run_id = run_id
+        self.created = 0
+        # Each client patches its own slice of NEW payouts, twice each
+        self.patches = deque(
+            (payout_id, "PROCESSING")
+            for payout_id in fixtures["patch_ids"][index :: fixtures["clients"]]
+        )
+
+    def create(self):
+        self.created += 1
+        return self._post(
+            self.rng.choice(self.fixtures["recipient_ids"]),
+            "10.00",
+            "USD",
+            f"bench-{self.run_id}-{self.index}-{self.created}",
+        )
+
+    def replay(self):
+        key, recipient_id, amount, currency = self.rng.choice(self.fixtures["replays"])
+        return self._post(recipient_id, amount, currency, key)
+
+    def list_cached(self):
+        return "GET", "/api/payouts/", None, {}
+
+    def list_uncached(self):
+        oldest, newest = self.fixtures["created_range"]
+        created_to = datetime.fromtimestamp(
+            self.rng.uniform(oldest, newest), tz=timezone.utc
+        )
+        path = f"/api/payouts/?created_to={created_to:%Y-%m-%dT%H:%M:%S.%fZ}"
+        return "GET", path, None, {}
+
+    def detail(self):
+        payout_id = self.rng.choice(self.fixtures["payout_ids"])
+        return "GET", f"/api/payouts/{payout_id}/", None, {}
+
+    def patch(self):
+        if not self.patches:
+            return None
+        payout_id, status = self.patches.popleft()
+        if status == "PROCESSING":
+            self.patches.append((payout_id, "COMPLETED"))
+        headers = {
+            **self.fixtures["staff_headers"],
+            "Content-Type": "application/json",
+        }
+        body = json.dumps({"status": status})
+        return "PATCH", f"/api/payouts/{payout_id}/", body, headers
+
+    def _post(self, recipient_id, amount, currency, key):
+        body = json.dumps(
+            {
+                "recipient_id": recipient_id,
+                "amount": amount,
+                "currency": currency,
+                "idempotency_key": key,
+            }
+        )
+        return "POST", "/api/payouts/", body, {"Content-Type": "application/json"}
+
+
+def _run_client(index, args, fixtures, mix, start_at, results) -> None:
+    rng = random.Random(args.seed * 1000 + index)
+    factory = _RequestFactory(index, fixtures, rng, args.run_id)
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies = {name: [] for name in names}
+    statuses = {name: Counter() for name in names}
+
+    target = urlsplit(args.url)
+    connection = http.client.HTTPConnection(target.hostname, target.port, timeout=30)
+    measure_from = start_at + args.warmup
+    deadline = measure_from + args.duration
+    time.sleep(max(0.0, start_at - time.time()))
+
+    while True:
+        name = rng.choices(names, weights)[0]
+        request = getattr(factory, name)()
+        if request is None:
+            continue
+        method, path, body, headers = request
+
+        started = time.time()
+        if started >= deadline:
+            break
+        try:
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            status = 0
+        # http.client reconnects by itself when the server closed the socket
+        if started >= measure_from:
+            latencies[name].append(time.time() - started)
+            statuses[name][status] += 1
+
+    connection.close()
+    results.put((latencies, statuses))
+
+
+def percentile(sorted_values: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(latencies: list[float], statuses: Counter, *, ok: int, duration):
+    values = sorted(latencies)
+    requests = len(values)
+    errors = requests - ok
+    return {
+        "requests": requests,
+        "errors": errors,
+        "statuses": {str(code): count for code, count in sorted(statuses.items())},
+        "throughput": requests / duration,
+        "latency_ms": {
+            "mean": sum(values) / requests * 1000 if requests else 0.0,
+            "p50": percentile(values, 50) * 1000,
+            "p95": percentile(values, 95) * 1000,
+            "p99": percentile(values, 99) * 1000,
+            "max": (values[-1] if values else 0.0) * 1000,
+        },
+    }
+
+
+def start_server(args) -> subprocess.Popen:
+    target = urlsplit(args.url)
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": os.environ["DJANGO_SETTINGS_MODULE"],
+        "PROMETHEUS_MULTIPROC_DIR": f"/tmp/benchmark-multiproc-{os.getpid()}",
+    }
+    server = subprocess.Popen(
+        [
+            "gunicorn",
+            "config.wsgi:application",
+            "-c",
+            "config/gunicorn.conf.py",
+            "--bind",
+            f"{target.hostname}:{target.port}",
+            "--workers",
+            str(args.server_workers),
+            "--log-level",
+            "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            sys.exit(f"gunicorn exited with status {server.returncode}")
+        try:
+            connection = http.client.HTTPConnection(
+                target.hostname, target.port, timeout=1
+            )
+            connection.request("GET", "/health/live/")
+            if connection.getresponse().status == 200:
+                return server
+        except OSError:
+            pass
+        time.sleep(0.2)
+    server.terminate()
+    sys.exit("gunicorn did not become ready within 60s")
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> dict:
+    from django.db import connections
+
+    mix = args.mix
+    fixtures = load_fixtures()
+    fixtures["clients"] = args.clients
+    connections.close_all()
+
+    server = None
+    if args.url is None:
+        args.url = f"http://127.0.0.1:{args.port}"
+        server = start_server(args)
+
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    start_at = time.time() + 1
+    clients = [
+        context.Process(
+            target=_run_client,
+            args=(index, args, fixtures, mix, start_at, results),
+        )
+        for index in range(args.clients)
+    ]
+    try:
+        for client in clients:
+            client.start()
+        latencies = {name: [] for name in mix}
+        statuses = {name: Counter() for name in mix}
+        for _ in clients:
+            client_latencies, client_statuses = results.get()
+            for name in mix:
+                latencies[name].extend(client_latencies[name])
+                statuses[name].update(client_statuses[name])
+        for client in clients:
+            client.join()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    ok = {name: statuses[name][EXPECTED_STATUS.get(name, 200)] for name in mix}
+    endpoints = {
+        name: summarize(
+            latencies[name], statuses[name], ok=ok[name], duration=args.duration
+        )
+        for name in mix
+    }
+    endpoints["total"] = summarize(
+        [value for values in latencies.values() for value in values],
+        sum(statuses.values(), Counter()),
+        ok=sum(ok.values()),
+        duration=args.duration,
+    )
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "settings": os.environ["DJANGO_SETTINGS_MODULE"],
+            "url": args.url,
+            "server_workers": args.server_workers if server is not None else None,
+            "clients": args.clients,
+            "duration": args.duration,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "mix": mix,
+            "dataset": fixtures["dataset"],
+        },
+        "endpoints": endpoints,
+    }
+
+
+def _name_width(names) -> int:
+    return max([14, *(len(name) for name in names)])
+
+
+def print_results(results: dict) -> None:
+    width = _name_width(results["endpoints"])
+    print(
+        f"{'endpoint':<{width}} {'req/s':>9} {'errors':>7} {'p50 ms':>8} "
+        f"{'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}"
+    )
+    for name, endpoint in results["endpoints"].items():
+        latency = endpoint["latency_ms"]
+        print(
+            f"{name:<{width}} {endpoint['throughput']:>9.1f} {endpoint['errors']:>7} "
+            f"{latency['p50']:>8.1f} {latency['p95']:>8.1f} "
+            f"{latency['p99']:>8.1f} {latency['max']:>8.1f}"
+        )
+
+
+# ----- compare -----
+
+
+def format_delta(before: float, after: float) -> str:
+    if not before:
+        return "    n/a"
+    return f"{(after - before) / before * 100:+6.1f}%"
+
+
+def compare(args) -> None:
+    before = json.loads(Path(args.before).read_text())
+    after = json.loads(Path(args.after).read_text())
+    print(f"before: {args.before} ({before['meta'].get('git_revision')})")
+    print(f"after:  {args.after} ({after['meta'].get('git_revision')})")
+    width = _name_width(before["endpoints"])
+    print(
+        f"{'endpoint':<{width}} {'req/s':>22} {'p50 ms':>22} {'p95 ms':>22} "
+        f"{'p99 ms':>22}"
+    )
+    for name, old in before["endpoints"].items():
+        new = after["endpoints"].get(name)
+        if new is None:
+            continue
+        cells = [
+            f"{old['throughput']:>7.1f} {new['throughput']:>7.1f} "
+            f"{format_delta(old['throughput'], new['throughput'])}"
+        ]
+        for key in ("p50", "p95", "p99"):
+            old_ms, new_ms = old["latency_ms"][key], new["latency_ms"][key]
+            cells.append(
+                f"{old_ms:>7.1f} {new_ms:>7.1f} {format_delta(old_ms, new_ms)}"
+            )
+        print(f"{name:<{width}} " + " ".join(cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--settings",
+        default="config.settings.benchmark",
+        help="Django settings module (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=42, help="seed of the clients' request mix"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the load and report")
+    run_parser.add_argument(
+        "--url", help="target a running server instead of starting gunicorn"
+    )
+    run_parser.add_argument("--port", type=int, default=8089)
+    run_parser.add_argument("--server-workers", type=int, default=4)
+    run_parser.add_argument("--clients", type=int, default=16)
+    run_parser.add_argument("--duration", type=float, default=30)
+    run_parser.add_argument("--warmup", type=float, default=5)
+    run_parser.add_argument(
+        "--mix",
+        type=parse_mix,
+        default=DEFAULT_MIX,
+        help="operation weights (default: %(default)s)",
+    )
+    run_parser.add_argument("--output", help="results file (default: timestamped)")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        compare(args)
+        return
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    django.setup()
+
+    args.run_id = f"{int(time.time()):x}"
+    results = run(args)
+    output = Path(args.output or f"http_api-{time.strftime('%Y%m%dT%H%M%S')}.json")
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print_results(results)
+    print(f"results: {output}")
+
+
+if __name__ == "__main__":
+    main()
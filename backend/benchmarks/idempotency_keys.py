@@ -0,0 +1,296 @@
+# benchmarks/idempotency_keys.py
+"""
+Idempotency key registry size and lookup benchmark.
+
+Loads the same N client keys (UUID-formatted strings, as most clients send)
+into two scratch tables shaped like payouts_payout_idempotency_key:
+
+- varchar: the previous layout, varchar(64) primary key plus the
+  varchar_pattern_ops index Django adds to character primary keys
+- hash: the current layout, 16-byte uuid hash primary key plus the
+  created_at index used by the expiry sweep
+
+and reports, for each layout, table and index sizes, the time to load and
+index the keys, primary key lookup latency for random existing keys (a first
+pass and a cached second pass over the same keys), and how fast the expiry sweep deletes the oldest keys.
+
+Indexes are built after loading, so sizes are for freshly built B-trees; both
+grow by a similar factor under random inserts.
+
+Usage (from backend/, against a disposable database; 100M keys need ~25 GB of
+disk and most of an hour):
+
+    python -m benchmarks.idempotency_keys --keys 100000000 --output idem.json
+"""
+import argparse
+import hashlib
+import json
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+import django
+import psycopg2
+
+from benchmarks.http_api import git_revision, percentile
+
+# Rows inserted per statement while loading
+_LOAD_CHUNK = 5_000_000
+
+_KEY_SQL = "md5(i::text)::uuid::text"
+
+_HASH_SQL = (
+    f"encode(substring(sha256(convert_to({_KEY_SQL}, 'UTF8')) FROM 1 FOR 16), "
+    "'hex')::uuid"
+)
+
+# Keys registered one second apart, oldest first
+_COLUMNS_SQL = """
+    {key} AS {key_column},
+    i AS payout_id,
+    %(start)s::timestamptz + make_interval(secs => i) AS payout_created_at,
+    %(start)s::timestamptz + make_interval(secs => i) AS created_at
+"""
+
+LAYOUTS = {
+    "varchar": {
+        "key_column": "key",
+        "key_sql": _KEY_SQL,
+        "create": "CREATE TABLE {table} (key varchar(64) NOT NULL, "
+        "payout_id bigint NOT NULL, payout_created_at timestamptz NOT NULL, "
+        "created_at timestamptz NOT NULL)",
+        "indexes": (
+            "ALTER TABLE {table} ADD PRIMARY KEY (key)",
+            "CREATE INDEX {table}_like ON {table} (key varchar_pattern_ops)",
+        ),
+    },
+    "hash": {
+        "key_column": "key_hash",
+        "key_sql": _HASH_SQL,
+        "create": "CREATE TABLE {table} (key_hash uuid NOT NULL, "
+        "payout_id bigint NOT NULL, payout_created_at timestamptz NOT NULL, "
+        "created_at timestamptz NOT NULL)",
+        "indexes": (
+            "ALTER TABLE {table} ADD PRIMARY KEY (key_hash)",
+            "CREATE INDEX {table}_created ON {table} (created_at)",
+        ),
+    },
+}
+
+# Same statement as infrastructure.payouts.idempotency
+_SWEEP_SQL = """
+    DELETE FROM {table}
+    WHERE key_hash IN (
+        SELECT key_hash FROM {table}
+        WHERE created_at < %s
+        ORDER BY created_at
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+"""
+
+_SIZES_SQL = """
+    SELECT pg_relation_size(%(table)s),
+           pg_indexes_size(%(table)s),
+           (SELECT pg_relation_size(indexrelid) FROM pg_index
+            WHERE indrelid = %(table)s::regclass AND indisprimary)
+"""
+
+
+def client_key(index: int) -> str:
+    """The key ``_KEY_SQL`` generates for ``index``."""
+    return str(uuid.UUID(hashlib.md5(str(index).encode()).hexdigest()))
+
+
+def _connect():
+    from django.db import connections
+
+    connection = psycopg2.connect(**connections["default"].get_connection_params())
+    connection.autocommit = True
+    return connection
+
+
+def _load(cursor, layout: dict, table: str, keys: int, start: datetime) -> float:
+    started = time.monotonic()
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(layout["create"].format(table=table))
+    columns = _COLUMNS_SQL.format(
+        key=layout["key_sql"], key_column=layout["key_column"]
+    )
+    for first in range(0, keys, _LOAD_CHUNK):
+        last = min(first + _LOAD_CHUNK, keys) - 1
+        cursor.execute(
+            f"INSERT INTO {table} SELECT {columns} "
+            "FROM generate_series(%(first)s, %(last)s) AS i",
+            {"start": start, "first": first, "last": last},
+        )
+        print(f"  {table}: {last + 1:,} keys loaded")
+    for statement in layout["indexes"]:
+        cursor.execute(statement.format(table=table))
+    cursor.execute(f"VACUUM ANALYZE {table}")
+    return time.monotonic() - started
+
+
+def _lookups(cursor, layout: dict, table: str, keys: int, probes: int, rng) -> dict:
+    from payouts.domain.value_objects import idempotency_key_hash
+
+    column = layout["key_column"]
+    sql = f"SELECT payout_id, payout_created_at FROM {table} WHERE {column} = %s"
+    indexes = [rng.randrange(keys) for _ in range(probes)]
+
+    def probe() -> list[float]:
+        latencies = []
+        for index in indexes:
+            sent = time.perf_counter()
+            key = client_key(index)
+            value = idempotency_key_hash(key) if column == "key_hash" else key
+            cursor.execute(sql, [value])
+            row = cursor.fetchone()
+            latencies.append(time.perf_counter() - sent)
+            if row is None or row[0] != index:
+                raise SystemExit(f"{table}: key {index} not found")
+        return sorted(latencies)
+
+    def summary(latencies: list[float]) -> dict:
+        return {
+            "p50_us": percentile(latencies, 50) * 1e6,
+            "p95_us": percentile(latencies, 95) * 1e6,
+            "p99_us": percentile(latencies, 99) * 1e6,
+            "max_us": latencies[-1] * 1e6,
+        }
+
+    # The second pass reads the same keys, now cached
+    cold = probe()
+    return {"probes": probes, "cold": summary(cold), "warm": summary(probe())}
+
+
+def _sweep(cursor, table: str, start: datetime, expire: int, batch: int) -> dict:
+    cutoff = datetime.fromtimestamp(start.timestamp() + expire, timezone.utc)
+    started = time.monotonic()
+    expired = 0
+    while True:
+        cursor.execute(_SWEEP_SQL.format(table=table), [cutoff, batch])
+        expired += cursor.rowcount
+        if cursor.rowcount < batch:
+            break
+    elapsed = time.monotonic() - started
+    return {
+        "expired": expired,
+        "batch_size": batch,
+        "seconds": elapsed,
+        "keys_per_second": expired / elapsed if elapsed else 0.0,
+    }
+
+
+def run(args) -> dict:
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    results = {}
+    connection = _connect()
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT version()")
+        server = cursor.fetchone()[0]
+        for name in args.layouts:
+            layout = LAYOUTS[name]
+            table = f"bench_idem_{name}"
+            rng = random.Random(args.seed)  # same probe keys for every layout
+            load_seconds = _load(cursor, layout, table, args.keys, start)
+            cursor.execute(_SIZES_SQL, {"table": table})
+            table_bytes, index_bytes, pk_bytes = cursor.fetchone()
+            result = {
+                "load_seconds": load_seconds,
+                "table_bytes": table_bytes,
+                "indexes_bytes": index_bytes,
+                "primary_key_bytes": pk_bytes,
+                "primary_key_bytes_per_key": pk_bytes / args.keys,
+                "lookup": _lookups(cursor, layout, table, args.keys, args.probes, rng),
+            }
+            if name == "hash" and args.sweep:
+                result["sweep"] = _sweep(
+                    cursor, table, start, args.sweep, args.sweep_batch
+                )
+            if not args.keep:
+                cursor.execute(f"DROP TABLE {table}")
+            results[name] = result
+    connection.close()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "server": server,
+            "keys": args.keys,
+            "seed": args.seed,
+        },
+        "layouts": results,
+    }
+
+
+def _mib(value: int) -> str:
+    return f"{value / 2**20:,.0f} MiB"
+
+
+def print_results(results: dict) -> None:
+    print(
+        f"{'layout':<8} {'table':>11} {'pk index':>11} {'all indexes':>12} "
+        f"{'B/key':>6} {'cold p50/p99 µs':>16} {'warm p50/p99 µs':>16} "
+        f"{'load s':>7}"
+    )
+    for name, result in results["layouts"].items():
+        cold, warm = result["lookup"]["cold"], result["lookup"]["warm"]
+        print(
+            f"{name:<8} {_mib(result['table_bytes']):>11} "
+            f"{_mib(result['primary_key_bytes']):>11} "
+            f"{_mib(result['indexes_bytes']):>12} "
+            f"{result['primary_key_bytes_per_key']:>6.1f} "
+            f"{cold['p50_us']:>7.0f}/{cold['p99_us']:<8.0f} "
+            f"{warm['p50_us']:>7.0f}/{warm['p99_us']:<8.0f} "
+            f"{result['load_seconds']:>7.0f}"
+        )
+        if "sweep" in result:
+            sweep = result["sweep"]
+            print(
+                f"  sweep: {sweep['expired']:,} keys in {sweep['seconds']:.1f}s "
+                f"({sweep['keys_per_second']:,.0f} keys/s, "
+                f"batches of {sweep['batch_size']:,})"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--settings",
+        default="config.settings.benchmark",
+        help="Django settings module (default: %(default)s)",
+    )
+    parser.add_argument("--keys", type=int, default=1_000_000)
+    parser.add_argument("--probes", type=int, default=20_000)
+    parser.add_argument(
+        "--layouts", nargs="+", choices=sorted(LAYOUTS), default=["varchar", "hash"]
+    )
+    parser.add_argument(
+        "--sweep",
+        type=int,
+        default=1_000_000,
+        help="expire this many of the oldest hashed keys (0 = skip)",
+    )
+    parser.add_argument("--sweep-batch", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="keep scratch tables")
+    parser.add_argument("--output", help="results file (default: timestamped)")
+    args = parser.parse_args()
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    django.setup()
+
+    results = run(args)
+    output = Path(args.output or f"idempotency-{time.strftime('%Y%m%dT%H%M%S')}.json")
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print_results(results)
+    print(f"results: {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,390 @@
+# benchmarks/pipeline.py
+"""
+Payout pipeline throughput benchmark.
+
+For every worker concurrency setting, starts a real Celery worker with the
+payout provider stubbed at a fixed latency, creates N payouts (through the use
+case or the HTTP API) and waits until the queue is drained. Reports:
+
+- time to drain (first payout created -> last payout COMPLETED)
+- completed payouts per second
+- per-stage latency from payouts_payout_status_history:
+  queued (created -> PROCESSING) and provider (PROCESSING -> COMPLETED)
+- database connections held while draining (peak / mean above baseline)
+
+Results are written as JSON so fleet sizing changes can be compared.
+
+Usage (from backend/, with Postgres and Redis running and no other worker
+consuming the default queue):
+
+    python -m benchmarks.pipeline run --payouts 2000 --concurrency 4 8 16 \\
+        --provider-latency 0.2 --output pipeline.json
+    python -m benchmarks.pipeline compare before.json after.json
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from pathlib import Path
+
+import django
+
+from benchmarks.http_api import BACKEND_DIR, format_delta, git_revision, percentile
+
+_CONNECTIONS_SQL = """
+    SELECT count(*) FROM pg_stat_activity
+    WHERE datname = current_database() AND backend_type = 'client backend'
+"""
+
+_DONE_SQL = """
+    SELECT count(*) FROM payouts_payout
+    WHERE id = ANY(%s) AND created_at >= %s AND status IN ('COMPLETED', 'FAILED')
+"""
+
+_STAGES_SQL = """
+    SELECT
+        payout.status,
+        payout.created_at,
+        max(history.changed_at) FILTER (WHERE history.to_status = 'PROCESSING'),
+        max(history.changed_at) FILTER (WHERE history.to_status = 'COMPLETED')
+    FROM payouts_payout payout
+    LEFT JOIN payouts_payout_status_history history
+        ON history.payout_id = payout.id
+    WHERE payout.id = ANY(%s) AND payout.created_at >= %s
+    GROUP BY payout.id, payout.status, payout.created_at
+"""
+
+BENCHMARK_RECIPIENT = "Pipeline benchmark recipient"
+# Seconds between completion / connection samples while draining
+POLL_INTERVAL = 0.2
+
+
+def _recipient_id() -> int:
+    from payouts.models import Recipient
+
+    recipient, _ = Recipient.objects.get_or_create(
+        name=BENCHMARK_RECIPIENT,
+        defaults={
+            "type": Recipient.Type.BUSINESS,
+            "account_number": "UA000000000000000000000000001",
+            "country": "UA",
+            "is_active": True,
+        },
+    )
+    return recipient.id
+
+
+class _Creator:
+    """Creates payouts through the use case or through the full HTTP stack."""
+
+    def __init__(self, via: str, run_id: str) -> None:
+        self.via = via
+        self.run_id = run_id
+        self.recipient_id = _recipient_id()
+        self.created = 0
+        if via == "api":
+            from django.test import Client
+
+            self.client = Client()
+
+    def create(self) -> int:
+        self.created += 1
+        key = f"pipeline-{self.run_id}-{self.created}"
+        if self.via == "api":
+            response = self.client.post(
+                "/api/payouts/",
+                data={
+                    "recipient_id": self.recipient_id,
+                    "amount": "10.00",
+                    "currency": "USD",
+                    "idempotency_key": key,
+                },
+                content_type="application/json",
+            )
+            if response.status_code != 201:
+                sys.exit(f"create failed: {response.status_code} {response.content}")
+            return response.json()["id"]
+
+        from payouts.application.use_cases import CreatePayoutUseCase
+
+        payout, _ = CreatePayoutUseCase.execute(
+            recipient_id=self.recipient_id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key=key,
+        )
+        return payout.id
+
+
+def _connections(cursor) -> int:
+    cursor.execute(_CONNECTIONS_SQL)
+    return cursor.fetchone()[0]
+
+
+def _start_worker(args, concurrency: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PAYOUT_PROVIDER_LATENCY_SECONDS": str(args.provider_latency),
+        # Don't clash with the exporter of a dev worker
+        "CELERY_METRICS_PORT": "0",
+    }
+    return subprocess.Popen(
+        [
+            "celery",
+            "-A",
+            "config",
+            "worker",
+            "--loglevel",
+            "warning",
+            "--pool",
+            args.pool,
+            "--concurrency",
+            str(concurrency),
+            "--hostname",
+            f"pipeline-{concurrency}@%h",
+            "--without-gossip",
+            "--without-mingle",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+
+
+def _stop_worker(worker: subprocess.Popen) -> None:
+    # Warm shutdown: running tasks finish first
+    worker.send_signal(signal.SIGTERM)
+    try:
+        worker.wait(timeout=60)
+    except subprocess.TimeoutExpired:
+        worker.kill()
+        worker.wait()
+
+
+def _wait_done(cursor, ids, since, timeout: float, on_sample=None) -> int:
+    deadline = time.monotonic() + timeout
+    while True:
+        cursor.execute(_DONE_SQL, [ids, since])
+        done = cursor.fetchone()[0]
+        if on_sample is not None:
+            on_sample()
+        if done >= len(ids) or time.monotonic() >= deadline:
+            return done
+        time.sleep(POLL_INTERVAL)
+
+
+def _latency_summary(seconds: list[float]) -> dict:
+    values = sorted(seconds)
+    if not values:
+        return {"mean": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "mean": sum(values) / len(values) * 1000,
+        "p50": percentile(values, 50) * 1000,
+        "p95": percentile(values, 95) * 1000,
+        "p99": percentile(values, 99) * 1000,
+        "max": values[-1] * 1000,
+    }
+
+
+def run_once(args, concurrency: int) -> dict:
+    from django.db import connection
+
+    creator = _Creator(args.create_via, f"{args.run_id}-{concurrency}")
+    with connection.cursor() as cursor:
+        baseline = _connections(cursor)
+        worker = _start_worker(args, concurrency)
+        try:
+            # A canary payout doubles as the worker readiness check
+            since = datetime.now(timezone.utc)
+            canary = creator.create()
+            if _wait_done(cursor, [canary], since, timeout=60) < 1:
+                sys.exit("worker did not process the canary payout within 60s")
+
+            samples = []
+
+            def sample_connections():
+                samples.append(_connections(cursor) - baseline)
+
+            since = datetime.now(timezone.utc)
+            started = time.monotonic()
+            ids = []
+            for _ in range(args.payouts):
+                ids.append(creator.create())
+                if args.rate:
+                    time.sleep(
+                        max(0.0, started + len(ids) / args.rate - time.monotonic())
+                    )
+                if len(ids) % 100 == 0:
+                    sample_connections()
+            create_seconds = time.monotonic() - started
+
+            done = _wait_done(cursor, ids, since, args.timeout, sample_connections)
+        finally:
+            _stop_worker(worker)
+
+        cursor.execute(_STAGES_SQL, [ids, since])
+        rows = cursor.fetchall()
+
+    queued, provider, total = [], [], []
+    completed = failed = 0
+    last_finished = None
+    for status, created_at, processing_at, completed_at in rows:
+        if status == "FAILED":
+            failed += 1
+        if processing_at is not None:
+            queued.append((processing_at - created_at).total_seconds())
+        if completed_at is None:
+            continue
+        completed += 1
+        provider.append((completed_at - processing_at).total_seconds())
+        total.append((completed_at - created_at).total_seconds())
+        last_finished = max(last_finished or completed_at, completed_at)
+
+    drain_seconds = (last_finished - since).total_seconds() if last_finished else None
+    return {
+        "concurrency": concurrency,
+        "payouts": len(ids),
+        "completed": completed,
+        "failed": failed,
+        "drained": done >= len(ids),
+        "create_seconds": create_seconds,
+        "drain_seconds": drain_seconds,
+        "throughput": completed / drain_seconds if drain_seconds else 0.0,
+        "latency_ms": {
+            "queued": _latency_summary(queued),
+            "provider": _latency_summary(provider),
+            "total": _latency_summary(total),
+        },
+        "db_connections": {
+            "peak": max(samples, default=0),
+            "mean": sum(samples) / len(samples) if samples else 0.0,
+        },
+    }
+
+
+def run(args) -> dict:
+    runs = []
+    for concurrency in args.concurrency:
+        result = run_once(args, concurrency)
+        runs.append(result)
+        _print_run(result)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "settings": os.environ["DJANGO_SETTINGS_MODULE"],
+            "payouts": args.payouts,
+            "provider_latency": args.provider_latency,
+            "pool": args.pool,
+            "create_via": args.create_via,
+            "rate": args.rate,
+        },
+        "runs": runs,
+    }
+
+
+_HEADER = (
+    f"{'concurrency':>11} {'drain s':>8} {'done/s':>8} {'queued p95':>11} "
+    f"{'provider p95':>13} {'total p95':>10} {'conns':>6}"
+)
+
+
+def _print_run(result: dict) -> None:
+    latency = result["latency_ms"]
+    drain = result["drain_seconds"]
+    print(
+        f"{result['concurrency']:>11} "
+        f"{drain if drain is not None else float('nan'):>8.1f} "
+        f"{result['throughput']:>8.1f} "
+        f"{latency['queued']['p95']:>11.0f} "
+        f"{latency['provider']['p95']:>13.0f} "
+        f"{latency['total']['p95']:>10.0f} "
+        f"{result['db_connections']['peak']:>6}"
+        + ("" if result["drained"] else "  (not drained)")
+    )
+
+
+def compare(args) -> None:
+    before = json.loads(Path(args.before).read_text())
+    after = json.loads(Path(args.after).read_text())
+    print(f"before: {args.before} ({before['meta'].get('git_revision')})")
+    print(f"after:  {args.after} ({after['meta'].get('git_revision')})")
+    print(f"{'concurrency':>11} {'done/s':>22} {'total p95 ms':>24} {'peak conns':>18}")
+    after_runs = {run["concurrency"]: run for run in after["runs"]}
+    for old in before["runs"]:
+        new = after_runs.get(old["concurrency"])
+        if new is None:
+            continue
+        old_p95 = old["latency_ms"]["total"]["p95"]
+        new_p95 = new["latency_ms"]["total"]["p95"]
+        old_conns = old["db_connections"]["peak"]
+        new_conns = new["db_connections"]["peak"]
+        print(
+            f"{old['concurrency']:>11} "
+            f"{old['throughput']:>7.1f} {new['throughput']:>7.1f} "
+            f"{format_delta(old['throughput'], new['throughput'])} "
+            f"{old_p95:>8.0f} {new_p95:>8.0f} {format_delta(old_p95, new_p95)} "
+            f"{old_conns:>4} {new_conns:>4} {format_delta(old_conns, new_conns)}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--settings",
+        default="config.settings.benchmark",
+        help="Django settings module (default: %(default)s)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the pipeline and report")
+    run_parser.add_argument("--payouts", type=int, default=1000)
+    run_parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8, 16])
+    run_parser.add_argument(
+        "--pool", default="prefork", choices=["prefork", "threads", "solo"]
+    )
+    run_parser.add_argument(
+        "--provider-latency",
+        type=float,
+        default=0.2,
+        help="seconds per simulated provider call (default: %(default)s)",
+    )
+    run_parser.add_argument(
+        "--create-via", default="use-case", choices=["use-case", "api"]
+    )
+    run_parser.add_argument(
+        "--rate", type=float, help="payouts created per second (default: no limit)"
+    )
+    run_parser.add_argument("--timeout", type=float, default=600)
+    run_parser.add_argument("--output", help="results file (default: timestamped)")
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        compare(args)
+        return
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    django.setup()
+
+    args.run_id = f"{int(time.time()):x}"
+    print(
+        f"payouts={args.payouts} provider={args.provider_latency}s "
+        f"pool={args.pool} create_via={args.create_via}"
+    )
+    print(_HEADER)
+    results = run(args)
+    output = Path(args.output or f"pipeline-{time.strftime('%Y%m%dT%H%M%S')}.json")
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print(f"results: {output}")
+
+
+if __name__ == "__main__":
+    main()
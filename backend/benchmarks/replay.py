@@ -0,0 +1,256 @@
+# benchmarks/replay.py
+"""
+Replay of captured API traffic (see infrastructure.traffic_capture).
+
+Re-issues captured requests against a local stack with their original spacing
+divided by --speed (1 = real time, 10 = ten times faster). The replay is open
+loop: every request is sent at its scheduled time whether or not earlier ones
+have finished, so dashboard polling, retry storms and payroll bursts keep
+their shape. Requests captured from staff are sent with a staff session.
+
+Reports per endpoint (method + route) latency percentiles and how many
+replayed statuses differ from the captured ones, plus how late requests were
+sent (a growing lag means the replayer could not keep up: raise --threads).
+
+Usage (from backend/; restore the same database snapshot before each build so
+both replays see the same data):
+
+    python -m benchmarks.replay run /tmp/payouts-traffic --speed 10 --output a.json
+    # ... switch build, restore snapshot ...
+    python -m benchmarks.replay run /tmp/payouts-traffic --speed 10 --output b.json
+    python -m benchmarks.replay compare a.json b.json
+"""
+import argparse
+import http.client
+import json
+import os
+import queue
+import threading
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode, urlsplit
+
+import django
+
+from benchmarks.http_api import (
+    compare,
+    git_revision,
+    print_results,
+    staff_session_headers,
+    start_server,
+    summarize,
+)
+
+
+def load_records(sources: list[str], limit: int | None = None) -> list[dict]:
+    """Captured requests from files / directories (rotated files included)."""
+    paths = []
+    for source in sources:
+        path = Path(source)
+        paths.extend(sorted(path.glob("traffic-*.jsonl*")) if path.is_dir() else [path])
+
+    records = []
+    for path in paths:
+        with open(path) as capture_file:
+            for line in capture_file:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    continue  # torn last line of a file being written
+    records.sort(key=lambda record: record["ts"])
+    return records[:limit] if limit else records
+
+
+def endpoint(record: dict) -> str:
+    return f"{record['method']} {record.get('route') or record['path']}"
+
+
+def build_request(record: dict, staff_headers: dict):
+    """(method, url, body, headers) re-creating a captured request."""
+    url = record["path"]
+    if record.get("query"):
+        url = f"{url}?{urlencode(record['query'], doseq=True)}"
+    headers = dict(staff_headers) if record.get("staff") else {}
+    body = None
+    if "body" in record:
+        body = json.dumps(record["body"])
+        headers["Content-Type"] = "application/json"
+    return record["method"], url, body, headers
+
+
+class _Replayer:
+    def __init__(self, args, records, staff_headers) -> None:
+        self.args = args
+        self.records = records
+        self.staff_headers = staff_headers
+        self.target = urlsplit(args.url)
+        self.pending: queue.Queue = queue.Queue()
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.matches = Counter()
+        self.lags: list[float] = []
+
+    def run(self) -> float:
+        threads = [
+            threading.Thread(target=self._worker, daemon=True)
+            for _ in range(self.args.threads)
+        ]
+        for thread in threads:
+            thread.start()
+
+        first_ts = self.records[0]["ts"]
+        self.started = time.monotonic() + 1
+        for record in self.records:
+            due = self.started + (record["ts"] - first_ts) / self.args.speed
+            self.pending.put((due, record))
+        for _ in threads:
+            self.pending.put(None)
+        for thread in threads:
+            thread.join()
+        return time.monotonic() - self.started
+
+    def _worker(self) -> None:
+        connection = http.client.HTTPConnection(
+            self.target.hostname, self.target.port, timeout=30
+        )
+        while True:
+            item = self.pending.get()
+            if item is None:
+                break
+            due, record = item
+            delay = due - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            method, url, body, headers = build_request(record, self.staff_headers)
+
+            sent = time.monotonic()
+            try:
+                connection.request(method, url, body=body, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                status = 0
+            latency = time.monotonic() - sent
+
+            name = endpoint(record)
+            with self.lock:
+                self.latencies[name].append(latency)
+                self.statuses[name][status] += 1
+                self.matches[name] += status == record["status"]
+                self.lags.append(max(0.0, sent - due))
+        connection.close()
+
+
+def run(args) -> dict:
+    from django.db import connections
+
+    records = load_records(args.sources, args.limit)
+    if not records:
+        raise SystemExit("No captured requests found")
+    staff_headers = (
+        staff_session_headers() if any(r.get("staff") for r in records) else {}
+    )
+    connections.close_all()
+
+    server = None
+    if args.url is None:
+        args.url = f"http://127.0.0.1:{args.port}"
+        server = start_server(args)
+    try:
+        replayer = _Replayer(args, records, staff_headers)
+        elapsed = replayer.run()
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    endpoints = {
+        name: summarize(
+            replayer.latencies[name],
+            replayer.statuses[name],
+            ok=replayer.matches[name],
+            duration=elapsed,
+        )
+        for name in sorted(replayer.latencies)
+    }
+    endpoints["total"] = summarize(
+        [value for values in replayer.latencies.values() for value in values],
+        sum(replayer.statuses.values(), Counter()),
+        ok=sum(replayer.matches.values()),
+        duration=elapsed,
+    )
+    lags = sorted(replayer.lags)
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": git_revision(),
+            "settings": os.environ["DJANGO_SETTINGS_MODULE"],
+            "url": args.url,
+            "sources": args.sources,
+            "requests": len(records),
+            "captured_seconds": records[-1]["ts"] - records[0]["ts"],
+            "speed": args.speed,
+            "replay_seconds": elapsed,
+            "send_lag_ms": {
+                "p50": lags[len(lags) // 2] * 1000,
+                "max": lags[-1] * 1000,
+            },
+        },
+        # "errors" counts responses whose status differs from the capture
+        "endpoints": endpoints,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--settings",
+        default="config.settings.benchmark",
+        help="Django settings module (default: %(default)s)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="replay captured traffic")
+    run_parser.add_argument(
+        "sources", nargs="+", help="capture files or TRAFFIC_CAPTURE_DIR directories"
+    )
+    run_parser.add_argument(
+        "--speed", type=float, default=1, help="time compression factor"
+    )
+    run_parser.add_argument("--limit", type=int, help="replay only the first N")
+    run_parser.add_argument("--threads", type=int, default=64)
+    run_parser.add_argument(
+        "--url", help="target a running server instead of starting gunicorn"
+    )
+    run_parser.add_argument("--port", type=int, default=8089)
+    run_parser.add_argument("--server-workers", type=int, default=4)
+    run_parser.add_argument("--output", help="results file (default: timestamped)")
+
+    compare_parser = commands.add_parser("compare", help="compare two replays")
+    compare_parser.add_argument("before")
+    compare_parser.add_argument("after")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        compare(args)
+        return
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = args.settings
+    django.setup()
+
+    results = run(args)
+    output = Path(args.output or f"replay-{time.strftime('%Y%m%dT%H%M%S')}.json")
+    output.write_text(json.dumps(results, indent=2) + "\n")
+    print_results(results)
+    lag = results["meta"]["send_lag_ms"]
+    print(f"send lag p50 {lag['p50']:.1f} ms, max {lag['max']:.1f} ms")
+    print(f"results: {output}")
+
+
+if __name__ == "__main__":
+    main()
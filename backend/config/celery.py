@@ -17,3 +17,16 @@ app.autodiscover_tasks(
         # Additional modules can be added here
     ]
 )
+
+# Task latency / queue wait / retry instrumentation (signal receivers)
+import infrastructure.celery_metrics  # noqa: E402,F401
+
+# Sampled / on-demand task profiling (signal receivers)
+import infrastructure.profiling  # noqa: E402,F401
+
+# Per-task query counts / N+1 / slow queries (signal receivers). Imported
+# before tracing so its postrun receiver still sees the task span.
+import infrastructure.query_instrumentation  # noqa: E402,F401
+
+# Trace context propagation through task headers (signal receivers)
+import infrastructure.tracing  # noqa: E402,F401
@@ -0,0 +1,26 @@
+# config/gunicorn.conf.py
+"""
+Gunicorn hooks for Prometheus multiprocess metrics.
+
+Each worker writes samples to PROMETHEUS_MULTIPROC_DIR (mmap files); /metrics
+aggregates them. The directory is wiped when the master starts and files of
+dead workers are marked so their live gauges stop counting.
+"""
+import os
+import shutil
+
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus-multiproc")
+
+# Imported up front: child_exit runs in the SIGCHLD handler, where a first
+# import can re-enter itself when several workers exit at once (shutdown)
+from prometheus_client import multiprocess  # noqa: E402
+
+
+def on_starting(server):
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,172 @@
+# config/interfaces/http/authentication.py
+"""
+Bearer token authentication verified without the database.
+
+Tokens are Django-signed (HMAC-SHA256 with SECRET_KEY) and timestamped user
+ids. They are checked locally against their signature and
+API_TOKEN_MAX_AGE_SECONDS. The principal the views need is cached in
+process for API_PRINCIPAL_CACHE_TTL_SECONDS: the user id for the actor,
+and is_staff for PATCH/DELETE and status changes. The authenticated hot path
+therefore runs no auth queries, where SessionAuthentication needs a
+session and a user query on every request.
+
+The cache does not see account changes until it expires. Deactivating a
+user or revoking is_staff takes up to the TTL to reach every worker.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core import signing
+from rest_framework import exceptions
+from rest_framework.authentication import BaseAuthentication, get_authorization_header
+
+TOKEN_KEYWORD = b"Bearer"
+TOKEN_SALT = "payouts.api-token"
+
+
+@dataclass(frozen=True)
+class TokenUser:
+    """The parts of a user the API reads; shared between requests."""
+
+    id: int
+    username: str
+    is_staff: bool
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    @property
+    def pk(self) -> int:
+        return self.id
+
+    def __str__(self) -> str:
+        return self.username
+
+
+class PrincipalCache:
+    """Per-process TTL cache of user id -> TokenUser."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 10_000) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: dict[int, tuple[float, TokenUser]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> TokenUser | None:
+        entry = self._entries.get(user_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, user: TokenUser) -> None:
+        with self._lock:
+            if len(self._entries) >= self.max_entries:
+                self._entries.clear()
+            self._entries[user.id] = (time.monotonic() + self.ttl_seconds, user)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_principals: PrincipalCache | None = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    global _principals
+    if _principals is None:
+        _principals = PrincipalCache(settings.API_PRINCIPAL_CACHE_TTL_SECONDS)
+    return _principals
+
+
+def issue_token(user) -> str:
+    """Signed bearer token for ``user``, valid for API_TOKEN_MAX_AGE_SECONDS."""
+    return signing.dumps({"uid": user.pk}, salt=TOKEN_SALT)
+
+
+def load_principal(user_id: int) -> TokenUser | None:
+    cache = get_principal_cache()
+    principal = cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    row = (
+        get_user_model()
+        .objects.filter(pk=user_id, is_active=True)
+        .values_list("username", "is_staff")
+        .first()
+    )
+    if row is None:
+        return None
+    principal = TokenUser(id=user_id, username=row[0], is_staff=row[1])
+    cache.put(principal)
+    return principal
+
+
+def authenticate_token(request) -> TokenUser | None:
+    """
+    The principal of the request's ``Authorization: Bearer`` token, or None
+    when the request carries no bearer token. Works on Django and DRF
+    requests alike.
+
+    Raises AuthenticationFailed for a malformed, invalid or expired token,
+    or an inactive user.
+    """
+    auth = get_authorization_header(request).split()
+    if not auth or auth[0].lower() != TOKEN_KEYWORD.lower():
+        return None
+    if len(auth) != 2:
+        raise exceptions.AuthenticationFailed("Invalid token header.")
+
+    try:
+        payload = signing.loads(
+            auth[1].decode(),
+            salt=TOKEN_SALT,
+            max_age=settings.API_TOKEN_MAX_AGE_SECONDS,
+        )
+    except (signing.BadSignature, UnicodeDecodeError):
+        # SignatureExpired is a BadSignature
+        raise exceptions.AuthenticationFailed("Invalid or expired token.")
+
+    principal = load_principal(payload["uid"])
+    if principal is None:
+        raise exceptions.AuthenticationFailed("User inactive or deleted.")
+    return principal
+
+
+def request_principal(request):
+    """
+    The caller as the API sees it, for middleware running before DRF has
+    authenticated the request: the bearer token's user, else the session
+    user (possibly anonymous). An invalid token counts as no token; the
+    view rejects it.
+    """
+    try:
+        principal = authenticate_token(request)
+    except exceptions.AuthenticationFailed:
+        principal = None
+    if principal is not None:
+        return principal
+    return getattr(request, "user", None)
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    ``Authorization: Bearer <token>`` with a token from issue_token().
+
+    Requests without a bearer token fall through to the next authentication
+    class.
+    """
+
+    def authenticate(self, request):
+        principal = authenticate_token(request)
+        if principal is None:
+            return None
+        return principal, None
+
+    def authenticate_header(self, request) -> str:
+        return TOKEN_KEYWORD.decode()
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework.views import exception_handler
 
 from core.exceptions import (
+    DomainConflictError,
     DomainNotFoundError,
     DomainPermissionError,
     DomainValidationError,
@@ -42,6 +43,13 @@ def custom_exception_handler(exc, context):
             status=status.HTTP_403_FORBIDDEN,
         )
 
+    # Concurrent modification (lost compare-and-set) → 409
+    if isinstance(exc, DomainConflictError):
+        return Response(
+            {"detail": str(exc)},
+            status=status.HTTP_409_CONFLICT,
+        )
+
     # All other unhandled errors → 500
     return Response(
         {"detail": "Internal server error."},
@@ -1,12 +1,50 @@
 # config/interfaces/http/healthcheck.py
-import logging
-
-import redis
 from django.conf import settings
-from django.db import connection
 from django.http import JsonResponse
 
-logger = logging.getLogger(__name__)
+from infrastructure.health import HealthSnapshot, get_health_monitor
+
+
+def _checks_payload(snapshot: HealthSnapshot) -> dict:
+    return {
+        name: {
+            "ok": check.ok,
+            "latency_ms": check.latency_ms,
+            **({"error": check.error} if check.error else {}),
+        }
+        for name, check in snapshot.checks.items()
+    }
+
+
+def _is_ready(snapshot: HealthSnapshot) -> bool:
+    # A snapshot the background thread stopped refreshing proves nothing
+    return snapshot.ok and snapshot.age() < settings.HEALTHCHECK_STALE_AFTER_SECONDS
+
+
+def liveness(request):
+    """
+    Liveness probe: the process serves requests. Touches no dependencies,
+    so a slow database never gets the pod restarted.
+    """
+    return JsonResponse({"status": "alive"})
+
+
+def readiness(request):
+    """
+    Readiness probe served from the latest dependency snapshot.
+    Returns HTTP 200 (ready) or 503 (not ready) with per-dependency latency.
+    """
+    snapshot = get_health_monitor().snapshot()
+    ready = _is_ready(snapshot)
+
+    return JsonResponse(
+        {
+            "status": "ready" if ready else "not_ready",
+            "checked_at": snapshot.checked_at.isoformat(),
+            "checks": _checks_payload(snapshot),
+        },
+        status=200 if ready else 503,
+    )
 
 
 def healthcheck(request):
@@ -14,37 +52,19 @@ def healthcheck(request):
     Basic healthcheck endpoint verifying DB and Redis availability.
     Returns HTTP 200 (healthy) or 503 (degraded).
     """
+    snapshot = get_health_monitor().snapshot()
+    checks = snapshot.checks
 
-    db_ok = False
-    redis_ok = False
-
-    # Check database connectivity
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT 1;")
-            cursor.fetchone()
-        db_ok = True
-    except Exception:
-        logger.exception("Healthcheck: database check failed")
-
-    # Check Redis connectivity
-    try:
-        redis_client = redis.Redis.from_url(
-            getattr(settings, "CELERY_BROKER_URL", "redis://redis:6379/0")
-        )
-        redis_client.ping()
-        redis_ok = True
-    except Exception:
-        logger.exception("Healthcheck: redis check failed")
-
-    status = "healthy" if db_ok and redis_ok else "degraded"
-    http_status = 200 if status == "healthy" else 503
+    db_ok = checks["database"].ok
+    redis_ok = checks["cache"].ok and checks["broker"].ok
+    healthy = db_ok and redis_ok and _is_ready(snapshot)
 
     return JsonResponse(
         {
             "database": db_ok,
             "redis": redis_ok,
-            "status": status,
+            "status": "healthy" if healthy else "degraded",
+            "checks": _checks_payload(snapshot),
         },
-        status=http_status,
+        status=200 if healthy else 503,
     )
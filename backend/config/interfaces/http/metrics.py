@@ -0,0 +1,37 @@
+# config/interfaces/http/metrics.py
+import os
+
+from django.http import HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by view, method and status code.",
+    ["view", "method", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+
+def _registry():
+    """
+    Under gunicorn every worker writes its samples to PROMETHEUS_MULTIPROC_DIR;
+    the scrape aggregates all of them, whichever worker serves it.
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics(request):
+    """Prometheus scrape endpoint (text exposition format)."""
+    return HttpResponse(generate_latest(_registry()), content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,276 @@
+# config/interfaces/http/middleware.py
+import logging
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+from config.interfaces.http.authentication import request_principal
+from config.interfaces.http.metrics import HTTP_REQUEST_DURATION
+from core.tracing import parse_traceparent, tracer
+from infrastructure.db_router import pinned_to_primary, replica_reads
+from infrastructure.profiling import start_profile
+from infrastructure.query_instrumentation import instrument_queries, publish_query_stats
+from infrastructure.traffic_capture import capture_body, record_request, should_capture
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+PRIMARY_PIN_CACHE_KEY = "db:primary-pin:{client}"
+
+TRACE_ID_HEADER = "X-Trace-Id"
+
+PROFILE_REQUEST_HEADER = "HTTP_X_PROFILE"
+PROFILE_FILE_HEADER = "X-Profile-File"
+
+
+def _client_ip(request) -> str:
+    """
+    Behind CLIENT_IP_PROXY_COUNT trusted proxies, REMOTE_ADDR is the nearest
+    proxy; the client is the address the outermost trusted proxy appended to
+    X-Forwarded-For. Entries left of it are client-supplied and ignored.
+    """
+    proxies = settings.CLIENT_IP_PROXY_COUNT
+    if proxies:
+        forwarded = [
+            address.strip()
+            for address in request.META.get("HTTP_X_FORWARDED_FOR", "").split(",")
+            if address.strip()
+        ]
+        if len(forwarded) >= proxies:
+            return forwarded[-proxies]
+    return request.META.get("REMOTE_ADDR", "")
+
+
+def _client_key(request) -> str:
+    user = request_principal(request)
+    if user is not None and user.is_authenticated:
+        return f"user:{user.pk}"
+    return f"ip:{_client_ip(request)}"
+
+
+def _is_pinned(request) -> bool:
+    try:
+        return bool(
+            cache.get(PRIMARY_PIN_CACHE_KEY.format(client=_client_key(request)))
+        )
+    except Exception:
+        # Unknown pin state: the primary is always consistent
+        logger.warning("Primary pin lookup failed, reading from primary")
+        return True
+
+
+def _pin_to_primary(request) -> None:
+    try:
+        cache.set(
+            PRIMARY_PIN_CACHE_KEY.format(client=_client_key(request)),
+            1,
+            timeout=settings.DB_REPLICA_PIN_SECONDS,
+        )
+    except Exception:
+        logger.warning("Failed to pin client to primary after write")
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Read-your-writes routing:
+    - safe requests read from replicas (see PrimaryReplicaRouter)
+    - a successful unsafe request pins the client (token or session user,
+      else client IP, see _client_ip) to the primary for
+      DB_REPLICA_PIN_SECONDS, so it sees its own writes on the next GET;
+      pinned requests also skip cached list pages
+
+    Must run after AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        if request.method not in SAFE_METHODS:
+            response = self.get_response(request)
+            if response.status_code < 400:
+                _pin_to_primary(request)
+            return response
+
+        if _is_pinned(request):
+            with pinned_to_primary():
+                return self.get_response(request)
+
+        with replica_reads():
+            return self.get_response(request)
+
+
+def _view_label(request) -> str:
+    # Route names / patterns, never raw paths: ids would explode cardinality
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "<unresolved>"
+    return match.view_name or match.route
+
+
+class PrometheusMetricsMiddleware:
+    """
+    Records HTTP latency per view, method and status code.
+
+    Goes first in MIDDLEWARE so the measurement covers the whole stack.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        HTTP_REQUEST_DURATION.labels(
+            view=_view_label(request),
+            method=request.method,
+            status=str(response.status_code),
+        ).observe(time.perf_counter() - started)
+        return response
+
+
+class TracingMiddleware:
+    """
+    Runs each request in a server span, continuing the caller's trace when
+    the request carries a W3C ``traceparent`` header. The trace id is
+    returned in X-Trace-Id so a slow response can be looked up later.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not tracer.enabled:
+            return self.get_response(request)
+
+        with tracer.start_span(
+            f"HTTP {request.method}",
+            parent=parse_traceparent(request.META.get("HTTP_TRACEPARENT")),
+            kind="server",
+            attributes={"http.method": request.method, "http.target": request.path},
+        ) as span:
+            response = self.get_response(request)
+            view = _view_label(request)
+            span.name = f"HTTP {request.method} {view}"
+            span.set_attribute("http.route", view)
+            span.set_attribute("http.status_code", response.status_code)
+            if response.status_code >= 500:
+                span.status = "error"
+            if span.recording:
+                response[TRACE_ID_HEADER] = span.context.trace_id
+            return response
+
+
+def _is_staff(request) -> bool:
+    user = request_principal(request)
+    return bool(user is not None and user.is_authenticated and user.is_staff)
+
+
+def _shows_query_stats(request) -> bool:
+    return settings.DEBUG or _is_staff(request)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Counts queries and DB time per request and reports N+1 / slow queries
+    (see infrastructure.query_instrumentation).
+
+    Staff responses (and every response under DEBUG) carry the numbers:
+    X-DB-Queries, X-DB-Time-Ms, X-DB-Duplicate-Queries, X-DB-Slow-Queries,
+    X-DB-N-Plus-One (the most repeated shape) and a Server-Timing entry.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.QUERY_INSTRUMENTATION_ENABLED:
+            return self.get_response(request)
+
+        with instrument_queries() as stats:
+            response = self.get_response(request)
+        publish_query_stats(stats, scope="http", name=_view_label(request))
+
+        if _shows_query_stats(request):
+            time_ms = stats.duration * 1000
+            response["X-DB-Queries"] = str(stats.count)
+            response["X-DB-Time-Ms"] = f"{time_ms:.1f}"
+            response["X-DB-Duplicate-Queries"] = str(stats.duplicates)
+            response["X-DB-Slow-Queries"] = str(len(stats.slow))
+            repeated = stats.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD)
+            if repeated:
+                shape, shape_stats = repeated[0]
+                response["X-DB-N-Plus-One"] = f"{shape_stats.count}x {shape[:200]}"
+            response["Server-Timing"] = (
+                f'db;dur={time_ms:.1f};desc="{stats.count} queries"'
+            )
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Samples PROFILING_SAMPLE_RATE of requests with the stack sampler in
+    infrastructure.profiling; staff can force it with ``X-Profile: 1``
+    (the file name comes back in X-Profile-File). Celery tasks published by
+    a profiled request are profiled too.
+
+    Must run after AuthenticationMiddleware (the staff check needs the user).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        profile = start_profile(
+            "http",
+            sample_rate=settings.PROFILING_SAMPLE_RATE,
+            forced=(
+                request.META.get(PROFILE_REQUEST_HEADER) == "1" and _is_staff(request)
+            ),
+        )
+        if profile is None:
+            return self.get_response(request)
+
+        try:
+            response = self.get_response(request)
+        finally:
+            path = profile.finish(f"{request.method} {_view_label(request)}")
+        if path is not None and _is_staff(request):
+            response[PROFILE_FILE_HEADER] = path.name
+        return response
+
+
+class TrafficCaptureMiddleware:
+    """
+    Records anonymized metadata of API requests to rotating local files
+    (infrastructure.traffic_capture) for replay with benchmarks/replay.py.
+
+    Must run after AuthenticationMiddleware (captures whether the caller is
+    staff, so replays can authenticate the same requests).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not should_capture(request):
+            return self.get_response(request)
+
+        body = capture_body(request)
+        started = time.time()
+        started_perf = time.perf_counter()
+        response = self.get_response(request)
+        record_request(
+            request,
+            response,
+            body=body,
+            client=_client_key(request),
+            started=started,
+            duration=time.perf_counter() - started_perf,
+        )
+        return response
@@ -62,11 +62,17 @@ INSTALLED_APPS = DJANGO_APPS + THIRD_PARTY_APPS + LOCAL_APPS
 # ==============================
 
 MIDDLEWARE = [
+    "config.interfaces.http.middleware.PrometheusMetricsMiddleware",
+    "config.interfaces.http.middleware.TracingMiddleware",
+    "config.interfaces.http.middleware.QueryInstrumentationMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "config.interfaces.http.middleware.TrafficCaptureMiddleware",
+    "config.interfaces.http.middleware.ProfilingMiddleware",
+    "config.interfaces.http.middleware.ReplicaRoutingMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -98,6 +104,36 @@ DATABASES = {
     }
 }
 
+# Read replicas (comma-separated hosts, same credentials as the primary).
+# Safe requests read from them via PrimaryReplicaRouter; writes always go to
+# the primary.
+DATABASE_REPLICAS: list[str] = []
+for _index, _host in enumerate(
+    filter(None, os.getenv("POSTGRES_REPLICA_HOSTS", "").split(","))
+):
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{_index}")
+
+DATABASE_ROUTERS = ["infrastructure.db_router.PrimaryReplicaRouter"]
+
+# After a successful write, the client reads from the primary for this long
+DB_REPLICA_PIN_SECONDS = int(os.getenv("DB_REPLICA_PIN_SECONDS", "5"))
+
+# Trusted proxies (load balancer, ingress) in front of the app. With N > 0 the
+# anonymous client pinned after a write is identified by the N-th address from
+# the right of X-Forwarded-For instead of REMOTE_ADDR, which would be the proxy
+# and pin every anonymous client at once.
+CLIENT_IP_PROXY_COUNT = int(os.getenv("CLIENT_IP_PROXY_COUNT", "0"))
+
+# Replicas lagging more than this are skipped; lag is re-checked per process
+# at most every DB_REPLICA_LAG_CHECK_INTERVAL seconds
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "2"))
+DB_REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("DB_REPLICA_LAG_CHECK_INTERVAL", "1"))
+
 
 # ==============================
 # I18N / TIMEZONE
@@ -178,20 +214,38 @@ REST_FRAMEWORK = {
         "rest_framework.parsers.JSONParser",
     ],
     "EXCEPTION_HANDLER": "config.interfaces.http.exceptions.custom_exception_handler",
+    # Session first keeps 403 (not 401) for anonymous requests; without a
+    # session cookie it costs no query, so token requests stay query-free
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
+        "config.interfaces.http.authentication.SignedTokenAuthentication",
     ],
+    # All limits in one Redis call per request (infrastructure/throttling.py)
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "infrastructure.throttling.GCRAThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "100/day",
         "user": "1000/day",
+        # Per endpoint (view.throttle_scopes), per user or IP
+        "payouts_create": os.getenv("THROTTLE_RATE_PAYOUTS_CREATE", "30/min"),
+        "payouts_list": os.getenv("THROTTLE_RATE_PAYOUTS_LIST", "300/min"),
     },
 }
 
 
+# ==============================
+# API TOKENS
+# ==============================
+
+# Bearer tokens (config/interfaces/http/authentication.py) are signed with
+# SECRET_KEY and verified without the database
+API_TOKEN_MAX_AGE_SECONDS = int(os.getenv("API_TOKEN_MAX_AGE_SECONDS", "86400"))
+# How long each worker caches a token user's is_staff / is_active; account
+# changes take up to this long to apply to token requests
+API_PRINCIPAL_CACHE_TTL_SECONDS = float(
+    os.getenv("API_PRINCIPAL_CACHE_TTL_SECONDS", "60")
+)
 # ==============================
 # CELERY
 # ==============================
@@ -216,12 +270,49 @@ CELERY_ACCEPT_CONTENT = ["json"]
 CELERY_TASK_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 
+# Task instrumentation (infrastructure.celery_metrics): broker queue depth
+# sampling interval and the worker's Prometheus exporter port (0 disables it)
+CELERY_QUEUE_DEPTH_INTERVAL = float(os.getenv("CELERY_QUEUE_DEPTH_INTERVAL", "15"))
+CELERY_METRICS_PORT = int(os.getenv("CELERY_METRICS_PORT", "9808"))
+
 
 # ==============================
 # DATABASE CONNECTION LIFETIME
 # ==============================
 
-DATABASES["default"]["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+for _database in DATABASES.values():
+    _database["CONN_MAX_AGE"] = int(os.getenv("DB_CONN_MAX_AGE", "60"))
+
+
+# ==============================
+# DATABASE CONNECTION POOL
+# ==============================
+
+# In-process pool (infrastructure.db_pool): Django returns the connection to the
+# pool after each request / task, so threads of a process share a bounded set of
+# warm connections and idle processes release theirs.
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "0") == "1"
+
+DB_POOL_OPTIONS = {
+    # Upper bound of connections per process and alias
+    "max_size": int(os.getenv("DB_POOL_MAX_SIZE", "4")),
+    # Idle connections kept warm when traffic drops
+    "min_idle": int(os.getenv("DB_POOL_MIN_IDLE", "1")),
+    # Recycle connections after this many seconds (10% jitter)
+    "max_lifetime": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+    # Close idle connections above min_idle after this many seconds
+    "max_idle_time": float(os.getenv("DB_POOL_MAX_IDLE_TIME", "300")),
+    # Checkout wait before failing with OperationalError
+    "timeout": float(os.getenv("DB_POOL_TIMEOUT", "5")),
+    # Validate (SELECT 1) connections idle longer than this on checkout
+    "check_after": float(os.getenv("DB_POOL_CHECK_AFTER", "30")),
+}
+
+if DB_POOL_ENABLED:
+    for _database in DATABASES.values():
+        _database["ENGINE"] = "infrastructure.db_pool"
+        _database["CONN_MAX_AGE"] = 0
+        _database["POOL"] = DB_POOL_OPTIONS
 
 
 # ==============================
@@ -236,6 +327,141 @@ CACHES = {
 }
 
 
+# ==============================
+# REDIS (coordination: locks and other short-lived shared state)
+# ==============================
+
+REDIS_URL = os.getenv("REDIS_URL", "redis://redis:6379/0")
+
+# Keep coordination calls fast-failing; callers fail open on Redis errors
+REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.5"))
+
+
+# ==============================
+# HEALTHCHECK
+# ==============================
+
+# Dependency probes (database, cache, broker) run concurrently in a background
+# thread; /health/ and /health/ready/ serve the latest snapshot
+HEALTHCHECK_BACKGROUND = os.getenv("HEALTHCHECK_BACKGROUND", "1") == "1"
+HEALTHCHECK_INTERVAL_SECONDS = float(os.getenv("HEALTHCHECK_INTERVAL_SECONDS", "5"))
+# Per-probe time budget; a slower dependency is reported as failed
+HEALTHCHECK_TIMEOUT_SECONDS = float(os.getenv("HEALTHCHECK_TIMEOUT_SECONDS", "1"))
+# Older snapshots (stuck refresh thread) make the instance not ready
+HEALTHCHECK_STALE_AFTER_SECONDS = float(
+    os.getenv("HEALTHCHECK_STALE_AFTER_SECONDS", "15")
+)
+
+# ==============================
+# TRACING
+# ==============================
+
+# Request → event bus → Celery task spans (core.tracing), propagated with W3C
+# traceparent headers. Spans are appended as JSON lines to TRACING_EXPORT_PATH;
+# point web and worker at the same file to see whole traces.
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "0") == "1"
+TRACING_EXPORT_PATH = os.getenv("TRACING_EXPORT_PATH", "/tmp/payouts-spans.jsonl")
+# Share of new traces recorded; incoming traceparent flags take precedence
+TRACING_SAMPLE_RATE = float(os.getenv("TRACING_SAMPLE_RATE", "1.0"))
+
+# ==============================
+# QUERY INSTRUMENTATION
+# ==============================
+
+# Query count / DB time per request and Celery task, N+1 and slow query
+# reports (infrastructure.query_instrumentation). Staff users get the numbers
+# in X-DB-* / Server-Timing response headers.
+QUERY_INSTRUMENTATION_ENABLED = os.getenv("QUERY_INSTRUMENTATION_ENABLED", "1") == "1"
+# One query shape repeated this many times in a request / task is an N+1
+QUERY_N_PLUS_ONE_THRESHOLD = int(os.getenv("QUERY_N_PLUS_ONE_THRESHOLD", "5"))
+QUERY_SLOW_MS = float(os.getenv("QUERY_SLOW_MS", "200"))
+# Log an EXPLAIN plan for slow queries. Each plan is another round trip on the
+# request's connection, so it is off by default and on in dev/test. Plain
+# read-only SELECTs are re-run with ANALYZE, BUFFERS; everything else is only
+# planned.
+QUERY_EXPLAIN_SLOW = os.getenv("QUERY_EXPLAIN_SLOW", "0") == "1"
+
+# ==============================
+# PROFILING
+# ==============================
+
+# Sampling profiler (infrastructure.profiling): fraction of requests / tasks
+# profiled (staff can force a request with the X-Profile: 1 header), stack
+# sampling interval, and where folded-stack files are written
+PROFILING_SAMPLE_RATE = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+PROFILING_TASK_SAMPLE_RATE = float(os.getenv("PROFILING_TASK_SAMPLE_RATE", "0"))
+PROFILING_INTERVAL_MS = float(os.getenv("PROFILING_INTERVAL_MS", "5"))
+PROFILING_OUTPUT_DIR = os.getenv("PROFILING_OUTPUT_DIR", "/tmp/payouts-profiles")
+
+# ==============================
+# TRAFFIC CAPTURE
+# ==============================
+
+# Anonymized request log for benchmarks/replay.py (infrastructure.traffic_capture).
+# One rotating JSON-lines file per process under TRAFFIC_CAPTURE_DIR; only
+# paths under TRAFFIC_CAPTURE_PATH_PREFIXES are recorded. String values are
+# pseudonymized unless their field is listed in TRAFFIC_CAPTURE_PLAIN_FIELDS.
+TRAFFIC_CAPTURE_ENABLED = os.getenv("TRAFFIC_CAPTURE_ENABLED", "0") == "1"
+TRAFFIC_CAPTURE_SAMPLE_RATE = float(os.getenv("TRAFFIC_CAPTURE_SAMPLE_RATE", "1"))
+TRAFFIC_CAPTURE_DIR = os.getenv("TRAFFIC_CAPTURE_DIR", "/tmp/payouts-traffic")
+TRAFFIC_CAPTURE_MAX_BYTES = int(
+    os.getenv("TRAFFIC_CAPTURE_MAX_BYTES", str(50 * 1024 * 1024))
+)
+TRAFFIC_CAPTURE_BACKUP_COUNT = int(os.getenv("TRAFFIC_CAPTURE_BACKUP_COUNT", "10"))
+TRAFFIC_CAPTURE_PATH_PREFIXES = ("/api/",)
+TRAFFIC_CAPTURE_PLAIN_FIELDS = frozenset(
+    {
+        "amount",
+        "currency",
+        "status",
+        "created_from",
+        "created_to",
+        "cursor",
+        "since",
+        "until",
+    }
+)
+
+# ==============================
+# PAYOUT PROCESSING
+# ==============================
+
+# Per-payout lease lock suppressing duplicate concurrent task deliveries
+PAYOUT_TASK_LOCK_ENABLED = os.getenv("PAYOUT_TASK_LOCK_ENABLED", "1") == "1"
+PAYOUT_TASK_LOCK_TTL_MS = int(os.getenv("PAYOUT_TASK_LOCK_TTL_MS", "10000"))
+
+# Concurrent creates with one idempotency key wait for the first one's result
+# (infrastructure/payouts/inflight.py): lease held by the running request,
+# how long duplicates wait for it, how long its result stays readable
+PAYOUT_INFLIGHT_COALESCING_ENABLED = (
+    os.getenv("PAYOUT_INFLIGHT_COALESCING_ENABLED", "1") == "1"
+)
+PAYOUT_INFLIGHT_LEASE_MS = int(os.getenv("PAYOUT_INFLIGHT_LEASE_MS", "5000"))
+PAYOUT_INFLIGHT_WAIT_MS = int(os.getenv("PAYOUT_INFLIGHT_WAIT_MS", "5000"))
+PAYOUT_INFLIGHT_RESULT_TTL_MS = int(os.getenv("PAYOUT_INFLIGHT_RESULT_TTL_MS", "2000"))
+
+# Simulated payout provider round-trip; benchmarks/pipeline.py varies it
+PAYOUT_PROVIDER_LATENCY_SECONDS = float(
+    os.getenv("PAYOUT_PROVIDER_LATENCY_SECONDS", "1")
+)
+
+# payouts_payout monthly partitions kept ready ahead of the current month
+PAYOUT_PARTITIONS_MONTHS_AHEAD = int(os.getenv("PAYOUT_PARTITIONS_MONTHS_AHEAD", "3"))
+
+# Terminal payouts older than this are moved to payouts_payout_archive
+PAYOUT_ARCHIVE_AFTER_DAYS = int(os.getenv("PAYOUT_ARCHIVE_AFTER_DAYS", "90"))
+PAYOUT_ARCHIVE_BATCH_SIZE = int(os.getenv("PAYOUT_ARCHIVE_BATCH_SIZE", "10000"))
+
+# Idempotency keys are honoured for at least this long, then expired by
+# manage.py expire_idempotency_keys
+PAYOUT_IDEMPOTENCY_KEY_RETENTION_DAYS = int(
+    os.getenv("PAYOUT_IDEMPOTENCY_KEY_RETENTION_DAYS", "30")
+)
+PAYOUT_IDEMPOTENCY_KEY_EXPIRY_BATCH_SIZE = int(
+    os.getenv("PAYOUT_IDEMPOTENCY_KEY_EXPIRY_BATCH_SIZE", "10000")
+)
+
+
 # ==============================
 # LOGGING
 # ==============================
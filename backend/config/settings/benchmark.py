@@ -0,0 +1,22 @@
+"""
+benchmark.py
+
+Settings for the load benchmarks (benchmarks/http_api.py).
+Production-like request path (DEBUG off) against local Postgres and Redis,
+with API throttling disabled so the load generator is not rate-limited.
+"""
+
+from .base import *  # noqa: F403
+
+DEBUG = False
+
+ALLOWED_HOSTS = ["*"]
+
+# Throttling would turn most benchmark requests into 429s
+REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []  # noqa: F405
+
+# Per-request INFO logs cost more than some of the endpoints measured
+LOG_LEVEL = "WARNING"
+for _logger in LOGGING["loggers"].values():  # noqa: F405
+    _logger["level"] = LOG_LEVEL
+LOGGING["root"]["level"] = LOG_LEVEL  # noqa: F405
@@ -5,6 +5,8 @@ Development settings.
 Overrides base.py with development-specific configuration.
 """
 
+import os
+
 from .base import *  # noqa
 
 # Enable debug mode in development
@@ -12,3 +14,6 @@ DEBUG = True
 
 # Allow all hosts during development
 ALLOWED_HOSTS = ["*"]
+
+# EXPLAIN plans for slow queries (off by default in base.py)
+QUERY_EXPLAIN_SLOW = os.getenv("QUERY_EXPLAIN_SLOW", "1") == "1"
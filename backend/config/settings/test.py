@@ -23,6 +23,30 @@ CACHES = {
     }
 }
 
+# Replica alias pointing at the test database (separate connection);
+# routing is off unless a test overrides DATABASE_REPLICAS
+DATABASES["replica"] = {  # noqa: F405
+    **DATABASES["default"],  # noqa: F405
+    "TEST": {"MIRROR": "default"},
+}
+DATABASE_REPLICAS = []
+
+# Probe inline on every request: no background thread holding DB connections
+HEALTHCHECK_BACKGROUND = False
+HEALTHCHECK_INTERVAL_SECONDS = 0
+
+# Slow query EXPLAIN plans are off by default in base.py
+QUERY_EXPLAIN_SLOW = True
+
+# Tracing tests install their own in-memory exporter
+TRACING_ENABLED = False
+
+# Payout task lock needs Redis; lock tests enable it explicitly
+PAYOUT_TASK_LOCK_ENABLED = False
+
+# In-flight create coalescing needs Redis; its tests use a client double
+PAYOUT_INFLIGHT_COALESCING_ENABLED = False
+
 # Disable throttling in tests
 REST_FRAMEWORK["DEFAULT_THROTTLE_CLASSES"] = []  # noqa: F405
 
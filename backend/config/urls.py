@@ -1,10 +1,14 @@
 from django.contrib import admin
 from django.urls import include, path
 
-from config.interfaces.http.healthcheck import healthcheck
+from config.interfaces.http.healthcheck import healthcheck, liveness, readiness
+from config.interfaces.http.metrics import metrics
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/payouts/", include("payouts.api.urls")),
     path("health/", healthcheck, name="healthcheck"),
+    path("health/live/", liveness, name="healthcheck-live"),
+    path("health/ready/", readiness, name="healthcheck-ready"),
+    path("metrics", metrics, name="metrics"),
 ]
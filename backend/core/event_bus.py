@@ -1,12 +1,16 @@
 # core/event_bus.py
 from collections import defaultdict
+from dataclasses import fields, is_dataclass
 from typing import Any, Callable, Dict, List, Type
 
+from core.tracing import tracer
+
 
 class EventBus:
     """
     Simple synchronous event bus.
-    Handlers are invoked immediately when an event is published.
+    Handlers are invoked immediately when an event is published, each in its
+    own span of the publisher's trace.
     """
 
     def __init__(self) -> None:
@@ -19,7 +23,28 @@ class EventBus:
     def publish(self, event: Any) -> None:
         """Invoke all handlers subscribed to the event's type."""
         for handler in self._handlers.get(type(event), []):
-            handler(event)
+            if not tracer.enabled:
+                handler(event)
+                continue
+            with tracer.start_span(
+                f"event {type(event).__name__}",
+                attributes=_event_attributes(event, handler),
+            ):
+                handler(event)
+
+
+def _event_attributes(event: Any, handler: Callable) -> Dict[str, Any]:
+    attributes: Dict[str, Any] = {
+        "event.handler": getattr(handler, "__qualname__", repr(handler))
+    }
+    if not is_dataclass(event):
+        return attributes
+    for event_field in fields(event):
+        value = getattr(event, event_field.name)
+        # Scalars only: batch events carry id tuples of any length
+        if isinstance(value, (str, int, float, bool)):
+            attributes[f"event.{event_field.name}"] = value
+    return attributes
 
 
 # Global event bus instance
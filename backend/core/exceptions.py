@@ -15,3 +15,7 @@ class DomainNotFoundError(DomainError):
 
 class DomainPermissionError(DomainError):
     """Operation not permitted (HTTP 403)."""
+
+
+class DomainConflictError(DomainError):
+    """Concurrent modification detected (HTTP 409)."""
@@ -0,0 +1,255 @@
+# core/tracing.py
+"""
+Minimal tracer with W3C Trace Context propagation.
+
+Spans nest through a contextvar, so everything running in the same context
+(request → use case → on_commit → event bus handlers) joins one trace without
+passing anything around. Process hops (HTTP, Celery messages) carry the
+``traceparent`` header.
+
+Finished spans of sampled traces go to the configured exporter. While the
+tracer is disabled, spans are shared no-op objects.
+"""
+import random
+import re
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, Optional, Protocol
+
+TRACEPARENT_HEADER = "traceparent"
+
+_TRACEPARENT_RE = re.compile(
+    r"^([0-9a-f]{2})-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})(-.*)?$"
+)
+_INVALID_TRACE_ID = "0" * 32
+_INVALID_SPAN_ID = "0" * 16
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+def parse_traceparent(value: Optional[str]) -> Optional[SpanContext]:
+    """SpanContext from a W3C ``traceparent`` value, or None if invalid."""
+    if not value:
+        return None
+    match = _TRACEPARENT_RE.match(value.strip())
+    if match is None:
+        return None
+    version, trace_id, span_id, flags, rest = match.groups()
+    # Version 00 has exactly four fields; ff is forbidden
+    if version == "ff" or (version == "00" and rest):
+        return None
+    if trace_id == _INVALID_TRACE_ID or span_id == _INVALID_SPAN_ID:
+        return None
+    return SpanContext(trace_id, span_id, sampled=bool(int(flags, 16) & 0x01))
+
+
+@dataclass
+class Span:
+    name: str
+    context: SpanContext
+    parent_id: Optional[str]
+    kind: str = "internal"
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    start_time: float = field(default_factory=time.time)
+    duration: Optional[float] = None
+    status: str = "ok"
+    error: Optional[str] = None
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    @property
+    def recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(exc).__name__}: {exc}"
+
+    def to_dict(self) -> dict:
+        return {
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_ms": (
+                None if self.duration is None else round(self.duration * 1000, 3)
+            ),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Returned while tracing is disabled; accepts and drops everything."""
+
+    name = ""
+    context = None
+    recording = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_error(self, exc: BaseException) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None: ...
+
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to the exporter.
+
+    A span without an explicit parent continues the current span's trace;
+    a new root trace is sampled with probability ``sample_rate``. Remote
+    parents keep their own sampling decision.
+    """
+
+    def __init__(self) -> None:
+        self.exporter: Optional[SpanExporter] = None
+        self.sample_rate = 1.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def configure(
+        self,
+        exporter: Optional[SpanExporter],
+        *,
+        sample_rate: float = 1.0,
+    ) -> None:
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    def current_span(self):
+        return _current_span.get() or NOOP_SPAN
+
+    def begin(
+        self,
+        name: str,
+        *,
+        parent: Optional[SpanContext] = None,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        """Start a span without making it current (see ``attach``)."""
+        if not self.enabled:
+            return NOOP_SPAN
+
+        if parent is None:
+            current = _current_span.get()
+            parent = current.context if current is not None else None
+
+        if parent is None:
+            context = SpanContext(
+                trace_id=f"{random.getrandbits(128):032x}",
+                span_id=_new_span_id(),
+                sampled=random.random() < self.sample_rate,
+            )
+        else:
+            context = SpanContext(parent.trace_id, _new_span_id(), parent.sampled)
+
+        return Span(
+            name=name,
+            context=context,
+            parent_id=parent.span_id if parent is not None else None,
+            kind=kind,
+            attributes=dict(attributes or {}),
+        )
+
+    def finish(self, span) -> None:
+        if not span.recording or span.duration is not None:
+            return
+        span.duration = time.perf_counter() - span._started
+        if span.context.sampled and self.exporter is not None:
+            self.exporter.export(span)
+
+    @staticmethod
+    def attach(span) -> Optional[Token]:
+        """Make ``span`` current; pass the token to ``detach`` afterwards."""
+        if not span.recording:
+            return None
+        return _current_span.set(span)
+
+    @staticmethod
+    def detach(token: Optional[Token]) -> None:
+        if token is not None:
+            _current_span.reset(token)
+
+    @contextmanager
+    def start_span(
+        self,
+        name: str,
+        *,
+        parent: Optional[SpanContext] = None,
+        kind: str = "internal",
+        attributes: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Span around a block, current while the block runs."""
+        span = self.begin(name, parent=parent, kind=kind, attributes=attributes)
+        token = self.attach(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_error(exc)
+            raise
+        finally:
+            self.detach(token)
+            self.finish(span)
+
+    def inject(self, headers: Dict[str, Any], span=None) -> None:
+        """Write ``traceparent`` for ``span`` (default: current) into headers."""
+        span = span or _current_span.get()
+        if span is not None and span.recording:
+            headers[TRACEPARENT_HEADER] = span.context.to_traceparent()
+
+
+def _new_span_id() -> str:
+    span_id = random.getrandbits(64)
+    return f"{span_id or 1:016x}"
+
+
+def traced(name: Optional[str] = None, *, kind: str = "internal") -> Callable:
+    """Decorator: run the function inside a span (default name: qualname)."""
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.start_span(span_name, kind=kind):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+# Global tracer instance
+tracer = Tracer()
@@ -0,0 +1,253 @@
+# infrastructure/celery_metrics.py
+"""
+Celery task instrumentation.
+
+- publisher side: every task message gets an ``enqueued_at`` header
+- worker side: queue wait, execution time, retries and final outcome per task
+- worker main process: broker queue depth sampled periodically, and an
+  optional Prometheus exporter (CELERY_METRICS_PORT)
+
+Receivers are connected on import (see config/celery.py).
+"""
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+from celery import signals
+from django.conf import settings
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+    start_http_server,
+)
+
+from infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+
+_LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300)
+
+TASK_QUEUE_WAIT = Histogram(
+    "celery_task_queue_wait_seconds",
+    "Time between publishing (or ETA) and a worker starting the task.",
+    ["task"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+TASK_RUNTIME = Histogram(
+    "celery_task_runtime_seconds",
+    "Task execution time in the worker.",
+    ["task"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+TASK_RETRIES = Counter(
+    "celery_task_retries_total",
+    "Task retries scheduled.",
+    ["task"],
+)
+
+TASK_OUTCOMES = Counter(
+    "celery_task_outcomes_total",
+    "Finished task executions by outcome (success / failure / ...).",
+    ["task", "outcome"],
+)
+
+QUEUE_DEPTH = Gauge(
+    "celery_queue_depth",
+    "Messages waiting in the broker queue (sampled).",
+    ["queue"],
+    multiprocess_mode="max",
+)
+
+# task_id -> perf_counter() at prerun (per worker process)
+_started: dict[str, float] = {}
+
+
+def request_header(request, name):
+    # Worker requests expose custom headers as attributes; eager ones only
+    # through request.headers
+    value = getattr(request, name, None)
+    if value is None:
+        value = (getattr(request, "headers", None) or {}).get(name)
+    return value
+
+
+def _eta_timestamp(eta) -> float | None:
+    if not eta:
+        return None
+    if isinstance(eta, datetime):
+        return eta.timestamp()
+    try:
+        return datetime.fromisoformat(eta).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+
+@signals.before_task_publish.connect
+def _stamp_enqueued_at(sender=None, headers=None, **kwargs):
+    if headers is not None:
+        headers[ENQUEUED_AT_HEADER] = time.time()
+
+
+@signals.task_prerun.connect
+def _on_task_prerun(sender=None, task_id=None, task=None, **kwargs):
+    _started[task_id] = time.perf_counter()
+
+    enqueued_at = request_header(task.request, ENQUEUED_AT_HEADER)
+    if enqueued_at is None:
+        return
+    # Scheduled messages (countdown / retry backoff) only start waiting at ETA
+    ready_at = max(float(enqueued_at), _eta_timestamp(task.request.eta) or 0)
+    TASK_QUEUE_WAIT.labels(task=task.name).observe(max(time.time() - ready_at, 0))
+
+
+@signals.task_postrun.connect
+def _on_task_postrun(sender=None, task_id=None, task=None, state=None, **kwargs):
+    started = _started.pop(task_id, None)
+    if started is not None:
+        TASK_RUNTIME.labels(task=task.name).observe(time.perf_counter() - started)
+    # RETRY is not final: counted by _on_task_retry, outcome comes later
+    if state and state != "RETRY":
+        TASK_OUTCOMES.labels(task=task.name, outcome=state.lower()).inc()
+
+
+@signals.task_retry.connect
+def _on_task_retry(sender=None, **kwargs):
+    TASK_RETRIES.labels(task=sender.name).inc()
+
+
+# ----- worker main process -----
+
+
+def sample_queue_depths(queues) -> dict[str, int | None]:
+    """LLEN of each queue on the Redis broker; None if it cannot be read."""
+    client = get_redis_client(settings.CELERY_BROKER_URL)
+    depths: dict[str, int | None] = {}
+    for queue in queues:
+        try:
+            depths[queue] = client.llen(queue)
+        except Exception:
+            logger.warning("Queue depth sampling failed for %s", queue)
+            depths[queue] = None
+            continue
+        QUEUE_DEPTH.labels(queue=queue).set(depths[queue])
+    return depths
+
+
+def _sample_forever(queues, interval: float) -> None:
+    while True:
+        sample_queue_depths(queues)
+        time.sleep(interval)
+
+
+def metrics_registry():
+    """Aggregated registry when running with PROMETHEUS_MULTIPROC_DIR."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+@signals.worker_ready.connect
+def _on_worker_ready(sender=None, **kwargs):
+    queues = sorted(sender.app.amqp.queues.keys())
+    threading.Thread(
+        target=_sample_forever,
+        args=(queues, settings.CELERY_QUEUE_DEPTH_INTERVAL),
+        name="celery-queue-depth",
+        daemon=True,
+    ).start()
+
+    if settings.CELERY_METRICS_PORT:
+        start_http_server(settings.CELERY_METRICS_PORT, registry=metrics_registry())
+        logger.info(
+            "Celery metrics exporter listening on :%s", settings.CELERY_METRICS_PORT
+        )
+
+
+@signals.worker_process_shutdown.connect
+def _on_worker_process_shutdown(pid=None, **kwargs):
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+# ----- reporting -----
+
+
+def _histogram_quantile(quantile: float, buckets: list[tuple[float, float]]):
+    """Prometheus-style quantile estimate from cumulative (le, count) buckets."""
+    if not buckets or buckets[-1][1] == 0:
+        return None
+    rank = quantile * buckets[-1][1]
+    previous_le, previous_count = 0.0, 0.0
+    for le, count in buckets:
+        if count >= rank:
+            if le == float("inf"):
+                return previous_le
+            if count == previous_count:
+                return le
+            return previous_le + (le - previous_le) * (rank - previous_count) / (
+                count - previous_count
+            )
+        previous_le, previous_count = le, count
+    return previous_le
+
+
+def summarize_task_metrics(registry=None) -> dict[str, dict]:
+    """
+    Per-task summary of the collected samples: counts, mean / p95 queue wait
+    and runtime, retries and outcomes.
+    """
+    registry = registry or metrics_registry()
+    summary: dict[str, dict] = {}
+    buckets: dict[tuple[str, str], list[tuple[float, float]]] = {}
+
+    def entry(task: str) -> dict:
+        return summary.setdefault(
+            task,
+            {"queue_wait": {}, "runtime": {}, "retries": 0, "outcomes": {}},
+        )
+
+    histograms = {
+        "celery_task_queue_wait_seconds": "queue_wait",
+        "celery_task_runtime_seconds": "runtime",
+    }
+    for metric in registry.collect():
+        for sample in metric.samples:
+            task = sample.labels.get("task")
+            if task is None:
+                continue
+            if metric.name in histograms:
+                kind = histograms[metric.name]
+                if sample.name.endswith("_bucket"):
+                    buckets.setdefault((task, kind), []).append(
+                        (float(sample.labels["le"]), sample.value)
+                    )
+                elif sample.name.endswith("_count"):
+                    entry(task)[kind]["count"] = int(sample.value)
+                elif sample.name.endswith("_sum"):
+                    entry(task)[kind]["sum"] = sample.value
+            elif sample.name == "celery_task_retries_total":
+                entry(task)["retries"] += int(sample.value)
+            elif sample.name == "celery_task_outcomes_total":
+                outcome = sample.labels["outcome"]
+                outcomes = entry(task)["outcomes"]
+                outcomes[outcome] = outcomes.get(outcome, 0) + int(sample.value)
+
+    for (task, kind), task_buckets in buckets.items():
+        stats = entry(task)[kind]
+        count = stats.get("count", 0)
+        stats["mean"] = stats.pop("sum", 0.0) / count if count else None
+        stats["p95"] = _histogram_quantile(0.95, sorted(task_buckets))
+
+    return summary
@@ -0,0 +1,6 @@
+# infrastructure/db_pool/__init__.py
+"""
+PostgreSQL database backend with an in-process connection pool.
+
+Use it as ``ENGINE = "infrastructure.db_pool"``; see DB_POOL_* settings.
+"""
@@ -0,0 +1,48 @@
+# infrastructure/db_pool/base.py
+from django.db.backends.postgresql import base as postgresql
+from django.db.backends.postgresql.psycopg_any import IsolationLevel
+
+from .creation import DatabaseCreation
+from .pool import PooledConnection, get_pool
+
+
+class DatabaseWrapper(postgresql.DatabaseWrapper):
+    """
+    PostgreSQL backend that checks connections out of a per-process pool.
+
+    Django "closes" a connection at the end of every request / Celery task
+    (CONN_MAX_AGE = 0); here that returns it to the pool instead, so threads
+    share a bounded set of warm connections. Pool options come from the
+    database's "POOL" settings key.
+    """
+
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pooled: PooledConnection | None = None
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.settings_dict.get("POOL"))
+
+    def get_new_connection(self, conn_params):
+        self._pooled = self.pool.getconn(
+            lambda: super(DatabaseWrapper, self).get_new_connection(conn_params)
+        )
+        # The parent sets isolation_level while connecting; a reused connection
+        # already carries the configured level.
+        self.isolation_level = IsolationLevel(
+            self.settings_dict["OPTIONS"].get(
+                "isolation_level", IsolationLevel.READ_COMMITTED
+            )
+        )
+        return self._pooled.connection
+
+    def _close(self):
+        if self.connection is None or self._pooled is None:
+            return super()._close()
+
+        pooled, self._pooled = self._pooled, None
+        with self.wrap_database_errors:
+            self.pool.putconn(pooled)
@@ -0,0 +1,14 @@
+# infrastructure/db_pool/creation.py
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgresDatabaseCreation,
+)
+
+from .pool import close_all_pools
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    def _destroy_test_db(self, test_database_name, verbosity):
+        # Idle pooled connections (of any alias, e.g. test mirrors) would
+        # block DROP DATABASE
+        close_all_pools()
+        super()._destroy_test_db(test_database_name, verbosity)
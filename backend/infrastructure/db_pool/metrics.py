@@ -0,0 +1,48 @@
+# infrastructure/db_pool/metrics.py
+from prometheus_client import Counter, Gauge, Histogram
+
+POOL_CONNECTIONS = Gauge(
+    "db_pool_connections",
+    "Open pooled database connections by state.",
+    ["alias", "state"],
+    multiprocess_mode="livesum",
+)
+
+POOL_MAX_SIZE = Gauge(
+    "db_pool_max_size",
+    "Configured maximum pool size (summed over live processes).",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+
+POOL_WAITING = Gauge(
+    "db_pool_waiting",
+    "Threads currently waiting for a pooled connection.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+
+POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting to check a connection out of the pool.",
+    ["alias"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5),
+)
+
+POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that failed because the pool stayed exhausted.",
+    ["alias"],
+)
+
+POOL_CONNECTIONS_OPENED = Counter(
+    "db_pool_connections_opened_total",
+    "Database connections opened by the pool.",
+    ["alias"],
+)
+
+POOL_CONNECTIONS_CLOSED = Counter(
+    "db_pool_connections_closed_total",
+    "Database connections closed by the pool, by reason.",
+    ["alias", "reason"],
+)
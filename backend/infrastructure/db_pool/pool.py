@@ -0,0 +1,342 @@
+# infrastructure/db_pool/pool.py
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+import psycopg2
+from psycopg2 import extensions
+
+from .metrics import (
+    POOL_CHECKOUT_TIMEOUTS,
+    POOL_CHECKOUT_WAIT,
+    POOL_CONNECTIONS,
+    POOL_CONNECTIONS_CLOSED,
+    POOL_CONNECTIONS_OPENED,
+    POOL_MAX_SIZE,
+    POOL_WAITING,
+)
+
+logger = logging.getLogger(__name__)
+
+# Spread max_lifetime expirations so connections opened together
+# (e.g. right after a deploy) are not all recycled at the same moment
+_LIFETIME_JITTER = 0.1
+
+
+class PoolTimeout(psycopg2.OperationalError):
+    """No connection became available within the checkout timeout."""
+
+
+@dataclass(frozen=True)
+class PoolSettings:
+    max_size: int = 4
+    min_idle: int = 1
+    max_lifetime: float = 1800.0
+    max_idle_time: float = 300.0
+    timeout: float = 5.0
+    check_after: float = 30.0
+
+    @classmethod
+    def from_dict(cls, options: dict[str, Any] | None) -> "PoolSettings":
+        settings = cls(**(options or {}))
+        if settings.max_size < 1:
+            raise ValueError("max_size must be >= 1")
+        if not 0 <= settings.min_idle <= settings.max_size:
+            raise ValueError("min_idle must be between 0 and max_size")
+        return settings
+
+
+@dataclass
+class PooledConnection:
+    connection: Any
+    expires_at: float
+    last_used: float = field(default_factory=time.monotonic)
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections for one database alias.
+
+    - checkout reuses the most recently returned connection (LIFO keeps the
+      working set small so surplus connections age out)
+    - connections idle longer than ``check_after`` are validated with SELECT 1
+      before being handed out
+    - connections are recycled after ``max_lifetime`` (with jitter) and closed
+      after ``max_idle_time`` idle, down to ``min_idle``
+    """
+
+    def __init__(self, alias: str, settings: PoolSettings) -> None:
+        self.alias = alias
+        self.settings = settings
+        self._idle: deque[PooledConnection] = deque()
+        self._in_use = 0
+        self._opening = 0
+        self._waiting = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        POOL_MAX_SIZE.labels(alias=alias).set(settings.max_size)
+        self._reaper = threading.Thread(
+            target=self._reap_forever,
+            name=f"db-pool-reaper-{alias}",
+            daemon=True,
+        )
+        self._reaper.start()
+
+    # ----- public API -----
+
+    def getconn(self, connect: Callable[[], Any]) -> PooledConnection:
+        """
+        Check a connection out, opening one with ``connect`` if the pool has
+        room. Raises PoolTimeout if the pool stays exhausted for ``timeout``.
+        """
+        started = time.monotonic()
+        deadline = started + self.settings.timeout
+
+        while True:
+            expired: list[PooledConnection] = []
+            try:
+                entry = self._take_idle_or_reserve(deadline, expired)
+            finally:
+                for stale in expired:
+                    self._close(stale, reason="max_lifetime")
+
+            if entry is None:
+                entry = self._open(connect)
+            elif not self._healthy(entry):
+                self._discard(entry, reason="health_check")
+                continue
+
+            POOL_CHECKOUT_WAIT.labels(alias=self.alias).observe(
+                time.monotonic() - started
+            )
+            return entry
+
+    def putconn(self, entry: PooledConnection) -> None:
+        """Return a connection; broken, expired or dirty ones are closed."""
+        reason = self._reset(entry)
+
+        with self._cond:
+            self._in_use -= 1
+            if reason is None and not self._closed:
+                entry.last_used = time.monotonic()
+                self._idle.append(entry)
+            self._cond.notify()
+            self._publish_sizes()
+
+        if reason is not None:
+            self._close(entry, reason=reason)
+
+    def close_idle(self) -> None:
+        """Close every idle connection (e.g. on shutdown)."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._publish_sizes()
+        for entry in idle:
+            self._close(entry, reason="shutdown")
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                "idle": len(self._idle),
+                "in_use": self._in_use,
+                "waiting": self._waiting,
+                "max_size": self.settings.max_size,
+            }
+
+    # ----- checkout internals -----
+
+    def _take_idle_or_reserve(
+        self,
+        deadline: float,
+        expired: list[PooledConnection],
+    ) -> PooledConnection | None:
+        """
+        Returns an idle connection, or None after reserving a slot for a new
+        one. Waits while the pool is exhausted. Idle connections found past
+        their lifetime are moved to ``expired`` for the caller to close.
+        """
+        with self._cond:
+            while True:
+                while self._idle:
+                    entry = self._idle.pop()
+                    if entry.expires_at <= time.monotonic():
+                        expired.append(entry)
+                        continue
+                    self._in_use += 1
+                    self._publish_sizes()
+                    return entry
+
+                if self._in_use + self._opening < self.settings.max_size:
+                    self._opening += 1
+                    return None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    POOL_CHECKOUT_TIMEOUTS.labels(alias=self.alias).inc()
+                    raise PoolTimeout(
+                        f"Connection pool '{self.alias}' exhausted "
+                        f"({self.settings.max_size} connections in use)"
+                    )
+                self._waiting += 1
+                POOL_WAITING.labels(alias=self.alias).set(self._waiting)
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiting -= 1
+                    POOL_WAITING.labels(alias=self.alias).set(self._waiting)
+
+    def _open(self, connect: Callable[[], Any]) -> PooledConnection:
+        try:
+            connection = connect()
+        except BaseException:
+            with self._cond:
+                self._opening -= 1
+                self._cond.notify()
+            raise
+
+        POOL_CONNECTIONS_OPENED.labels(alias=self.alias).inc()
+        lifetime = self.settings.max_lifetime
+        lifetime *= 1 - random.uniform(0, _LIFETIME_JITTER)
+        entry = PooledConnection(
+            connection=connection,
+            expires_at=time.monotonic() + lifetime,
+        )
+        with self._cond:
+            self._opening -= 1
+            self._in_use += 1
+            self._publish_sizes()
+        return entry
+
+    def _healthy(self, entry: PooledConnection) -> bool:
+        if entry.connection.closed:
+            return False
+        if time.monotonic() - entry.last_used < self.settings.check_after:
+            return True
+        try:
+            with entry.connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            if not entry.connection.autocommit:
+                entry.connection.rollback()
+        except psycopg2.Error:
+            return False
+        return True
+
+    # ----- return internals -----
+
+    @staticmethod
+    def _reset(entry: PooledConnection) -> str | None:
+        """Bring a returned connection back to an idle state, or say why not."""
+        connection = entry.connection
+        if connection.closed:
+            return "broken"
+        if entry.expires_at <= time.monotonic():
+            return "max_lifetime"
+
+        status = connection.info.transaction_status
+        if status == extensions.TRANSACTION_STATUS_IDLE:
+            return None
+        if status in (
+            extensions.TRANSACTION_STATUS_INTRANS,
+            extensions.TRANSACTION_STATUS_INERROR,
+        ):
+            try:
+                connection.rollback()
+                return None
+            except psycopg2.Error:
+                return "broken"
+        # ACTIVE / UNKNOWN: the session state cannot be trusted
+        return "broken"
+
+    def _discard(self, entry: PooledConnection, *, reason: str) -> None:
+        with self._cond:
+            self._in_use -= 1
+            self._cond.notify()
+            self._publish_sizes()
+        self._close(entry, reason=reason)
+
+    def _close(self, entry: PooledConnection, *, reason: str) -> None:
+        POOL_CONNECTIONS_CLOSED.labels(alias=self.alias, reason=reason).inc()
+        try:
+            entry.connection.close()
+        except psycopg2.Error:
+            pass
+
+    # ----- background trimming -----
+
+    def _reap_forever(self) -> None:
+        interval = max(min(self.settings.max_idle_time, self.settings.check_after), 1)
+        while not self._closed:
+            time.sleep(interval / 2)
+            try:
+                self.reap()
+            except Exception:
+                logger.exception("Connection pool '%s' reaper failed", self.alias)
+
+    def reap(self) -> None:
+        """Close idle connections beyond ``min_idle`` or past their lifetime."""
+        now = time.monotonic()
+        expired: list[tuple[PooledConnection, str]] = []
+        with self._cond:
+            keep: deque[PooledConnection] = deque()
+            # Oldest-used first: those are the surplus connections
+            for entry in self._idle:
+                if entry.expires_at <= now:
+                    expired.append((entry, "max_lifetime"))
+                elif (
+                    now - entry.last_used >= self.settings.max_idle_time
+                    and len(self._idle) - len(expired) > self.settings.min_idle
+                ):
+                    expired.append((entry, "max_idle_time"))
+                else:
+                    keep.append(entry)
+            self._idle = keep
+            self._publish_sizes()
+
+        for entry, reason in expired:
+            self._close(entry, reason=reason)
+
+    def _publish_sizes(self) -> None:
+        POOL_CONNECTIONS.labels(alias=self.alias, state="idle").set(len(self._idle))
+        POOL_CONNECTIONS.labels(alias=self.alias, state="in_use").set(self._in_use)
+
+
+_pools: dict[str, ConnectionPool] = {}
+_pools_pid = os.getpid()
+_pools_lock = threading.Lock()
+
+
+def get_pool(alias: str, options: dict[str, Any] | None) -> ConnectionPool:
+    """
+    Returns the pool for ``alias`` in the current process.
+
+    Pools are per process: after a fork (gunicorn / Celery prefork) the
+    inherited pools are dropped without closing their sockets, which still
+    belong to the parent.
+    """
+    global _pools_pid
+
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+
+        pool = _pools.get(alias)
+        if pool is None:
+            pool = ConnectionPool(alias, PoolSettings.from_dict(options))
+            _pools[alias] = pool
+        return pool
+
+
+def close_all_pools() -> None:
+    """Close idle connections of every pool in this process."""
+    with _pools_lock:
+        pools = list(_pools.values())
+    for pool in pools:
+        pool.close_idle()
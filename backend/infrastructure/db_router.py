@@ -0,0 +1,116 @@
+# infrastructure/db_router.py
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# Set for the duration of a read-only request that may be served from replicas
+_replica_reads_enabled: ContextVar[bool] = ContextVar(
+    "replica_reads_enabled", default=False
+)
+
+# Set while serving a client pinned to the primary after a write
+_primary_pinned: ContextVar[bool] = ContextVar("primary_pinned", default=False)
+
+# alias -> (checked_at monotonic, fresh)
+_freshness: dict[str, tuple[float, bool]] = {}
+
+# A replica that has replayed everything it received is not lagging, even if
+# its last replayed transaction is old (idle primary).
+_REPLICATION_LAG_SQL = """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+"""
+
+
+@contextmanager
+def replica_reads():
+    """Route ORM reads inside the block to a fresh replica, if one is configured."""
+    token = _replica_reads_enabled.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads_enabled.reset(token)
+
+
+@contextmanager
+def pinned_to_primary():
+    """
+    Mark the block as serving a client that just wrote. Caches filled from a
+    lagging replica may predate that write, so callers skip reading them.
+    """
+    token = _primary_pinned.set(True)
+    try:
+        yield
+    finally:
+        _primary_pinned.reset(token)
+
+
+def is_pinned_to_primary() -> bool:
+    return _primary_pinned.get()
+
+
+def replica_is_fresh(alias: str) -> bool:
+    """
+    Returns False if the replica lags more than DB_REPLICA_MAX_LAG_SECONDS or is
+    unreachable. The result is cached per process for
+    DB_REPLICA_LAG_CHECK_INTERVAL seconds.
+    """
+    now = time.monotonic()
+    cached = _freshness.get(alias)
+    if cached is not None and now - cached[0] < settings.DB_REPLICA_LAG_CHECK_INTERVAL:
+        return cached[1]
+
+    try:
+        with connections[alias].cursor() as cursor:
+            cursor.execute(_REPLICATION_LAG_SQL)
+            lag = float(cursor.fetchone()[0])
+        fresh = lag <= settings.DB_REPLICA_MAX_LAG_SECONDS
+        if not fresh:
+            logger.warning("Replica %s lags %.1fs, reading from primary", alias, lag)
+    except DatabaseError:
+        logger.warning("Replica %s unavailable, reading from primary", alias)
+        fresh = False
+
+    _freshness[alias] = (now, fresh)
+    return fresh
+
+
+class PrimaryReplicaRouter:
+    """
+    Sends reads to a replica only inside ``replica_reads()`` (enabled per request
+    by ReplicaRoutingMiddleware); everything else uses the primary.
+    """
+
+    def db_for_read(self, model, **hints):
+        if not _replica_reads_enabled.get():
+            return DEFAULT_DB_ALIAS
+
+        replicas = [
+            alias for alias in settings.DATABASE_REPLICAS if replica_is_fresh(alias)
+        ]
+        if not replicas:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        # Explicit alias: instances loaded from a replica must not be saved there
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
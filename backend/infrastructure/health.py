@@ -0,0 +1,218 @@
+# infrastructure/health.py
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+
+from infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+HEALTHCHECK_CACHE_KEY = "health:probe"
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    ok: bool
+    latency_ms: float | None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class HealthSnapshot:
+    checks: dict[str, CheckResult]
+    checked_at: datetime
+    taken_at: float  # time.monotonic()
+
+    @property
+    def ok(self) -> bool:
+        return all(check.ok for check in self.checks.values())
+
+    def age(self) -> float:
+        return time.monotonic() - self.taken_at
+
+
+def check_database() -> None:
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+    finally:
+        if settings.HEALTHCHECK_BACKGROUND:
+            # Long-lived probe thread: keep the connection (or hand it back to
+            # the pool) instead of reconnecting on every probe
+            connection.close_if_unusable_or_obsolete()
+        else:
+            connection.close()
+
+
+def check_cache() -> None:
+    # A miss still round-trips to the cache backend
+    cache.get(HEALTHCHECK_CACHE_KEY)
+
+
+def check_broker() -> None:
+    get_redis_client(settings.CELERY_BROKER_URL).ping()
+
+
+PROBES: dict[str, Callable[[], None]] = {
+    "database": check_database,
+    "cache": check_cache,
+    "broker": check_broker,
+}
+
+
+class HealthMonitor:
+    """
+    Runs dependency probes concurrently, each bounded by ``timeout``, and keeps
+    the latest result as a snapshot.
+
+    With ``background=True`` a daemon thread refreshes the snapshot every
+    ``interval`` seconds and requests only read it; otherwise a request
+    refreshes it inline once it is older than ``interval``.
+    """
+
+    def __init__(
+        self,
+        probes: dict[str, Callable[[], None]] | None = None,
+        *,
+        background: bool | None = None,
+        interval: float | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        self.probes = probes if probes is not None else PROBES
+        self.background = (
+            settings.HEALTHCHECK_BACKGROUND if background is None else background
+        )
+        self.interval = (
+            settings.HEALTHCHECK_INTERVAL_SECONDS if interval is None else interval
+        )
+        self.timeout = (
+            settings.HEALTHCHECK_TIMEOUT_SECONDS if timeout is None else timeout
+        )
+
+        # One thread per probe: the database probe always runs on the same
+        # thread and so reuses one connection. A hung probe only delays (and
+        # times out) its own later rounds.
+        self._executors = {
+            name: ThreadPoolExecutor(
+                max_workers=1,
+                thread_name_prefix=f"health-probe-{name}",
+            )
+            for name in self.probes
+        }
+        self._snapshot: HealthSnapshot | None = None
+        self._refresh_lock = threading.Lock()
+        self._first_snapshot = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+
+    def snapshot(self) -> HealthSnapshot:
+        if self.background:
+            self._ensure_thread()
+            self._first_snapshot.wait(self.timeout + 1)
+
+        snapshot = self._snapshot
+        if snapshot is None:
+            return self.refresh()
+        if not self.background and snapshot.age() >= self.interval:
+            # Concurrent requests reuse the current snapshot instead of piling
+            # up probes while one refresh is running
+            if self._refresh_lock.acquire(blocking=False):
+                try:
+                    return self._refresh_locked()
+                finally:
+                    self._refresh_lock.release()
+        return snapshot
+
+    def refresh(self) -> HealthSnapshot:
+        with self._refresh_lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> HealthSnapshot:
+        futures = {
+            name: self._executors[name].submit(self._timed, name, probe)
+            for name, probe in self.probes.items()
+        }
+        deadline = time.monotonic() + self.timeout
+
+        checks = {}
+        for name, future in futures.items():
+            try:
+                checks[name] = future.result(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except FutureTimeoutError:
+                logger.warning("Healthcheck: %s probe timed out", name)
+                checks[name] = CheckResult(ok=False, latency_ms=None, error="timeout")
+
+        snapshot = HealthSnapshot(
+            checks=checks,
+            checked_at=datetime.now(timezone.utc),
+            taken_at=time.monotonic(),
+        )
+        self._snapshot = snapshot
+        self._first_snapshot.set()
+        return snapshot
+
+    @staticmethod
+    def _timed(name: str, probe: Callable[[], None]) -> CheckResult:
+        started = time.perf_counter()
+        try:
+            probe()
+        except Exception as exc:
+            logger.warning("Healthcheck: %s probe failed: %r", name, exc)
+            return CheckResult(
+                ok=False,
+                latency_ms=round((time.perf_counter() - started) * 1000, 2),
+                error=type(exc).__name__,
+            )
+        return CheckResult(
+            ok=True,
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    def _ensure_thread(self) -> None:
+        if self._thread is not None:
+            return
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run_forever,
+                    name="health-monitor",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _run_forever(self) -> None:
+        while True:
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception("Healthcheck: background refresh failed")
+            time.sleep(self.interval)
+
+
+_monitor: HealthMonitor | None = None
+_monitor_pid: int | None = None
+_monitor_lock = threading.Lock()
+
+
+def get_health_monitor() -> HealthMonitor:
+    """Per-process monitor (threads do not survive a gunicorn fork)."""
+    global _monitor, _monitor_pid
+
+    with _monitor_lock:
+        if _monitor is None or _monitor_pid != os.getpid():
+            _monitor = HealthMonitor()
+            _monitor_pid = os.getpid()
+        return _monitor
@@ -0,0 +1,94 @@
+# infrastructure/payouts/archive.py
+import logging
+from datetime import datetime
+
+from django.db import connection, transaction
+
+from payouts.models import Payout
+
+logger = logging.getLogger(__name__)
+
+PAYOUT_ARCHIVE_TABLE = "payouts_payout_archive"
+
+ARCHIVED_STATUSES = (Payout.Status.COMPLETED, Payout.Status.FAILED)
+
+_COLUMNS = (
+    "id",
+    "recipient_id",
+    "idempotency_key",
+    "amount",
+    "currency",
+    "status",
+    "recipient_name_snapshot",
+    "account_number_snapshot",
+    "bank_code_snapshot",
+    "created_at",
+    "updated_at",
+)
+
+_COLUMN_LIST = ", ".join(_COLUMNS)
+
+# One statement per batch: the rows leave the hot table and land in the archive
+# atomically. SKIP LOCKED keeps the job from waiting on rows a request is
+# currently touching; they are picked up by the next run.
+_ARCHIVE_BATCH_SQL = f"""
+    WITH batch AS (
+        SELECT id, created_at
+        FROM payouts_payout
+        WHERE status IN %s AND created_at < %s
+        ORDER BY created_at
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    ), moved AS (
+        DELETE FROM payouts_payout p
+        USING batch
+        WHERE p.id = batch.id AND p.created_at = batch.created_at
+        RETURNING {", ".join(f"p.{column}" for column in _COLUMNS)}
+    )
+    INSERT INTO {PAYOUT_ARCHIVE_TABLE} ({_COLUMN_LIST}, archived_at)
+    SELECT {_COLUMN_LIST}, now() FROM moved
+"""
+
+
+def _archive_batch(*, cutoff: datetime, batch_size: int) -> int:
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            _ARCHIVE_BATCH_SQL,
+            [tuple(str(status) for status in ARCHIVED_STATUSES), cutoff, batch_size],
+        )
+        return cursor.rowcount
+
+
+def archive_terminal_payouts(
+    *,
+    cutoff: datetime,
+    batch_size: int,
+    max_batches: int | None = None,
+) -> int:
+    """
+    Move COMPLETED / FAILED payouts created before ``cutoff`` into the archive.
+
+    Each batch commits on its own, so the job can be interrupted and resumed.
+    Idempotency keys stay registered in payouts_payout_idempotency_key, which
+    keeps archived keys deduplicated. Returns the number of archived payouts.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        moved = _archive_batch(cutoff=cutoff, batch_size=batch_size)
+        total += moved
+        batches += 1
+        if moved < batch_size:
+            break
+
+    if total:
+        logger.info(
+            "Archived %s terminal payouts created before %s in %s batch(es)",
+            total,
+            cutoff.isoformat(),
+            batches,
+        )
+    return total
@@ -5,27 +5,51 @@ from urllib.parse import urlencode
 from django.core.cache import cache
 from rest_framework.response import Response
 
+from core.tracing import tracer
+from infrastructure.db_router import is_pinned_to_primary
+
+from .metrics import CACHE_OPERATIONS, LIST_PAGE_CACHE
+
 logger = logging.getLogger(__name__)
 
 PAYOUTS_LIST_CACHE_VERSION_KEY = "payouts:list:version"
 PAYOUTS_LIST_PAGE_TTL = 60  # seconds
 
+_MISSING = object()
+
 
 def safe_cache_get(key, default=None):
     """Fail-safe wrapper around cache.get()."""
-    try:
-        return cache.get(key, default)
-    except Exception:
-        logger.warning("Cache get failed for key=%s", key, exc_info=True)
-        return default
+    with tracer.start_span(
+        "cache.get", kind="client", attributes={"cache.key": key}
+    ) as span:
+        try:
+            value = cache.get(key, _MISSING)
+        except Exception:
+            CACHE_OPERATIONS.labels(operation="get", result="error").inc()
+            span.set_attribute("cache.result", "error")
+            logger.warning("Cache get failed for key=%s", key, exc_info=True)
+            return default
+
+        result = "miss" if value is _MISSING else "hit"
+        CACHE_OPERATIONS.labels(operation="get", result=result).inc()
+        span.set_attribute("cache.result", result)
+        return default if value is _MISSING else value
 
 
 def safe_cache_set(key, value, timeout=None):
     """Fail-safe wrapper around cache.set()."""
-    try:
-        cache.set(key, value, timeout=timeout)
-    except Exception:
-        logger.warning("Cache set failed for key=%s", key, exc_info=True)
+    with tracer.start_span(
+        "cache.set", kind="client", attributes={"cache.key": key}
+    ) as span:
+        try:
+            cache.set(key, value, timeout=timeout)
+        except Exception:
+            CACHE_OPERATIONS.labels(operation="set", result="error").inc()
+            span.set_attribute("cache.result", "error")
+            logger.warning("Cache set failed for key=%s", key, exc_info=True)
+            return
+        CACHE_OPERATIONS.labels(operation="set", result="ok").inc()
 
 
 def _get_payouts_list_cache_version() -> int:
@@ -45,8 +69,15 @@ def bump_payouts_list_cache_version() -> None:
     Invalidate cached payout list pages by incrementing the global version.
     """
     try:
-        cache.incr(PAYOUTS_LIST_CACHE_VERSION_KEY)
+        with tracer.start_span(
+            "cache.incr",
+            kind="client",
+            attributes={"cache.key": PAYOUTS_LIST_CACHE_VERSION_KEY},
+        ):
+            cache.incr(PAYOUTS_LIST_CACHE_VERSION_KEY)
+        CACHE_OPERATIONS.labels(operation="incr", result="ok").inc()
     except Exception:
+        CACHE_OPERATIONS.labels(operation="incr", result="error").inc()
         logger.warning(
             "Cache incr failed for key=%s, resetting to 2",
             PAYOUTS_LIST_CACHE_VERSION_KEY,
@@ -79,13 +110,20 @@ def get_paginated_payouts_response_with_cache(
     """
     Returns a paginated DRF Response object.
     Uses cache for storing fully rendered paginated JSON payloads.
+
+    A client pinned to the primary after a write skips the cached page: a
+    replica request may have cached a page that predates the write under the
+    already bumped version. Its fresh page replaces that entry.
     """
     cache_key = _build_payouts_page_cache_key(request)
 
-    cached_data = safe_cache_get(cache_key)
+    cached_data = None if is_pinned_to_primary() else safe_cache_get(cache_key)
     if cached_data is not None:
+        LIST_PAGE_CACHE.labels(result="hit").inc()
         return Response(cached_data)
 
+    LIST_PAGE_CACHE.labels(result="miss").inc()
+
     # Query database when no cached page is found
     page = paginator.paginate_queryset(base_queryset, request)
     serializer = serializer_class(page, many=True)
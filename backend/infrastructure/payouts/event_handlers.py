@@ -1,6 +1,6 @@
 # infrastructure/payouts/event_handlers.py
 from core.event_bus import event_bus
-from payouts.events import PayoutCreated
+from payouts.events import PayoutCreated, PayoutStatusesChanged
 
 from .tasks import process_payout_task, rebuild_payouts_cache_task
 
@@ -15,5 +15,14 @@ def handle_payout_created(event: PayoutCreated) -> None:
     process_payout_task.delay(event.payout_id)
 
 
-# Register event handler on module import
+def handle_payout_statuses_changed(event: PayoutStatusesChanged) -> None:
+    """
+    Handles a batch status change:
+    - invalidates payouts list cache once for the whole batch
+    """
+    rebuild_payouts_cache_task.delay()
+
+
+# Register event handlers on module import
 event_bus.subscribe(PayoutCreated, handle_payout_created)
+event_bus.subscribe(PayoutStatusesChanged, handle_payout_statuses_changed)
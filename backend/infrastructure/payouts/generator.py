@@ -0,0 +1,490 @@
+# infrastructure/payouts/generator.py
+"""
+Synthetic payout data at production-like volume (manage.py generate_payouts).
+
+Recipients are generated in Python from a seeded RNG and loaded with COPY.
+Payouts and their idempotency registry rows are generated by PostgreSQL
+(INSERT ... SELECT over generate_series, random() seeded per batch with
+setseed()), so payout rows never cross the wire. A given (seed, until,
+sizes, batch size) always yields the same dataset on the same PostgreSQL
+major version. Distributions:
+
+- recipients: Zipf-like popularity (a few hot recipients get most payouts),
+  ~20% businesses, mostly UA with some PL / US / DE, ~3% inactive
+- created_at: spread over ``years`` before ``until``, denser towards the end
+  (growing business)
+- status: payouts younger than a day are still in flight (NEW / PROCESSING),
+  older ones are settled (mostly COMPLETED)
+- currency: UAH-heavy mix; amounts log-normal (many small, long tail)
+
+Status history rows are not generated.
+"""
+import io
+import logging
+import random
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from itertools import accumulate
+from typing import Callable
+
+from django.db import connection, transaction
+
+from .partitions import ensure_payout_partitions
+
+logger = logging.getLogger(__name__)
+
+_RECIPIENT_COLUMNS = (
+    "id",
+    "type",
+    "name",
+    "account_number",
+    "bank_code",
+    "country",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+
+_PAYOUT_COLUMNS = (
+    "id",
+    "recipient_id",
+    "idempotency_key",
+    "amount",
+    "currency",
+    "status",
+    "recipient_name_snapshot",
+    "account_number_snapshot",
+    "bank_code_snapshot",
+    "created_at",
+    "updated_at",
+)
+
+_KEY_COLUMNS = ("key_hash", "payout_id", "payout_created_at", "created_at")
+
+_FIRST_NAMES = (
+    "Olena", "Andrii", "Iryna", "Dmytro", "Kateryna", "Oleksandr", "Maria",
+    "Taras", "Sofiia", "Yurii", "Anna", "Petro",
+)  # fmt: skip
+_LAST_NAMES = (
+    "Shevchenko", "Kovalenko", "Bondarenko", "Tkachenko", "Kravchenko",
+    "Melnyk", "Boyko", "Kovalchuk", "Oliinyk", "Lysenko", "Moroz", "Savchenko",
+)  # fmt: skip
+_COMPANY_SUFFIXES = ("LLC", "TOV", "Group", "Trade", "Logistics", "Studio")
+
+# (value, cumulative share)
+_COUNTRIES = (("UA", 0.70), ("PL", 0.85), ("US", 0.95), ("DE", 1.0))
+_CURRENCIES = (("UAH", 0.60), ("USD", 0.85), ("EUR", 1.0))
+_RECENT_STATUSES = (
+    ("NEW", 0.30),
+    ("PROCESSING", 0.60),
+    ("COMPLETED", 0.95),
+    ("FAILED", 1.0),
+)
+_SETTLED_STATUSES = (("COMPLETED", 0.93), ("FAILED", 1.0))
+
+# Payouts younger than this may still be NEW / PROCESSING
+IN_FLIGHT_SECONDS = 24 * 3600
+
+# maintenance_work_mem for the index rebuild after a deferred load
+INDEX_BUILD_MEMORY = "256MB"
+
+
+@dataclass(frozen=True)
+class GeneratedDataset:
+    recipients: int
+    payouts: int
+    first_recipient_id: int
+    key_prefix: str
+
+
+def payout_key_prefix(seed: int) -> str:
+    """Idempotency key prefix of the payouts generated with ``seed``."""
+    return f"gen{seed}-"
+
+
+def _pick(table, roll: float) -> str:
+    for value, share in table:
+        if roll < share:
+            return value
+    return table[-1][0]
+
+
+def _timestamp(seconds: float) -> str:
+    return datetime.fromtimestamp(seconds, timezone.utc).isoformat()
+
+
+def _copy(cursor, table: str, columns, rows) -> None:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(row))
+        buffer.write("\n")
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN",
+        buffer,
+    )
+
+
+def _reserve_ids(cursor, table: str, count: int) -> int:
+    """
+    Reserve ``count`` consecutive ids from the table's sequence and return
+    the first one. Concurrent writers wait for the calling transaction.
+    """
+    cursor.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+    cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", [table])
+    sequence = cursor.fetchone()[0]
+    cursor.execute("SELECT nextval(%s)", [sequence])
+    first = cursor.fetchone()[0]
+    cursor.execute("SELECT setval(%s, %s)", [sequence, first + count - 1])
+    return first
+
+
+# Tables whose indexes and constraints generate_payouts() rebuilds after the
+# load instead of maintaining them row by row. The payout primary key stays:
+# ids are reserved in ascending order, so it is only ever appended to.
+_DEFERRED_TABLES = ("payouts_payout", "payouts_payout_idempotency_key")
+_KEPT_CONSTRAINTS = ("payouts_payout_pkey",)
+
+_DEFERRED_OBJECTS_SQL = """
+    SELECT 'constraint', conname, conrelid::regclass::text,
+           pg_get_constraintdef(oid), contype = 'f'
+    FROM pg_constraint
+    WHERE conrelid = ANY(%(tables)s::regclass[])
+      AND contype IN ('p', 'u', 'f')
+      AND NOT conname = ANY(%(kept)s)
+    UNION ALL
+    SELECT 'index', i.relname, x.indrelid::regclass::text,
+           pg_get_indexdef(x.indexrelid), false
+    FROM pg_index AS x
+    JOIN pg_class AS i ON i.oid = x.indexrelid
+    WHERE x.indrelid = ANY(%(tables)s::regclass[])
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conindid = x.indexrelid)
+"""
+
+
+def _drop_deferred_objects(cursor) -> list[str]:
+    """
+    Drop the secondary indexes and constraints of _DEFERRED_TABLES and return
+    the statements re-creating them (keys and indexes first, foreign keys
+    last). Dropping and re-creating in one transaction leaves the schema
+    unchanged whatever happens in between.
+    """
+    cursor.execute(
+        _DEFERRED_OBJECTS_SQL,
+        {"tables": list(_DEFERRED_TABLES), "kept": list(_KEPT_CONSTRAINTS)},
+    )
+    restore = []
+    # Foreign keys last, so they are re-created after the keys they use
+    for kind, name, table, definition, _ in sorted(
+        cursor.fetchall(), key=lambda row: row[4]
+    ):
+        if kind == "constraint":
+            cursor.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{name}"')
+            restore.append(f'ALTER TABLE {table} ADD CONSTRAINT "{name}" {definition}')
+        else:
+            cursor.execute(f'DROP INDEX "{name}"')
+            # Indexes on the partitioned parent are listed as ON ONLY; built
+            # on the parent they cascade to every partition again
+            restore.append(definition.replace(" ON ONLY ", " ON ", 1))
+    return restore
+
+
+def recipient_rows(rng: random.Random, count: int, created_at: str):
+    """Recipient rows (without id) in _RECIPIENT_COLUMNS order."""
+    rows = []
+    for _ in range(count):
+        last_name = rng.choice(_LAST_NAMES)
+        if rng.random() < 0.2:
+            kind = "BUSINESS"
+            name = f"{last_name} {rng.choice(_COMPANY_SUFFIXES)}"
+        else:
+            kind = "INDIVIDUAL"
+            name = f"{rng.choice(_FIRST_NAMES)} {last_name}"
+        country = _pick(_COUNTRIES, rng.random())
+        rows.append(
+            (
+                kind,
+                name,
+                f"{country}{rng.randrange(10**27):027d}",
+                f"{rng.randrange(10**6):06d}",
+                country,
+                "f" if rng.random() < 0.03 else "t",
+                created_at,
+                created_at,
+            )
+        )
+    return rows
+
+
+def _pick_sql(table, roll: str) -> str:
+    """SQL twin of _pick(): CASE over a cumulative share table."""
+    branches = " ".join(
+        f"WHEN {roll} < {share} THEN '{value}'" for value, share in table[:-1]
+    )
+    return f"CASE {branches} ELSE '{table[-1][0]}' END"
+
+
+# One batch of payouts in _PAYOUT_COLUMNS order, oldest first. draws is
+# materialized, so random() runs once per column per row in generate_series
+# order: the batch depends only on its setseed() value.
+_PAYOUT_ROWS_SQL = f"""
+    WITH draws AS MATERIALIZED (
+        SELECT
+            n,
+            random() AS r_age,
+            random() AS r_recipient,
+            random() AS r_status,
+            random() AS r_amount_1,
+            random() AS r_amount_2,
+            random() AS r_currency,
+            random() AS r_settle
+        FROM generate_series(%(first_index)s::bigint, %(last_index)s::bigint) AS n
+    ),
+    aged AS (
+        -- Squared uniform: more payouts towards until
+        SELECT *, %(span)s * r_age * r_age AS age FROM draws
+    ),
+    picked AS (
+        SELECT
+            n,
+            age,
+            %(first_recipient_id)s
+                + width_bucket(r_recipient * %(total_weight)s, %(cum_weights)s)
+                AS recipient_id,
+            CASE
+                WHEN age < {IN_FLIGHT_SECONDS}
+                THEN {_pick_sql(_RECENT_STATUSES, "r_status")}
+                ELSE {_pick_sql(_SETTLED_STATUSES, "r_status")}
+            END AS status,
+            -- Log-normal(4.5, 1.2) via Box-Muller
+            round(least(greatest(exp(
+                4.5 + 1.2 * sqrt(-2 * ln(1 - r_amount_1)) * cos(2 * pi() * r_amount_2)
+            ), 1.0), 999999.99)::numeric, 2) AS amount,
+            {_pick_sql(_CURRENCIES, "r_currency")} AS currency,
+            r_settle
+        FROM aged
+    )
+    SELECT
+        %(first_id)s + row_number() OVER (ORDER BY p.age DESC, p.n) - 1,
+        p.recipient_id,
+        %(key_prefix)s || lpad(p.n::text, 12, '0'),
+        p.amount,
+        p.currency,
+        p.status,
+        r.name,
+        r.account_number,
+        r.bank_code,
+        to_timestamp(%(until)s - p.age),
+        to_timestamp(
+            least(
+                %(until)s - p.age
+                    + CASE WHEN p.status <> 'NEW' THEN 1 + 119 * p.r_settle ELSE 0 END,
+                %(until)s
+            )
+        )
+    FROM picked AS p
+    JOIN payouts_recipient AS r ON r.id = p.recipient_id
+    ORDER BY p.age DESC, p.n
+"""
+
+# Payouts and their key registry rows in one statement; the key hash is
+# idempotency_key_hash() in SQL (first 16 bytes of SHA-256 as uuid)
+_INSERT_PAYOUTS_SQL = f"""
+    WITH inserted AS (
+        INSERT INTO payouts_payout ({", ".join(_PAYOUT_COLUMNS)})
+        {_PAYOUT_ROWS_SQL}
+        RETURNING id, idempotency_key, created_at
+    )
+    INSERT INTO payouts_payout_idempotency_key ({", ".join(_KEY_COLUMNS)})
+    SELECT
+        encode(
+            substring(sha256(convert_to(idempotency_key, 'UTF8')) FROM 1 FOR 16),
+            'hex'
+        )::uuid,
+        id,
+        created_at,
+        created_at
+    FROM inserted
+"""
+
+
+class PayoutRowGenerator:
+    """
+    Deterministic payout rows for a fixed set of recipients, generated by
+    PostgreSQL: rows never pass through Python.
+
+    Recipients must have consecutive ids from ``first_recipient_id``.
+    """
+
+    def __init__(
+        self,
+        rng: random.Random,
+        *,
+        first_recipient_id: int,
+        recipients: int,
+        until: datetime,
+        years: float,
+        skew: float,
+    ) -> None:
+        self.first_recipient_id = first_recipient_id
+        self.until = until.timestamp()
+        self.span = years * 365.25 * 24 * 3600
+        # Popularity by rank, ranks shuffled so hot recipients are not just
+        # the lowest ids
+        ranks = list(range(recipients))
+        rng.shuffle(ranks)
+        self._cum_weights = list(accumulate(1 / (rank + 1) ** skew for rank in ranks))
+
+    def _params(
+        self, first_id: int, first_index: int, count: int, key_prefix: str
+    ) -> dict:
+        return {
+            "first_id": first_id,
+            "first_index": first_index,
+            "last_index": first_index + count - 1,
+            "key_prefix": key_prefix,
+            "first_recipient_id": self.first_recipient_id,
+            "total_weight": self._cum_weights[-1],
+            "cum_weights": self._cum_weights,
+            "until": self.until,
+            "span": self.span,
+        }
+
+    def rows(
+        self,
+        cursor,
+        seed: float,
+        first_id: int,
+        first_index: int,
+        count: int,
+        key_prefix: str,
+    ) -> list[tuple]:
+        """
+        ``count`` payout rows in _PAYOUT_COLUMNS order, oldest first, with ids
+        from ``first_id`` and keys numbered from ``first_index``.
+        ``seed`` is a setseed() value in [-1, 1].
+        """
+        cursor.execute("SELECT setseed(%s)", [seed])
+        cursor.execute(
+            _PAYOUT_ROWS_SQL, self._params(first_id, first_index, count, key_prefix)
+        )
+        return cursor.fetchall()
+
+    def insert(
+        self,
+        cursor,
+        seed: float,
+        first_id: int,
+        first_index: int,
+        count: int,
+        key_prefix: str,
+    ) -> None:
+        """Insert the rows() batch and register its idempotency keys."""
+        cursor.execute("SELECT setseed(%s)", [seed])
+        cursor.execute(
+            _INSERT_PAYOUTS_SQL,
+            self._params(first_id, first_index, count, key_prefix),
+        )
+
+
+def generate_payouts(
+    *,
+    recipients: int,
+    payouts: int,
+    seed: int,
+    until: date,
+    years: float,
+    skew: float,
+    batch_size: int,
+    months_ahead: int,
+    defer_indexes: bool = False,
+    progress: Callable[[int], None] | None = None,
+) -> GeneratedDataset:
+    """
+    Load ``recipients`` new recipients and ``payouts`` payouts (plus their
+    idempotency registry rows).
+
+    By default each batch commits on its own with every index maintained row
+    by row. With ``defer_indexes`` the payouts load in one transaction with
+    the secondary indexes, the key registry's primary key and the foreign
+    keys dropped, rebuilt at the end: faster, but the dropped objects keep
+    payouts_payout and the key registry ACCESS EXCLUSIVE locked for the whole
+    run, so only use it on a database nothing else is using.
+    """
+    rng = random.Random(seed)
+    until_at = datetime.combine(until, time.min, tzinfo=timezone.utc)
+    oldest = (until_at - timedelta(days=years * 365.25)).date()
+    ensure_payout_partitions(
+        months_ahead=months_ahead,
+        start=oldest.replace(day=1),
+    )
+
+    created_at = _timestamp(until_at.timestamp() - years * 365.25 * 24 * 3600)
+    rows = recipient_rows(rng, recipients, created_at)
+    with transaction.atomic(), connection.cursor() as cursor:
+        first_recipient_id = _reserve_ids(cursor, "payouts_recipient", recipients)
+        _copy(
+            cursor,
+            "payouts_recipient",
+            _RECIPIENT_COLUMNS,
+            ((str(first_recipient_id + index), *row) for index, row in enumerate(rows)),
+        )
+    generator = PayoutRowGenerator(
+        rng,
+        first_recipient_id=first_recipient_id,
+        recipients=recipients,
+        until=until_at,
+        years=years,
+        skew=skew,
+    )
+
+    key_prefix = payout_key_prefix(seed)
+    with ExitStack() as load:
+        restore = []
+        if defer_indexes:
+            # One transaction for the whole load: indexes are dropped, the
+            # batches inserted, and everything rebuilt with sorted builds
+            load.enter_context(transaction.atomic())
+            with connection.cursor() as cursor:
+                restore = _drop_deferred_objects(cursor)
+
+        done = 0
+        while done < payouts:
+            count = min(batch_size, payouts - done)
+            # Seeded inside the batch's transaction: with PgBouncer in
+            # transaction mode, batches may run on different server sessions
+            batch_seed = rng.uniform(-1, 1)
+            with transaction.atomic(), connection.cursor() as cursor:
+                first_id = _reserve_ids(cursor, "payouts_payout", count)
+                generator.insert(cursor, batch_seed, first_id, done, count, key_prefix)
+            done += count
+            if progress is not None:
+                progress(done)
+
+        if restore:
+            # Still inside the load transaction, which SET LOCAL is scoped to
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SET LOCAL maintenance_work_mem = %s", [INDEX_BUILD_MEMORY]
+                )
+                for statement in restore:
+                    cursor.execute(statement)
+
+    with connection.cursor() as cursor:
+        for table in (
+            "payouts_recipient",
+            "payouts_payout",
+            "payouts_payout_idempotency_key",
+        ):
+            cursor.execute(f"ANALYZE {table}")
+
+    logger.info(
+        "Generated %s recipients and %s payouts (seed=%s)", recipients, payouts, seed
+    )
+    return GeneratedDataset(
+        recipients=recipients,
+        payouts=payouts,
+        first_recipient_id=first_recipient_id,
+        key_prefix=key_prefix,
+    )
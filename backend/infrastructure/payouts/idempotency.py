@@ -0,0 +1,62 @@
+# infrastructure/payouts/idempotency.py
+import logging
+from datetime import datetime
+
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# Oldest first via the created_at index. SKIP LOCKED keeps the sweep from
+# waiting on a key a create request is currently registering.
+_EXPIRE_BATCH_SQL = """
+    DELETE FROM payouts_payout_idempotency_key
+    WHERE key_hash IN (
+        SELECT key_hash
+        FROM payouts_payout_idempotency_key
+        WHERE created_at < %s
+        ORDER BY created_at
+        LIMIT %s
+        FOR UPDATE SKIP LOCKED
+    )
+"""
+
+
+def _expire_batch(*, cutoff: datetime, batch_size: int) -> int:
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(_EXPIRE_BATCH_SQL, [cutoff, batch_size])
+        return cursor.rowcount
+
+
+def expire_idempotency_keys(
+    *,
+    cutoff: datetime,
+    batch_size: int,
+    max_batches: int | None = None,
+) -> int:
+    """
+    Remove idempotency keys registered before ``cutoff``.
+
+    Each batch commits on its own, so the job can be interrupted and resumed.
+    Payouts are kept; only their key stops deduplicating (a retry with it
+    creates a new payout). Returns the number of expired keys.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        expired = _expire_batch(cutoff=cutoff, batch_size=batch_size)
+        total += expired
+        batches += 1
+        if expired < batch_size:
+            break
+
+    if total:
+        logger.info(
+            "Expired %s idempotency keys registered before %s in %s batch(es)",
+            total,
+            cutoff.isoformat(),
+            batches,
+        )
+    return total
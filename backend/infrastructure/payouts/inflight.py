@@ -0,0 +1,155 @@
+# infrastructure/payouts/inflight.py
+"""
+Coalescing of concurrent create requests that carry the same idempotency key.
+
+The first request takes a short Redis lease (SET NX PX) on the key's hash and
+runs the use case. After its transaction commits it publishes the serialized
+response under a result key and drops the lease. Duplicates that arrive
+meanwhile poll for that result and return it without touching Postgres.
+
+Nothing here is needed for correctness: the idempotency registry still
+rejects a second insert. Whenever coalescing cannot help, the request simply
+runs the use case itself:
+
+- Redis is unavailable (fail open)
+- the leader failed: it releases the lease and the next waiter takes over
+- the leader died: its lease expires after PAYOUT_INFLIGHT_LEASE_MS and the
+  next waiter takes over
+- the leader is slower than PAYOUT_INFLIGHT_WAIT_MS
+"""
+import json
+import logging
+import time
+import uuid
+from typing import Callable
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+from infrastructure.redis_client import get_redis_client
+from payouts.domain.value_objects import idempotency_key_hash
+
+from .metrics import INFLIGHT_CREATES
+
+logger = logging.getLogger(__name__)
+
+INFLIGHT_LEASE_KEY = "payouts:inflight:lease:{key_hash}"
+INFLIGHT_RESULT_KEY = "payouts:inflight:result:{key_hash}"
+
+# Followers check for the leader's result this often
+INFLIGHT_POLL_INTERVAL_SECONDS = 0.01
+
+# KEYS[1] = lease key, KEYS[2] = result key
+# ARGV[1] = lease token, ARGV[2] = result, ARGV[3] = result ttl (ms)
+# The result is stored even if the lease was lost: it is still correct.
+_PUBLISH_SCRIPT = """
+redis.call('set', KEYS[2], ARGV[2], 'PX', ARGV[3])
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    redis.call('del', KEYS[1])
+end
+return 1
+"""
+
+# KEYS[1] = lease key; ARGV[1] = lease token
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+CreateResult = tuple[dict, bool]
+
+
+class InflightCreate:
+    """
+    One create request's view of the in-flight registry for its key.
+
+    run() either executes ``create`` as the leader or returns the leader's
+    published result as a duplicate.
+    """
+
+    def __init__(
+        self,
+        idempotency_key: str,
+        *,
+        client: redis.Redis | None = None,
+        lease_ms: int | None = None,
+        wait_ms: int | None = None,
+        result_ttl_ms: int | None = None,
+    ) -> None:
+        key_hash = idempotency_key_hash(idempotency_key.strip())
+        self.lease_key = INFLIGHT_LEASE_KEY.format(key_hash=key_hash)
+        self.result_key = INFLIGHT_RESULT_KEY.format(key_hash=key_hash)
+        self.lease_ms = lease_ms or settings.PAYOUT_INFLIGHT_LEASE_MS
+        self.wait_ms = wait_ms or settings.PAYOUT_INFLIGHT_WAIT_MS
+        self.result_ttl_ms = result_ttl_ms or settings.PAYOUT_INFLIGHT_RESULT_TTL_MS
+        self.token = uuid.uuid4().hex
+
+        self._client = client or get_redis_client()
+        self._publish = self._client.register_script(_PUBLISH_SCRIPT)
+        self._release = self._client.register_script(_RELEASE_SCRIPT)
+
+    def run(self, create: Callable[[], CreateResult]) -> CreateResult:
+        deadline = time.monotonic() + self.wait_ms / 1000
+        try:
+            while True:
+                published = self._client.get(self.result_key)
+                if published is not None:
+                    INFLIGHT_CREATES.labels(role="follower").inc()
+                    return json.loads(published), True
+                if self._client.set(
+                    self.lease_key, self.token, nx=True, px=self.lease_ms
+                ):
+                    break
+                if time.monotonic() >= deadline:
+                    INFLIGHT_CREATES.labels(role="timeout").inc()
+                    return create()
+                time.sleep(INFLIGHT_POLL_INTERVAL_SECONDS)
+        except redis.RedisError:
+            logger.warning(
+                "In-flight registry unavailable, creating without it",
+                exc_info=True,
+            )
+            INFLIGHT_CREATES.labels(role="unavailable").inc()
+            return create()
+
+        INFLIGHT_CREATES.labels(role="leader").inc()
+        try:
+            data, is_duplicate = create()
+        except BaseException:
+            # Waiters take over instead of waiting for the lease to expire
+            self._call(self._release, keys=[self.lease_key], args=[self.token])
+            raise
+
+        # Only committed payouts may be handed to other requests
+        result = json.dumps(data)
+        transaction.on_commit(
+            lambda: self._call(
+                self._publish,
+                keys=[self.lease_key, self.result_key],
+                args=[self.token, result, self.result_ttl_ms],
+            )
+        )
+        return data, is_duplicate
+
+    def _call(self, script, *, keys, args) -> None:
+        try:
+            script(keys=keys, args=args)
+        except redis.RedisError:
+            # The lease expires on its own after lease_ms
+            logger.warning("In-flight registry update failed", exc_info=True)
+
+
+def coalesce_payout_create(
+    idempotency_key: str,
+    create: Callable[[], CreateResult],
+) -> CreateResult:
+    """
+    Run ``create`` (returning response data and is_duplicate) at most once at
+    a time per idempotency key.
+    """
+    if not settings.PAYOUT_INFLIGHT_COALESCING_ENABLED:
+        return create()
+    return InflightCreate(idempotency_key).run(create)
@@ -0,0 +1,187 @@
+# infrastructure/payouts/locks.py
+import logging
+import threading
+import time
+
+import redis
+from django.conf import settings
+
+from infrastructure.redis_client import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+PAYOUT_LOCK_KEY = "payouts:lock:process:{payout_id}"
+
+# One counter for all payouts, never expiring: a token must stay above any
+# token already stored on a payout row (Payout.fencing_token).
+PAYOUT_FENCE_KEY = "payouts:lock:fence"
+
+# KEYS[1] = lock key, KEYS[2] = fence counter; ARGV[1] = lease ttl (ms)
+# Returns the new fencing token, or 0 if the lock is already held.
+_ACQUIRE_SCRIPT = """
+if redis.call('exists', KEYS[1]) == 1 then
+    return 0
+end
+local token = redis.call('incr', KEYS[2])
+redis.call('set', KEYS[1], token, 'PX', ARGV[1])
+return token
+"""
+
+# KEYS[1] = lock key; ARGV[1] = fencing token, ARGV[2] = lease ttl (ms)
+_EXTEND_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+# KEYS[1] = lock key; ARGV[1] = fencing token
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class LockLostError(Exception):
+    """The lease expired or was taken over while work was still in progress."""
+
+
+class PayoutExecutionLock:
+    """
+    Redis lease lock guarding a single payout's processing.
+
+    - acquire() is atomic and returns a monotonically increasing fencing token
+    - the lease is renewed by a background thread while the lock is held
+    - ensure_held() is a local early check; the fencing token itself is
+      enforced by the database (PayoutRepository.claim_for_processing and
+      the status compare-and-set)
+    - if Redis is unavailable the lock fails open (domain transition
+      checks remain the last line of defence)
+    """
+
+    def __init__(
+        self,
+        payout_id: int,
+        *,
+        client: redis.Redis | None = None,
+        ttl_ms: int | None = None,
+    ) -> None:
+        self.payout_id = payout_id
+        self.key = PAYOUT_LOCK_KEY.format(payout_id=payout_id)
+        self.ttl_ms = ttl_ms or settings.PAYOUT_TASK_LOCK_TTL_MS
+
+        self.fencing_token: int | None = None
+        self.degraded = False
+
+        self._client = client or get_redis_client()
+        self._acquire = self._client.register_script(_ACQUIRE_SCRIPT)
+        self._extend = self._client.register_script(_EXTEND_SCRIPT)
+        self._release = self._client.register_script(_RELEASE_SCRIPT)
+
+        self._lost = False
+        self._last_renewed_at = 0.0
+        self._stop = threading.Event()
+        self._renewer: threading.Thread | None = None
+
+    def acquire(self) -> bool:
+        """
+        Try to take the lease once, without waiting.
+        Returns False when another worker already holds it.
+        """
+        try:
+            token = int(
+                self._acquire(
+                    keys=[self.key, PAYOUT_FENCE_KEY],
+                    args=[self.ttl_ms],
+                )
+            )
+        except redis.RedisError:
+            logger.warning(
+                "Payout lock unavailable, proceeding without it: payout_id=%s",
+                self.payout_id,
+                exc_info=True,
+            )
+            self.degraded = True
+            return True
+
+        if not token:
+            return False
+
+        self.fencing_token = token
+        self._last_renewed_at = time.monotonic()
+        self._start_renewal()
+        return True
+
+    def ensure_held(self) -> None:
+        """Raise LockLostError if the lease can no longer be trusted."""
+        if self.degraded:
+            return
+
+        expired = time.monotonic() - self._last_renewed_at >= self.ttl_ms / 1000
+        if self._lost or expired:
+            raise LockLostError(
+                f"Lost processing lock for payout {self.payout_id} "
+                f"(fencing_token={self.fencing_token})"
+            )
+
+    def release(self) -> None:
+        """Stop renewal and delete the lease if it is still ours."""
+        self._stop.set()
+        if self._renewer is not None:
+            self._renewer.join()
+            self._renewer = None
+
+        if self.fencing_token is None:
+            return
+
+        try:
+            self._release(keys=[self.key], args=[self.fencing_token])
+        except redis.RedisError:
+            # Lease will expire on its own after ttl_ms
+            logger.warning(
+                "Payout lock release failed: payout_id=%s",
+                self.payout_id,
+                exc_info=True,
+            )
+        finally:
+            self.fencing_token = None
+
+    def _start_renewal(self) -> None:
+        self._stop.clear()
+        self._renewer = threading.Thread(
+            target=self._renew_loop,
+            name=f"payout-lock-renewer-{self.payout_id}",
+            daemon=True,
+        )
+        self._renewer.start()
+
+    def _renew_loop(self) -> None:
+        interval = self.ttl_ms / 3000
+
+        while not self._stop.wait(interval):
+            try:
+                renewed = self._extend(
+                    keys=[self.key],
+                    args=[self.fencing_token, self.ttl_ms],
+                )
+            except redis.RedisError:
+                # Keep trying; ensure_held() fails once the lease has expired
+                logger.warning(
+                    "Payout lock renewal failed: payout_id=%s",
+                    self.payout_id,
+                    exc_info=True,
+                )
+                continue
+
+            if not renewed:
+                logger.warning(
+                    "Payout lock taken over: payout_id=%s, fencing_token=%s",
+                    self.payout_id,
+                    self.fencing_token,
+                )
+                self._lost = True
+                return
+
+            self._last_renewed_at = time.monotonic()
@@ -0,0 +1,27 @@
+# infrastructure/payouts/metrics.py
+from prometheus_client import Counter
+
+TASK_DUPLICATES_SUPPRESSED = Counter(
+    "payouts_task_duplicates_suppressed_total",
+    "Task deliveries skipped because another worker holds the payout lock.",
+    ["task"],
+)
+
+CACHE_OPERATIONS = Counter(
+    "payouts_cache_operations_total",
+    "Payouts cache calls by operation (get / set / incr) and result.",
+    ["operation", "result"],
+)
+
+INFLIGHT_CREATES = Counter(
+    "payouts_inflight_creates_total",
+    "Create requests by in-flight coalescing role: leader, follower (served "
+    "the leader's result), timeout or unavailable (ran without coalescing).",
+    ["role"],
+)
+
+LIST_PAGE_CACHE = Counter(
+    "payouts_list_page_cache_total",
+    "Payouts list page lookups served from cache (hit) or the database (miss).",
+    ["result"],
+)
@@ -0,0 +1,167 @@
+# infrastructure/payouts/partitions.py
+import logging
+import re
+from datetime import date
+
+from django.db import connection, transaction
+
+logger = logging.getLogger(__name__)
+
+PAYOUT_TABLE = "payouts_payout"
+PAYOUT_DEFAULT_PARTITION = "payouts_payout_default"
+PAYOUT_IDEMPOTENCY_KEY_TABLE = "payouts_payout_idempotency_key"
+
+_PARTITION_NAME_RE = re.compile(r"^payouts_payout_p(\d{4})_(\d{2})$")
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift a first-of-month date by a (possibly negative) number of months."""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def payout_partition_name(month: date) -> str:
+    return f"{PAYOUT_TABLE}_p{month:%Y_%m}"
+
+
+def list_payout_partitions() -> list[date]:
+    """Returns the months of all attached monthly partitions, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s
+            """,
+            [PAYOUT_TABLE],
+        )
+        names = [row[0] for row in cursor.fetchall()]
+
+    months = []
+    for name in names:
+        match = _PARTITION_NAME_RE.match(name)
+        if match:
+            months.append(date(int(match[1]), int(match[2]), 1))
+    return sorted(months)
+
+
+def _bounds(month: date) -> tuple[str, str]:
+    upper = add_months(month, 1)
+    return f"{month:%Y-%m-%d} 00:00:00+00", f"{upper:%Y-%m-%d} 00:00:00+00"
+
+
+@transaction.atomic
+def _create_payout_partition(month: date) -> None:
+    """
+    Create one monthly partition.
+
+    Rows that already landed in the DEFAULT partition for this month are moved
+    into the new table before it is attached, otherwise ATTACH would fail.
+    """
+    name = payout_partition_name(month)
+    lower, upper = _bounds(month)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE "{name}" (LIKE "{PAYOUT_TABLE}" INCLUDING DEFAULTS)'
+        )
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM "{PAYOUT_DEFAULT_PARTITION}"
+                WHERE created_at >= %s AND created_at < %s
+                RETURNING *
+            )
+            INSERT INTO "{name}" SELECT * FROM moved
+            """,
+            [lower, upper],
+        )
+        if cursor.rowcount:
+            logger.warning(
+                "Moved %s rows from %s into new partition %s",
+                cursor.rowcount,
+                PAYOUT_DEFAULT_PARTITION,
+                name,
+            )
+        cursor.execute(
+            f'ALTER TABLE "{PAYOUT_TABLE}" ATTACH PARTITION "{name}" '
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+
+
+def ensure_payout_partitions(
+    *,
+    months_ahead: int,
+    start: date | None = None,
+) -> list[str]:
+    """
+    Make sure monthly partitions exist from ``start`` (default: current month)
+    through ``months_ahead`` months in the future. Returns created partitions.
+    """
+    today = date.today().replace(day=1)
+    month = (start or today).replace(day=1)
+    last = add_months(today, months_ahead)
+    existing = set(list_payout_partitions())
+
+    created = []
+    while month <= last:
+        if month not in existing:
+            _create_payout_partition(month)
+            created.append(payout_partition_name(month))
+        month = add_months(month, 1)
+
+    if created:
+        logger.info("Created payout partitions: %s", ", ".join(created))
+    return created
+
+
+@transaction.atomic
+def _detach_payout_partition(month: date) -> None:
+    """
+    Detach one monthly partition and release the idempotency keys of its rows.
+
+    Both happen in one transaction: a key left registered would point at a
+    payout the application can no longer read.
+    """
+    name = payout_partition_name(month)
+    lower, upper = _bounds(month)
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            DELETE FROM "{PAYOUT_IDEMPOTENCY_KEY_TABLE}" AS registry
+            USING "{name}" AS payout
+            WHERE registry.payout_id = payout.id
+              AND registry.payout_created_at >= %s
+              AND registry.payout_created_at < %s
+            """,
+            [lower, upper],
+        )
+        released = cursor.rowcount
+        cursor.execute(f'ALTER TABLE "{PAYOUT_TABLE}" DETACH PARTITION "{name}"')
+
+    if released:
+        logger.info("Released %s idempotency keys of partition %s", released, name)
+
+
+def detach_payout_partitions(*, older_than: date) -> list[str]:
+    """
+    Detach monthly partitions that end on or before ``older_than``.
+
+    Detached partitions stay in the database as standalone tables, ready to be
+    dumped, archived or dropped; their idempotency keys are released, so a
+    retry with one creates a new payout. Returns detached partition names.
+    """
+    detached = []
+    for month in list_payout_partitions():
+        if add_months(month, 1) > older_than:
+            break
+
+        _detach_payout_partition(month)
+        detached.append(payout_partition_name(month))
+
+    if detached:
+        logger.info("Detached payout partitions: %s", ", ".join(detached))
+    return detached
@@ -0,0 +1,29 @@
+# infrastructure/payouts/provider.py
+import logging
+from time import sleep
+
+from django.conf import settings
+
+from core.tracing import tracer
+from payouts.models import Payout
+
+logger = logging.getLogger(__name__)
+
+
+def send_payout(payout: Payout) -> None:
+    """
+    Placeholder for the external payout provider call.
+    sleep() simulates network delay (PAYOUT_PROVIDER_LATENCY_SECONDS).
+    """
+    with tracer.start_span(
+        "provider.send_payout",
+        kind="client",
+        attributes={
+            "payout.id": payout.id,
+            "payout.amount": str(payout.amount),
+            "payout.currency": payout.currency,
+        },
+    ):
+        sleep(settings.PAYOUT_PROVIDER_LATENCY_SECONDS)
+
+    logger.debug("Provider accepted payout: payout_id=%s", payout.id)
@@ -0,0 +1,126 @@
+# infrastructure/payouts/rollups.py
+"""
+Daily payout rollups: payouts_payout_daily_recipient_rollup (day, currency,
+status, recipient) and payouts_payout_daily_rollup (day, currency, status).
+
+Triggers append the day of every changed payout to
+payouts_payout_rollup_dirty_day (migrations 0008 and 0010; an update marks
+the days before and after it). refresh_payout_rollups()
+recomputes those days and nothing else. A day is always recomputed whole
+from payouts_payout and payouts_payout_archive, so running it twice, or
+after a missed run, gives the same rows.
+
+Each day is recomputed in its own transaction:
+
+1. Take an advisory lock on the day, so the periodic job and a manual run
+   never interleave.
+2. Clear the day's dirty marks. Marks from transactions that have not yet
+   committed are not visible, so they stay for the next run.
+3. Replace the day's recipient rollup rows with one pass over the day's
+   payouts. This statement sees every change whose mark was cleared in
+   step 2.
+4. Replace the day's totals, derived from the recipient rollup.
+"""
+import logging
+from datetime import date, datetime, time, timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import connection, transaction
+
+from payouts.models import (
+    PayoutDailyRecipientRollup,
+    PayoutDailyRollup,
+    PayoutRollupDirtyDay,
+)
+
+logger = logging.getLogger(__name__)
+
+# First key of pg_advisory_xact_lock(int, int); the second is the day
+_ROLLUP_LOCK_NAMESPACE = 0x0D41
+
+_RECOMPUTE_RECIPIENT_DAY_SQL = """
+    INSERT INTO payouts_payout_daily_recipient_rollup
+        (day, currency, status, recipient_id, payout_count, amount_total, computed_at)
+    SELECT %(day)s, currency, status, recipient_id, count(*), sum(amount), now()
+    FROM (
+        SELECT currency, status, recipient_id, amount
+        FROM payouts_payout
+        WHERE created_at >= %(start)s AND created_at < %(end)s
+        UNION ALL
+        SELECT currency, status, recipient_id, amount
+        FROM payouts_payout_archive
+        WHERE created_at >= %(start)s AND created_at < %(end)s
+    ) AS payouts
+    GROUP BY currency, status, recipient_id
+"""
+
+_RECOMPUTE_DAY_SQL = """
+    INSERT INTO payouts_payout_daily_rollup
+        (day, currency, status, payout_count, amount_total, computed_at)
+    SELECT day, currency, status, sum(payout_count), sum(amount_total), now()
+    FROM payouts_payout_daily_recipient_rollup
+    WHERE day = %(day)s
+    GROUP BY day, currency, status
+"""
+
+
+def recompute_payout_rollup_day(day: date) -> int:
+    """
+    Rebuild both rollups of one UTC day; returns the number of recipient
+    rollup rows. Idempotent.
+    """
+    start = datetime.combine(day, time.min, tzinfo=dt_timezone.utc)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT pg_advisory_xact_lock(%s, %s)",
+            [_ROLLUP_LOCK_NAMESPACE, day.toordinal()],
+        )
+        PayoutRollupDirtyDay.objects.filter(day=day).delete()
+        PayoutDailyRecipientRollup.objects.filter(day=day).delete()
+        PayoutDailyRollup.objects.filter(day=day).delete()
+        cursor.execute(
+            _RECOMPUTE_RECIPIENT_DAY_SQL,
+            {"day": day, "start": start, "end": start + timedelta(days=1)},
+        )
+        rows = cursor.rowcount
+        cursor.execute(_RECOMPUTE_DAY_SQL, {"day": day})
+        return rows
+
+
+def refresh_payout_rollups(*, max_days: int | None = None) -> list[date]:
+    """
+    Recompute every day with payout changes since its last rollup, oldest
+    first. Returns the recomputed days.
+    """
+    days = (
+        PayoutRollupDirtyDay.objects.values_list("day", flat=True)
+        .distinct()
+        .order_by("day")
+    )
+    if max_days is not None:
+        days = days[:max_days]
+
+    refreshed = []
+    for day in days:
+        recompute_payout_rollup_day(day)
+        refreshed.append(day)
+
+    if refreshed:
+        logger.info(
+            "Refreshed payout rollups for %s day(s): %s .. %s",
+            len(refreshed),
+            refreshed[0].isoformat(),
+            refreshed[-1].isoformat(),
+        )
+    return refreshed
+
+
+def recompute_payout_rollups(*, date_from: date, date_to: date) -> int:
+    """
+    Recompute every day in [date_from, date_to], changed or not (backfill,
+    repair). Returns the number of days.
+    """
+    days = (date_to - date_from).days + 1
+    for offset in range(days):
+        recompute_payout_rollup_day(date_from + timedelta(days=offset))
+    return max(days, 0)
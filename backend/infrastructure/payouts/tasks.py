@@ -1,15 +1,25 @@
 import logging
-from time import sleep
+from datetime import timedelta
 
 from celery import shared_task
+from django.conf import settings
 from django.db import transaction
+from django.utils import timezone
 
 from core.exceptions import DomainNotFoundError
+from core.tracing import tracer
 from payouts.application.use_cases import ChangeStatusUseCase
 from payouts.models import Payout
 from payouts.repositories import PayoutRepository
 
+from .archive import archive_terminal_payouts
 from .cache import bump_payouts_list_cache_version
+from .idempotency import expire_idempotency_keys
+from .locks import PayoutExecutionLock
+from .metrics import TASK_DUPLICATES_SUPPRESSED
+from .partitions import ensure_payout_partitions
+from .provider import send_payout
+from .rollups import refresh_payout_rollups
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +58,105 @@ def rebuild_payouts_cache_task(self) -> None:
     )
 
 
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 3},
+    ignore_result=True,
+)
+def ensure_payout_partitions_task(self) -> None:
+    """
+    Infrastructure task (intended for a periodic schedule):
+    - creates payouts_payout monthly partitions ahead of time
+    """
+    created = ensure_payout_partitions(
+        months_ahead=settings.PAYOUT_PARTITIONS_MONTHS_AHEAD,
+    )
+    logger.info(
+        "ensure_payout_partitions_task completed: task_id=%s, created=%s",
+        self.request.id,
+        created,
+    )
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 3},
+    ignore_result=True,
+)
+def archive_terminal_payouts_task(self) -> None:
+    """
+    Infrastructure task (intended for a periodic schedule):
+    - moves COMPLETED / FAILED payouts past the cutoff into the archive table
+    - batches commit independently, so a retry resumes where it stopped
+    """
+    cutoff = timezone.now() - timedelta(days=settings.PAYOUT_ARCHIVE_AFTER_DAYS)
+    archived = archive_terminal_payouts(
+        cutoff=cutoff,
+        batch_size=settings.PAYOUT_ARCHIVE_BATCH_SIZE,
+    )
+    logger.info(
+        "archive_terminal_payouts_task completed: task_id=%s, archived=%s",
+        self.request.id,
+        archived,
+    )
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 3},
+    ignore_result=True,
+)
+def expire_idempotency_keys_task(self) -> None:
+    """
+    Infrastructure task (intended for a periodic schedule):
+    - removes idempotency keys older than the retention window
+    - batches commit independently, so a retry resumes where it stopped
+    """
+    cutoff = timezone.now() - timedelta(
+        days=settings.PAYOUT_IDEMPOTENCY_KEY_RETENTION_DAYS
+    )
+    expired = expire_idempotency_keys(
+        cutoff=cutoff,
+        batch_size=settings.PAYOUT_IDEMPOTENCY_KEY_EXPIRY_BATCH_SIZE,
+    )
+    logger.info(
+        "expire_idempotency_keys_task completed: task_id=%s, expired=%s",
+        self.request.id,
+        expired,
+    )
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_jitter=True,
+    retry_kwargs={"max_retries": 3},
+    ignore_result=True,
+)
+def refresh_payout_rollups_task(self) -> None:
+    """
+    Infrastructure task (intended for a periodic schedule):
+    - recomputes the daily rollups of days whose payouts changed
+    - days commit independently, so a retry resumes where it stopped
+    """
+    refreshed = refresh_payout_rollups()
+    logger.info(
+        "refresh_payout_rollups_task completed: task_id=%s, days=%s",
+        self.request.id,
+        len(refreshed),
+    )
+
+
 @shared_task(
     bind=True,
     autoretry_for=(Exception,),
@@ -61,6 +170,7 @@ def process_payout_task(self, payout_id: int) -> None:
     Idempotent payout processing task:
     - handles repeat executions safely (Celery retries)
     - exits gracefully if payout no longer exists
+    - skips duplicate concurrent deliveries (per-payout Redis lease lock)
     - transitions payout through NEW → PROCESSING → COMPLETED
     """
     logger.info(
@@ -69,7 +179,38 @@ def process_payout_task(self, payout_id: int) -> None:
         payout_id,
         self.request.retries,
     )
+    tracer.current_span().set_attribute("payout.id", payout_id)
 
+    if not settings.PAYOUT_TASK_LOCK_ENABLED:
+        _process_payout(self, payout_id, lock=None)
+        return
+
+    # Redelivered messages (acks_late / reject_on_worker_lost) may run
+    # concurrently with the original; only the lease holder does the work.
+    lock = PayoutExecutionLock(payout_id)
+    if not lock.acquire():
+        TASK_DUPLICATES_SUPPRESSED.labels(task="process_payout_task").inc()
+        logger.info(
+            "process_payout_task: payout is being processed by another worker, "
+            "skipping. task_id=%s, payout_id=%s",
+            self.request.id,
+            payout_id,
+        )
+        return
+
+    try:
+        _process_payout(self, payout_id, lock=lock)
+    finally:
+        lock.release()
+
+
+def _process_payout(
+    task,
+    payout_id: int,
+    *,
+    lock: PayoutExecutionLock | None,
+) -> None:
+    """Runs the NEW → PROCESSING → COMPLETED flow for a single payout."""
     # 1) Fetch payout
     try:
         payout = PayoutRepository.get_by_id(payout_id)
@@ -77,7 +218,7 @@ def process_payout_task(self, payout_id: int) -> None:
         logger.warning(
             "process_payout_task: payout not found, skipping. "
             "task_id=%s, payout_id=%s",
-            self.request.id,
+            task.request.id,
             payout_id,
         )
         return
@@ -87,12 +228,28 @@ def process_payout_task(self, payout_id: int) -> None:
         logger.info(
             "process_payout_task: payout already in terminal state, skipping. "
             "task_id=%s, payout_id=%s, status=%s",
-            self.request.id,
+            task.request.id,
             payout_id,
             payout.status,
         )
         return
 
+    # Fencing: stamp our lease's token on the row; both status writes below
+    # match on it, so a newer lease holder makes them fail instead of commit
+    fencing_token = lock.fencing_token if lock is not None else None
+    if fencing_token is not None and not PayoutRepository.claim_for_processing(
+        payout, fencing_token=fencing_token
+    ):
+        TASK_DUPLICATES_SUPPRESSED.labels(task="process_payout_task").inc()
+        logger.info(
+            "process_payout_task: a newer lease claimed the payout, skipping. "
+            "task_id=%s, payout_id=%s, fencing_token=%s",
+            task.request.id,
+            payout_id,
+            fencing_token,
+        )
+        return
+
     # 3) Main processing flow
     try:
         with transaction.atomic():
@@ -102,29 +259,34 @@ def process_payout_task(self, payout_id: int) -> None:
                     payout=payout,
                     new_status=Payout.Status.PROCESSING,
                     actor=None,  # system actor
+                    fencing_token=fencing_token,
                 )
                 logger.info(
                     "process_payout_task: payout moved to PROCESSING. "
                     "task_id=%s, payout_id=%s",
-                    self.request.id,
+                    task.request.id,
                     payout_id,
                 )
 
-            # Placeholder for external provider call
-            # sleep() simulates network delay
-            sleep(1)
+            send_payout(payout)
+
+            # Cheap local check before the write; the fencing token in the
+            # UPDATE is what actually rejects a lease taken over meanwhile
+            if lock is not None:
+                lock.ensure_held()
 
             # Step 2: move PROCESSING → COMPLETED
             payout = ChangeStatusUseCase.execute(
                 payout=payout,
                 new_status=Payout.Status.COMPLETED,
                 actor=None,
+                fencing_token=fencing_token,
             )
 
         logger.info(
             "process_payout_task completed successfully: "
             "task_id=%s, payout_id=%s, final_status=%s",
-            self.request.id,
+            task.request.id,
             payout_id,
             payout.status,
         )
@@ -133,7 +295,7 @@ def process_payout_task(self, payout_id: int) -> None:
         logger.exception(
             "process_payout_task failed: task_id=%s, payout_id=%s "
             "(will be retried if retries left)",
-            self.request.id,
+            task.request.id,
             payout_id,
         )
         raise
@@ -0,0 +1,174 @@
+# infrastructure/profiling.py
+"""
+On-demand sampling profiler for requests and Celery tasks.
+
+While a request / task is profiled, a helper thread samples the executing
+thread's stack every PROFILING_INTERVAL_MS (wall clock, so time blocked on
+the database or Redis shows up too) and the result is written in folded
+stack format, one ``frame;frame;frame count`` line per distinct stack:
+
+    flamegraph.pl <file> > flame.svg      # or drop the file into speedscope
+
+Unprofiled work only pays for the sampling decision. Receivers are connected
+on import (see config/celery.py); the HTTP side is ProfilingMiddleware.
+"""
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from pathlib import Path
+
+from celery import signals
+from django.conf import settings
+
+from infrastructure.celery_metrics import request_header
+
+logger = logging.getLogger(__name__)
+
+# Task message header asking the worker to profile the task
+PROFILE_TASK_HEADER = "profile"
+
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+# Set while this context is being profiled: nested scopes (eager tasks) are
+# not profiled twice, and tasks published from here are profiled as well
+_profiling: ContextVar[bool] = ContextVar("profiling", default=False)
+
+
+def _frame_label(code, cache: dict) -> str:
+    label = cache.get(code)
+    if label is None:
+        filename = code.co_filename
+        if "site-packages/" in filename:
+            filename = filename.split("site-packages/", 1)[1]
+        elif filename.startswith(_PROJECT_ROOT):
+            filename = filename[len(_PROJECT_ROOT) + 1 :]
+        else:
+            filename = os.path.basename(filename)
+        label = f"{code.co_name} ({filename}:{code.co_firstlineno})"
+        cache[code] = label
+    return label
+
+
+class StackSampler:
+    """Samples one thread's stack from a helper thread until stopped."""
+
+    def __init__(self, thread_id: int, *, interval: float) -> None:
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter[tuple[str, ...]] = Counter()
+        self._labels: dict = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="stack-sampler",
+            daemon=True,
+        )
+
+    def start(self) -> "StackSampler":
+        self._thread.start()
+        return self
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self.samples
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                return
+            stack = []
+            while frame is not None:
+                stack.append(_frame_label(frame.f_code, self._labels))
+                frame = frame.f_back
+            stack.reverse()
+            self.samples[tuple(stack)] += 1
+
+
+class Profile:
+    """One profiled scope: start the sampler, then ``finish`` to write it."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self._started = time.perf_counter()
+        self._token = _profiling.set(True)
+        self._sampler = StackSampler(
+            threading.get_ident(),
+            interval=settings.PROFILING_INTERVAL_MS / 1000,
+        ).start()
+
+    def finish(self, name: str) -> Path | None:
+        """Stop sampling and write ``<kind>-<name>-<time>-<pid>.folded``."""
+        samples = self._sampler.stop()
+        _profiling.reset(self._token)
+        elapsed_ms = (time.perf_counter() - self._started) * 1000
+        if not samples:
+            return None
+
+        output_dir = Path(settings.PROFILING_OUTPUT_DIR)
+        path = output_dir / (
+            f"{self.kind}-{_UNSAFE_NAME_RE.sub('_', name)}-"
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{int(elapsed_ms)}ms-{os.getpid()}"
+            ".folded"
+        )
+        # The scope name is the root frame, so profiles of one view or task
+        # can be concatenated into a single flamegraph
+        root = _UNSAFE_NAME_RE.sub("_", f"{self.kind} {name}")
+        try:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, "w") as profile_file:
+                for stack, count in samples.most_common():
+                    profile_file.write(f"{root};{';'.join(stack)} {count}\n")
+        except OSError:
+            logger.warning("Writing profile %s failed", path, exc_info=True)
+            return None
+        return path
+
+
+def start_profile(kind: str, *, sample_rate: float, forced: bool = False):
+    """A started Profile, or None if this scope is not sampled."""
+    if _profiling.get():
+        return None
+    if not forced and (sample_rate <= 0 or random.random() >= sample_rate):
+        return None
+    return Profile(kind)
+
+
+# ----- Celery -----
+
+# task_id -> Profile, per worker process
+_task_profiles: dict[str, Profile] = {}
+
+
+@signals.before_task_publish.connect
+def _on_before_task_publish(sender=None, headers=None, **kwargs):
+    # Follow a profiled request into the tasks it triggers
+    if headers is not None and _profiling.get():
+        headers[PROFILE_TASK_HEADER] = "1"
+
+
+@signals.task_prerun.connect
+def _on_task_prerun(sender=None, task_id=None, task=None, **kwargs):
+    profile = start_profile(
+        "task",
+        sample_rate=settings.PROFILING_TASK_SAMPLE_RATE,
+        forced=request_header(task.request, PROFILE_TASK_HEADER) == "1",
+    )
+    if profile is not None:
+        _task_profiles[task_id] = profile
+
+
+@signals.task_postrun.connect
+def _on_task_postrun(sender=None, task_id=None, task=None, **kwargs):
+    profile = _task_profiles.pop(task_id, None)
+    if profile is not None:
+        path = profile.finish(task.name)
+        logger.info("Profiled task %s[%s]: %s", task.name, task_id, path)
@@ -0,0 +1,313 @@
+# infrastructure/query_instrumentation.py
+"""
+Per-scope (HTTP request / Celery task) query instrumentation built on
+``connection.execute_wrapper``:
+
+- counts queries and DB time
+- groups queries by shape (literals and IN lists collapsed); one shape
+  repeated QUERY_N_PLUS_ONE_THRESHOLD+ times in a scope is reported as N+1,
+  with the call site of the repeats
+- queries slower than QUERY_SLOW_MS are logged with their call site and,
+  with QUERY_EXPLAIN_SLOW, an EXPLAIN plan (ANALYZE, BUFFERS only for plain
+  SELECTs that are safe to run twice, see _can_analyze)
+
+Celery receivers are connected on import (see config/celery.py); the HTTP
+side is QueryInstrumentationMiddleware.
+"""
+import logging
+import re
+import time
+import traceback
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator
+
+from celery import signals
+from django.conf import settings
+from django.db import connections, transaction
+from prometheus_client import Counter, Histogram
+
+from core.tracing import tracer
+
+logger = logging.getLogger(__name__)
+
+DB_QUERIES_PER_SCOPE = Histogram(
+    "db_queries_per_scope",
+    "Queries executed per HTTP request / Celery task.",
+    ["scope", "name"],
+    buckets=(1, 2, 3, 5, 10, 20, 50, 100, 250, 1000),
+)
+
+DB_TIME_PER_SCOPE = Histogram(
+    "db_time_per_scope_seconds",
+    "Database time per HTTP request / Celery task.",
+    ["scope", "name"],
+)
+
+DB_N_PLUS_ONE = Counter(
+    "db_n_plus_one_total",
+    "Scopes that repeated one query shape QUERY_N_PLUS_ONE_THRESHOLD+ times.",
+    ["scope", "name"],
+)
+
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Queries slower than QUERY_SLOW_MS.",
+    ["scope", "name"],
+)
+
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST_RE = re.compile(r"\bIN \((?:\?|%s)(?:, (?:\?|%s))*\)", re.IGNORECASE)
+_SAVEPOINT_RE = re.compile(r'"s\d+_x\d+"')
+_WHITESPACE_RE = re.compile(r"\s+")
+_LOCKING_CLAUSE_RE = re.compile(
+    r"\bFOR\s+(?:NO\s+KEY\s+)?(?:UPDATE|SHARE)\b|\bFOR\s+KEY\s+SHARE\b",
+    re.IGNORECASE,
+)
+_CALL_RE = re.compile(r"(?<![\w.\"])([a-z_][\w.]*)\s*\(", re.IGNORECASE)
+
+# Words followed by "(" that are not function calls, and functions that are
+# stable and side-effect free. Any other call (nextval, setval,
+# pg_advisory_xact_lock, random, user functions) rules out EXPLAIN ANALYZE.
+_SAFE_CALLS = frozenset(
+    {
+        # keywords
+        "all", "and", "any", "as", "exists", "filter", "from", "in", "not",
+        "on", "or", "over", "select", "using", "values", "where",
+        # functions
+        "abs", "avg", "cast", "coalesce", "count", "date_trunc", "greatest",
+        "least", "lower", "max", "min", "nullif", "row_number", "sum",
+        "timezone", "upper",
+    }
+)  # fmt: skip
+
+# Call-site frames kept per slow / repeated query
+_STACK_DEPTH = 8
+_PROJECT_ROOT = str(Path(__file__).resolve().parent.parent)
+
+
+def query_shape(sql: str) -> str:
+    """SQL with literals, IN lists and savepoint names collapsed."""
+    shape = _STRING_RE.sub("?", sql)
+    shape = _SAVEPOINT_RE.sub('"?"', shape)
+    shape = _NUMBER_RE.sub("?", shape)
+    shape = _IN_LIST_RE.sub("IN (...)", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+def _call_site() -> list[str]:
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if frame.filename.startswith(_PROJECT_ROOT)
+        and frame.filename != __file__
+        and "site-packages" not in frame.filename
+    ]
+    return [
+        f"{frame.filename[len(_PROJECT_ROOT) + 1:]}:{frame.lineno} in {frame.name}"
+        for frame in frames[-_STACK_DEPTH:]
+    ]
+
+
+def _can_analyze(sql: str) -> bool:
+    """
+    ANALYZE executes the statement again. Only read-only SELECTs qualify: no
+    row locks (FOR UPDATE / SHARE) and no calls outside _SAFE_CALLS, so
+    sequences, advisory locks and volatile functions never run twice.
+    """
+    if sql.lstrip()[:6].upper() != "SELECT":
+        return False
+    sql = _STRING_RE.sub("''", sql)
+    if _LOCKING_CLAUSE_RE.search(sql):
+        return False
+    return all(name.lower() in _SAFE_CALLS for name in _CALL_RE.findall(sql))
+
+
+@dataclass
+class ShapeStats:
+    count: int = 0
+    duration: float = 0.0
+    # Call site of the first repeat: where an N+1 loop lives
+    stack: list[str] | None = None
+
+
+@dataclass
+class SlowQuery:
+    sql: str
+    duration: float
+    stack: list[str]
+    plan: str | None = None
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    shapes: dict[str, ShapeStats] = field(default_factory=dict)
+    slow: list[SlowQuery] = field(default_factory=list)
+
+    @property
+    def duplicates(self) -> int:
+        """Queries that repeated an already executed shape."""
+        return sum(stats.count - 1 for stats in self.shapes.values())
+
+    def repeated(self, threshold: int) -> list[tuple[str, ShapeStats]]:
+        """Shapes executed at least ``threshold`` times, most frequent first."""
+        return sorted(
+            (
+                (shape, stats)
+                for shape, stats in self.shapes.items()
+                if stats.count >= threshold
+            ),
+            key=lambda item: item[1].count,
+            reverse=True,
+        )
+
+
+class QueryRecorder:
+    """``execute_wrapper`` callable feeding one QueryStats."""
+
+    def __init__(self, stats: QueryStats, *, slow_ms: float, explain: bool) -> None:
+        self.stats = stats
+        self.slow_seconds = slow_ms / 1000
+        self.explain = explain
+        self._explaining = False
+
+    def __call__(self, execute, sql, params, many, context):
+        if self._explaining:
+            return execute(sql, params, many, context)
+
+        started = time.perf_counter()
+        succeeded = False
+        try:
+            result = execute(sql, params, many, context)
+            succeeded = True
+            return result
+        finally:
+            duration = time.perf_counter() - started
+            self._record(sql, duration)
+            if duration >= self.slow_seconds:
+                self._record_slow(
+                    context["connection"],
+                    sql,
+                    params,
+                    duration,
+                    explain=self.explain and succeeded and not many,
+                )
+
+    def _record(self, sql: str, duration: float) -> None:
+        self.stats.count += 1
+        self.stats.duration += duration
+
+        shape_stats = self.stats.shapes.setdefault(query_shape(sql), ShapeStats())
+        shape_stats.count += 1
+        shape_stats.duration += duration
+        if shape_stats.count == 2:
+            shape_stats.stack = _call_site()
+
+    def _record_slow(self, connection, sql, params, duration, *, explain) -> None:
+        self.stats.slow.append(
+            SlowQuery(
+                sql=sql,
+                duration=duration,
+                stack=_call_site(),
+                plan=self._explain(connection, sql, params) if explain else None,
+            )
+        )
+
+    def _explain(self, connection, sql: str, params) -> str | None:
+        if _can_analyze(sql):
+            prefix = "EXPLAIN (ANALYZE, BUFFERS) "
+        else:
+            prefix = "EXPLAIN "
+
+        self._explaining = True
+        try:
+            # Savepoint: a failing EXPLAIN must not abort the caller's transaction
+            with transaction.atomic(using=connection.alias):
+                with connection.cursor() as cursor:
+                    cursor.execute(prefix + sql, params)
+                    return "\n".join(row[0] for row in cursor.fetchall())
+        except Exception:
+            logger.warning("EXPLAIN failed for slow query", exc_info=True)
+            return None
+        finally:
+            self._explaining = False
+
+
+@contextmanager
+def instrument_queries() -> Iterator[QueryStats]:
+    """Record every query run on this thread's connections inside the block."""
+    stats = QueryStats()
+    recorder = QueryRecorder(
+        stats,
+        slow_ms=settings.QUERY_SLOW_MS,
+        explain=settings.QUERY_EXPLAIN_SLOW,
+    )
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(recorder))
+        yield stats
+
+
+def publish_query_stats(stats: QueryStats, *, scope: str, name: str) -> None:
+    """Metrics, span attributes and warnings for one finished scope."""
+    DB_QUERIES_PER_SCOPE.labels(scope=scope, name=name).observe(stats.count)
+    DB_TIME_PER_SCOPE.labels(scope=scope, name=name).observe(stats.duration)
+
+    span = tracer.current_span()
+    span.set_attribute("db.query_count", stats.count)
+    span.set_attribute("db.time_ms", round(stats.duration * 1000, 2))
+
+    repeated = stats.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD)
+    if repeated:
+        DB_N_PLUS_ONE.labels(scope=scope, name=name).inc()
+        for shape, shape_stats in repeated:
+            logger.warning(
+                "N+1 query in %s %s: %sx (%.1f ms) %s\n  at %s",
+                scope,
+                name,
+                shape_stats.count,
+                shape_stats.duration * 1000,
+                shape,
+                "\n  at ".join(shape_stats.stack or []),
+            )
+
+    for slow in stats.slow:
+        DB_SLOW_QUERIES.labels(scope=scope, name=name).inc()
+        logger.warning(
+            "Slow query in %s %s: %.1f ms %s\n  at %s\n%s",
+            scope,
+            name,
+            slow.duration * 1000,
+            slow.sql,
+            "\n  at ".join(slow.stack),
+            slow.plan or "(no plan)",
+        )
+
+
+# ----- Celery -----
+
+# task_id -> (ExitStack removing the wrappers, stats), per worker process
+_task_scopes: dict[str, tuple[ExitStack, QueryStats]] = {}
+
+
+@signals.task_prerun.connect
+def _on_task_prerun(sender=None, task_id=None, task=None, **kwargs):
+    if not settings.QUERY_INSTRUMENTATION_ENABLED:
+        return
+    stack = ExitStack()
+    stats = stack.enter_context(instrument_queries())
+    _task_scopes[task_id] = (stack, stats)
+
+
+@signals.task_postrun.connect
+def _on_task_postrun(sender=None, task_id=None, task=None, **kwargs):
+    entry = _task_scopes.pop(task_id, None)
+    if entry is None:
+        return
+    stack, stats = entry
+    stack.close()
+    publish_query_stats(stats, scope="task", name=task.name)
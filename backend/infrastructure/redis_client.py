@@ -0,0 +1,27 @@
+# infrastructure/redis_client.py
+import redis
+from django.conf import settings
+
+_pools: dict[str, redis.ConnectionPool] = {}
+
+
+def get_redis_client(url: str | None = None) -> redis.Redis:
+    """
+    Returns a Redis client backed by a per-process connection pool.
+
+    Pools are created lazily (after gunicorn / Celery fork) and reused,
+    so callers never open a new TCP connection per operation.
+    """
+    url = url or settings.REDIS_URL
+
+    pool = _pools.get(url)
+    if pool is None:
+        pool = redis.ConnectionPool.from_url(
+            url,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            health_check_interval=30,
+        )
+        _pools[url] = pool
+
+    return redis.Redis(connection_pool=pool)
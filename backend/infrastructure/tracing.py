@@ -0,0 +1,141 @@
+# infrastructure/tracing.py
+"""
+Tracing wiring for this deployment.
+
+- FileSpanExporter: finished spans as JSON lines (a local stand-in for a
+  collector; see ``manage.py trace_report``)
+- Celery: the publisher's span context travels in the ``traceparent``
+  message header, the worker runs each task in a consumer span under it
+"""
+import json
+import logging
+import os
+import socket
+import threading
+
+from celery import signals
+from django.conf import settings
+
+from core.tracing import TRACEPARENT_HEADER, Span, parse_traceparent, tracer
+from infrastructure.celery_metrics import request_header
+
+logger = logging.getLogger(__name__)
+
+
+class FileSpanExporter:
+    """
+    Appends one JSON line per span.
+
+    Each line is a single O_APPEND write, so web and worker processes can
+    share the file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._fd: int | None = None
+        self._lock = threading.Lock()
+        self._resource = {"host": socket.gethostname()}
+
+    def export(self, span: Span) -> None:
+        record = span.to_dict()
+        record["resource"] = {**self._resource, "pid": os.getpid()}
+        line = json.dumps(record, default=str) + "\n"
+        try:
+            with self._lock:
+                if self._fd is None:
+                    self._fd = os.open(
+                        self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                    )
+                os.write(self._fd, line.encode())
+        except OSError:
+            logger.warning("Span export to %s failed", self.path, exc_info=True)
+
+
+def configure_tracing() -> None:
+    """Set up the global tracer from TRACING_* settings."""
+    if not settings.TRACING_ENABLED:
+        tracer.configure(None)
+        return
+    tracer.configure(
+        FileSpanExporter(settings.TRACING_EXPORT_PATH),
+        sample_rate=settings.TRACING_SAMPLE_RATE,
+    )
+
+
+def read_spans(path: str):
+    """Yields exported span dicts, skipping torn or foreign lines."""
+    with open(path) as spans_file:
+        for line in spans_file:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+# ----- Celery propagation -----
+
+# task_id -> span, per process. Producer spans live from before_task_publish to
+# after_task_publish; consumer spans from task_prerun to task_postrun.
+_publish_spans: dict[str, Span] = {}
+_task_spans: dict[str, tuple] = {}
+
+
+@signals.before_task_publish.connect
+def _on_before_task_publish(sender=None, headers=None, **kwargs):
+    if not tracer.enabled or headers is None:
+        return
+    span = tracer.begin(
+        f"celery.publish {sender}",
+        kind="producer",
+        attributes={"celery.task": sender, "celery.task_id": headers.get("id")},
+    )
+    if not span.recording:
+        return
+    tracer.inject(headers, span)
+    _publish_spans[headers.get("id")] = span
+
+
+@signals.after_task_publish.connect
+def _on_after_task_publish(sender=None, headers=None, **kwargs):
+    span = _publish_spans.pop((headers or {}).get("id"), None)
+    if span is not None:
+        tracer.finish(span)
+
+
+@signals.task_prerun.connect
+def _on_task_prerun(sender=None, task_id=None, task=None, **kwargs):
+    if not tracer.enabled:
+        return
+    # Eager tasks have no header and simply continue the caller's trace
+    parent = parse_traceparent(request_header(task.request, TRACEPARENT_HEADER))
+    span = tracer.begin(
+        f"celery.run {task.name}",
+        parent=parent,
+        kind="consumer",
+        attributes={
+            "celery.task": task.name,
+            "celery.task_id": task_id,
+            "celery.retries": task.request.retries or 0,
+        },
+    )
+    _task_spans[task_id] = (span, tracer.attach(span))
+
+
+@signals.task_postrun.connect
+def _on_task_postrun(sender=None, task_id=None, state=None, **kwargs):
+    entry = _task_spans.pop(task_id, None)
+    if entry is None:
+        return
+    span, token = entry
+    span.set_attribute("celery.state", state)
+    if state not in (None, "SUCCESS", "RETRY"):
+        span.status = "error"
+    tracer.detach(token)
+    tracer.finish(span)
+
+
+@signals.task_failure.connect
+def _on_task_failure(sender=None, task_id=None, exception=None, **kwargs):
+    entry = _task_spans.get(task_id)
+    if entry is not None and exception is not None:
+        entry[0].record_error(exception)
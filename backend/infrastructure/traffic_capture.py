@@ -0,0 +1,132 @@
+# infrastructure/traffic_capture.py
+"""
+Anonymized capture of API traffic for replay (benchmarks/replay.py).
+
+Each captured request becomes one JSON line: start time, method, path, route,
+query params, JSON body, a client pseudonym, whether the caller was staff,
+response status, size and duration. Headers, cookies and IPs are never written.
+
+String values are replaced by keyed pseudonyms (``anon-<hmac>``) unless their
+field is in TRAFFIC_CAPTURE_PLAIN_FIELDS; numbers are kept. Equal inputs map to
+equal pseudonyms, so a client retrying with the same idempotency key replays
+as the same key. Non-JSON bodies are reduced to content type and size.
+
+Every process appends to its own size-rotated file
+(``traffic-<host>-<pid>.jsonl``), so gunicorn workers never interleave writes.
+"""
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import socket
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+# JSON bodies larger than this are recorded by size only
+MAX_CAPTURED_BODY_BYTES = 64 * 1024
+
+# (pid, directory) -> logger writing that process' capture file
+_writers: dict[tuple[int, str], logging.Logger] = {}
+
+
+def pseudonym(value: str) -> str:
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(),
+        value.encode(),
+        hashlib.sha256,
+    ).hexdigest()
+    return f"anon-{digest[:16]}"
+
+
+def anonymize(value, field: str | None = None):
+    """Pseudonymize strings (recursively) unless ``field`` is a plain field."""
+    if isinstance(value, dict):
+        return {key: anonymize(item, key) for key, item in value.items()}
+    if isinstance(value, list):
+        return [anonymize(item, field) for item in value]
+    if isinstance(value, str) and field not in settings.TRAFFIC_CAPTURE_PLAIN_FIELDS:
+        return pseudonym(value)
+    return value
+
+
+def should_capture(request) -> bool:
+    if not settings.TRAFFIC_CAPTURE_ENABLED:
+        return False
+    if not request.path.startswith(settings.TRAFFIC_CAPTURE_PATH_PREFIXES):
+        return False
+    rate = settings.TRAFFIC_CAPTURE_SAMPLE_RATE
+    return rate >= 1 or random.random() < rate
+
+
+def capture_body(request) -> dict:
+    """
+    The anonymized request body, read before the view consumes the stream.
+    """
+    content_type = request.content_type or ""
+    size = int(request.META.get("CONTENT_LENGTH") or 0)
+    if not size:
+        return {}
+    if content_type != "application/json" or size > MAX_CAPTURED_BODY_BYTES:
+        return {"body_type": content_type, "body_bytes": size}
+    try:
+        return {"body": anonymize(json.loads(request.body))}
+    except ValueError:
+        return {"body_type": content_type, "body_bytes": size}
+
+
+def _writer() -> logging.Logger:
+    directory = settings.TRAFFIC_CAPTURE_DIR
+    key = (os.getpid(), directory)
+    writer = _writers.get(key)
+    if writer is None:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        handler = RotatingFileHandler(
+            Path(directory) / f"traffic-{socket.gethostname()}-{key[0]}.jsonl",
+            maxBytes=settings.TRAFFIC_CAPTURE_MAX_BYTES,
+            backupCount=settings.TRAFFIC_CAPTURE_BACKUP_COUNT,
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        writer = logging.getLogger(f"{__name__}.file.{len(_writers)}")
+        writer.handlers = [handler]
+        writer.setLevel(logging.INFO)
+        writer.propagate = False
+        _writers[key] = writer
+    return writer
+
+
+def record_request(
+    request,
+    response,
+    *,
+    body: dict,
+    client: str,
+    started: float,
+    duration: float,
+) -> None:
+    match = getattr(request, "resolver_match", None)
+    user = getattr(request, "user", None)
+    entry = {
+        "ts": round(started, 6),
+        "method": request.method,
+        "path": request.path,
+        "route": f"/{match.route}" if match is not None else None,
+        "query": {
+            name: anonymize(values, name) for name, values in request.GET.lists()
+        },
+        **body,
+        "client": pseudonym(client),
+        "staff": bool(user is not None and user.is_staff),
+        "status": response.status_code,
+        "response_bytes": len(response.content) if not response.streaming else None,
+        "duration_ms": round(duration * 1000, 3),
+    }
+    try:
+        _writer().info(json.dumps(entry, separators=(",", ":")))
+    except OSError:
+        logger.warning("Writing captured request failed", exc_info=True)
@@ -1,6 +1,24 @@
-from django.contrib import admin
+from datetime import datetime
 
-from .models import Payout, Recipient
+from django.contrib import admin, messages
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.contrib.admin.views.main import ChangeList
+from django.db.models import Q
+
+from core.exceptions import DomainPermissionError
+from payouts.application.use_cases import BULK_OUTCOME_UPDATED, BulkChangeStatusUseCase
+from payouts.domain.value_objects import idempotency_key_hash
+from payouts.selectors import estimated_count
+
+from .models import Payout, PayoutIdempotencyKey, Recipient
+
+# Query parameter carrying the keyset cursor: "<created_at iso>,<id>" of the
+# last row on the previous page
+CURSOR_VAR = "before"
+
+# Largest selection a bulk status action applies ("select all" included);
+# same limit as POST /api/payouts/bulk-status/
+BULK_ACTION_MAX_PAYOUTS = 10_000
 
 
 @admin.register(Recipient)
@@ -10,11 +28,166 @@ class RecipientAdmin(admin.ModelAdmin):
     list_filter = ("type", "is_active", "country")
 
 
+class KeysetChangeList(ChangeList):
+    """
+    Changelist paged by (created_at, id) instead of OFFSET, counted from the
+    planner's estimate instead of COUNT(*).
+
+    Every page is an index range scan of list_per_page + 1 rows however deep
+    it is. Pages only go older ("Older") or back to the newest ("Newest").
+    """
+
+    def get_queryset(self, request):
+        # The cursor is not a filter; links built from self.params drop it
+        self.cursor = self.params.pop(CURSOR_VAR, None)
+        return super().get_queryset(request)
+
+    def get_ordering(self, request, queryset):
+        return ["-created_at", "-pk"]
+
+    def get_results(self, request):
+        queryset = self.queryset
+        if self.cursor:
+            created_at, pk = _parse_cursor(self.cursor)
+            # created_at <= cursor bounds the index scan; the OR breaks ties
+            queryset = queryset.filter(
+                Q(created_at__lt=created_at) | Q(pk__lt=pk),
+                created_at__lte=created_at,
+            )
+
+        rows = list(queryset[: self.list_per_page + 1])
+        has_older = len(rows) > self.list_per_page
+        self.result_list = rows[: self.list_per_page]
+
+        self.result_count = estimated_count(self.queryset)
+        self.full_result_count = None
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.can_show_all = False
+        self.multi_page = has_older or bool(self.cursor)
+        self.paginator = None
+
+        last = self.result_list[-1] if has_older else None
+        self.older_url = last and self.get_query_string(
+            {CURSOR_VAR: f"{last.created_at.isoformat()},{last.pk}"}
+        )
+        self.newest_url = self.cursor and self.get_query_string()
+
+
+def _parse_cursor(value: str) -> tuple[datetime, int]:
+    try:
+        created_at, pk = value.rsplit(",", 1)
+        return datetime.fromisoformat(created_at), int(pk)
+    except ValueError:
+        raise IncorrectLookupParameters(f"Invalid cursor: {value!r}")
+
+
 @admin.register(Payout)
 class PayoutAdmin(admin.ModelAdmin):
-    list_display = ("id", "recipient", "amount", "currency", "status", "created_at")
-    search_fields = ("id", "recipient__name")
-    list_filter = ("status", "currency")
+    """
+    Built for a payouts table of tens of millions of rows: no COUNT(*), no
+    OFFSET, no joins on the list page, and filters and search that each map
+    to an index on payouts_payout.
+    """
+
+    list_display = (
+        "id",
+        "recipient_name_snapshot",
+        "amount",
+        "currency",
+        "status",
+        "created_at",
+    )
+    # Snapshots are displayed instead of the recipient: no join
+    list_select_related = ()
+    # Both served by (status, created_at) / created_at; date ranges also
+    # prune partitions
+    list_filter = ("status", ("created_at", admin.DateFieldListFilter))
+    # Ordering is fixed by the keyset
+    sortable_by = ()
+    show_full_result_count = False
+    search_help_text = (
+        "Payout id, exact account number, idempotency key, or recipient name "
+        "prefix (case-sensitive)."
+    )
+    # Recipient select would load every recipient on the change form
+    raw_id_fields = ("recipient",)
+    actions = ("mark_processing", "mark_completed", "mark_failed")
+
+    def get_actions(self, request):
+        # Collects and deletes row by row, with a confirmation page listing
+        # every selected payout
+        actions = super().get_actions(request)
+        actions.pop("delete_selected", None)
+        return actions
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def get_search_fields(self, request):
+        # Non-empty so the changelist renders the search box
+        return ("id",)
+
+    def get_search_results(self, request, queryset, search_term):
+        """Search indexed columns only; never the recipient table."""
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+
+        condition = Q(account_number_snapshot=term) | Q(
+            recipient_name_snapshot__startswith=term
+        )
+        if term.isdigit():
+            condition |= Q(pk=int(term))
+        registered = (
+            PayoutIdempotencyKey.objects.filter(key_hash=idempotency_key_hash(term))
+            .values_list("payout_id", "payout_created_at")
+            .first()
+        )
+        if registered is not None:
+            payout_id, created_at = registered
+            condition |= Q(pk=payout_id, created_at=created_at)
+        return queryset.filter(condition), False
+
+    def _bulk_change_status(self, request, queryset, new_status: str) -> None:
+        ids = list(queryset.values_list("pk", flat=True)[: BULK_ACTION_MAX_PAYOUTS + 1])
+        if len(ids) > BULK_ACTION_MAX_PAYOUTS:
+            self.message_user(
+                request,
+                f"Select at most {BULK_ACTION_MAX_PAYOUTS:,} payouts at a time.",
+                messages.ERROR,
+            )
+            return
+
+        try:
+            outcomes = BulkChangeStatusUseCase.execute(
+                payout_ids=ids, new_status=new_status, actor=request.user
+            )
+        except DomainPermissionError as exc:
+            self.message_user(request, str(exc), messages.ERROR)
+            return
+
+        updated = sum(1 for o in outcomes.values() if o == BULK_OUTCOME_UPDATED)
+        skipped = len(outcomes) - updated
+        self.message_user(
+            request,
+            f"{updated} payout(s) moved to {new_status}; {skipped} skipped "
+            "(transition not allowed, changed concurrently, or gone).",
+            messages.SUCCESS if not skipped else messages.WARNING,
+        )
+
+    @admin.action(
+        description="Mark selected payouts as processing", permissions=["change"]
+    )
+    def mark_processing(self, request, queryset):
+        self._bulk_change_status(request, queryset, Payout.Status.PROCESSING)
 
+    @admin.action(
+        description="Mark selected payouts as completed", permissions=["change"]
+    )
+    def mark_completed(self, request, queryset):
+        self._bulk_change_status(request, queryset, Payout.Status.COMPLETED)
 
-# Register your models here.
+    @admin.action(description="Mark selected payouts as failed", permissions=["change"])
+    def mark_failed(self, request, queryset):
+        self._bulk_change_status(request, queryset, Payout.Status.FAILED)
@@ -1,19 +1,40 @@
 # payouts/api/api.py
+from datetime import timedelta
+
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.permissions import AllowAny, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from infrastructure.payouts.cache import get_paginated_payouts_response_with_cache
+from infrastructure.payouts.inflight import coalesce_payout_create
 from payouts.api.serializers import (
+    PayoutBulkStatusSerializer,
     PayoutCreateSerializer,
+    PayoutListQuerySerializer,
     PayoutPartialUpdateSerializer,
+    PayoutReportQuerySerializer,
+    PayoutReportRowSerializer,
     PayoutSerializer,
+    TimeInStateQuerySerializer,
+)
+from payouts.application.use_cases import (
+    BULK_OUTCOME_UPDATED,
+    BulkChangeStatusUseCase,
+    ChangeStatusUseCase,
+    CreatePayoutUseCase,
 )
-from payouts.application.use_cases import ChangeStatusUseCase, CreatePayoutUseCase
 from payouts.pagination import PayoutCursorPagination
 from payouts.repositories import PayoutRepository
-from payouts.selectors import list_payouts
+from payouts.selectors import (
+    list_payouts,
+    payout_volume_report,
+    time_in_state_percentiles,
+)
+
+# Default reporting window for time-in-state metrics
+TIME_IN_STATE_DEFAULT_WINDOW = timedelta(hours=24)
 
 
 class PayoutListCreateAPIView(APIView):
@@ -24,9 +45,14 @@ class PayoutListCreateAPIView(APIView):
 
     permission_classes = [AllowAny]
     pagination_class = PayoutCursorPagination
+    # Creates are limited harder than reads (GCRAThrottle)
+    throttle_scopes = {"GET": "payouts_list", "POST": "payouts_create"}
 
     def get(self, request):
-        queryset = list_payouts()
+        filters = PayoutListQuerySerializer(data=request.query_params)
+        filters.is_valid(raise_exception=True)
+
+        queryset = list_payouts(**filters.validated_data)
         paginator = self.pagination_class()
 
         return get_paginated_payouts_response_with_cache(
@@ -45,14 +71,17 @@ class PayoutListCreateAPIView(APIView):
         currency = serializer.validated_data["currency"]
         idempotency_key = serializer.validated_data["idempotency_key"]
 
-        payout, is_duplicate = CreatePayoutUseCase.execute(
-            recipient_id=recipient_id,
-            amount=amount,
-            currency=currency,
-            idempotency_key=idempotency_key,
-        )
-
-        response_data = PayoutSerializer(payout).data
+        def create():
+            payout, is_duplicate = CreatePayoutUseCase.execute(
+                recipient_id=recipient_id,
+                amount=amount,
+                currency=currency,
+                idempotency_key=idempotency_key,
+            )
+            return PayoutSerializer(payout).data, is_duplicate
+
+        # Concurrent duplicates of this request wait for its result
+        response_data, is_duplicate = coalesce_payout_create(idempotency_key, create)
         status_code = status.HTTP_200_OK if is_duplicate else status.HTTP_201_CREATED
 
         return Response(response_data, status=status_code)
@@ -93,5 +122,98 @@ class PayoutDetailAPIView(APIView):
 
     def delete(self, request, pk: int):
         payout = PayoutRepository.get_by_id(pk)
-        payout.delete()
+        PayoutRepository.delete(payout)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class PayoutBulkStatusAPIView(APIView):
+    """
+    POST /api/payouts/bulk-status/ — move many payouts to one status (admin only)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def post(self, request):
+        serializer = PayoutBulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        outcomes = BulkChangeStatusUseCase.execute(
+            payout_ids=serializer.validated_data["ids"],
+            new_status=serializer.validated_data["status"],
+            actor=request.user,
+        )
+
+        return Response(
+            {
+                "status": serializer.validated_data["status"],
+                "updated": sum(
+                    1
+                    for outcome in outcomes.values()
+                    if outcome == BULK_OUTCOME_UPDATED
+                ),
+                "results": [
+                    {"id": payout_id, "outcome": outcome}
+                    for payout_id, outcome in outcomes.items()
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class PayoutTimeInStateAPIView(APIView):
+    """
+    GET /api/payouts/time-in-state/ — time-in-state percentiles per status
+    over a window (admin only). Defaults to the last 24 hours.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        serializer = TimeInStateQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+
+        until = serializer.validated_data.get("until") or timezone.now()
+        since = serializer.validated_data.get("since") or (
+            until - TIME_IN_STATE_DEFAULT_WINDOW
+        )
+
+        return Response(
+            {
+                "since": since,
+                "until": until,
+                "statuses": time_in_state_percentiles(since=since, until=until),
+            }
+        )
+
+
+class PayoutReportAPIView(APIView):
+    """
+    GET /api/payouts/reports/ — payout count and amount per day, currency,
+    status and/or recipient over a date range (admin only). Served from the
+    daily rollups, never from payouts_payout.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        serializer = PayoutReportQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        rows = payout_volume_report(
+            date_from=params["date_from"],
+            date_to=params["date_to"],
+            group_by=params["group_by"],
+            currency=params.get("currency"),
+            status=params.get("status"),
+            recipient_id=params.get("recipient_id"),
+        )
+
+        return Response(
+            {
+                "date_from": params["date_from"],
+                "date_to": params["date_to"],
+                "group_by": list(params["group_by"]),
+                "rows": PayoutReportRowSerializer(rows, many=True).data,
+            }
+        )
@@ -2,6 +2,10 @@
 from rest_framework import serializers
 
 from payouts.models import Payout
+from payouts.selectors import REPORT_DIMENSIONS
+
+# Longest date range GET /api/payouts/reports/ accepts
+REPORT_MAX_DAYS = 366
 
 
 class PayoutSerializer(serializers.ModelSerializer):
@@ -36,3 +40,75 @@ class PayoutPartialUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = Payout
         fields = ["status"]
+
+
+class PayoutListQuerySerializer(serializers.Serializer):
+    created_from = serializers.DateTimeField(required=False)
+    created_to = serializers.DateTimeField(required=False)
+
+
+class PayoutBulkStatusSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=10000,
+    )
+    status = serializers.ChoiceField(choices=Payout.Status.choices)
+
+
+class TimeInStateQuerySerializer(serializers.Serializer):
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+
+    def validate(self, attrs):
+        since = attrs.get("since")
+        until = attrs.get("until")
+        if since and until and since >= until:
+            raise serializers.ValidationError("'since' must be before 'until'.")
+        return attrs
+
+
+class PayoutReportQuerySerializer(serializers.Serializer):
+    date_from = serializers.DateField()
+    date_to = serializers.DateField()
+    group_by = serializers.CharField(required=False, default="day,currency,status")
+    currency = serializers.CharField(required=False, max_length=3)
+    status = serializers.ChoiceField(choices=Payout.Status.choices, required=False)
+    recipient_id = serializers.IntegerField(required=False, min_value=1)
+
+    def validate_group_by(self, value):
+        dimensions = tuple(
+            dict.fromkeys(s for s in (d.strip() for d in value.split(",")) if s)
+        )
+        unknown = [d for d in dimensions if d not in REPORT_DIMENSIONS]
+        if not dimensions or unknown:
+            raise serializers.ValidationError(
+                f"Use a comma-separated subset of: {', '.join(REPORT_DIMENSIONS)}."
+            )
+        return dimensions
+
+    def validate_currency(self, value):
+        # Rollups store upper-case codes, as Money normalizes them
+        return value.upper()
+
+    def validate(self, attrs):
+        days = (attrs["date_to"] - attrs["date_from"]).days + 1
+        if days < 1:
+            raise serializers.ValidationError(
+                "'date_from' must not be after 'date_to'."
+            )
+        if days > REPORT_MAX_DAYS:
+            raise serializers.ValidationError(
+                f"Date range is limited to {REPORT_MAX_DAYS} days."
+            )
+        return attrs
+
+
+class PayoutReportRowSerializer(serializers.Serializer):
+    # Only the grouped dimensions are present in a row
+    day = serializers.DateField(required=False)
+    currency = serializers.CharField(required=False)
+    status = serializers.CharField(required=False)
+    recipient_id = serializers.IntegerField(required=False)
+    payout_count = serializers.IntegerField()
+    amount_total = serializers.DecimalField(max_digits=20, decimal_places=2)
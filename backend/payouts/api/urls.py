@@ -1,6 +1,12 @@
 from django.urls import path
 
-from .api import PayoutDetailAPIView, PayoutListCreateAPIView
+from .api import (
+    PayoutBulkStatusAPIView,
+    PayoutDetailAPIView,
+    PayoutListCreateAPIView,
+    PayoutReportAPIView,
+    PayoutTimeInStateAPIView,
+)
 
 urlpatterns = [
     # GET  /api/payouts/     — list payouts
@@ -10,4 +16,22 @@ urlpatterns = [
     # PATCH  /api/payouts/<id>/ — update status
     # DELETE /api/payouts/<id>/ — delete payout
     path("<int:pk>/", PayoutDetailAPIView.as_view(), name="payouts-detail"),
+    # POST /api/payouts/bulk-status/ — set-based status change (admin only)
+    path(
+        "bulk-status/",
+        PayoutBulkStatusAPIView.as_view(),
+        name="payouts-bulk-status",
+    ),
+    # GET /api/payouts/time-in-state/ — status SLA percentiles (admin only)
+    path(
+        "time-in-state/",
+        PayoutTimeInStateAPIView.as_view(),
+        name="payouts-time-in-state",
+    ),
+    # GET /api/payouts/reports/ — daily volume rollups (admin only)
+    path(
+        "reports/",
+        PayoutReportAPIView.as_view(),
+        name="payouts-reports",
+    ),
 ]
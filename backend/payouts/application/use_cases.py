@@ -1,8 +1,10 @@
 import logging
 
 from django.db import IntegrityError, transaction
+from django.utils import timezone
 
 from core.event_bus import event_bus
+from core.tracing import traced, tracer
 from payouts.domain.services import (
     build_idempotency_key,
     build_money,
@@ -10,11 +12,33 @@ from payouts.domain.services import (
     build_payout_status,
     change_status,
 )
-from payouts.events import PayoutCreated
-from payouts.repositories import PayoutRepository, RecipientRepository
+from payouts.domain.validators import (
+    ensure_can_change_payout_status,
+    group_bulk_status_transitions,
+)
+from payouts.events import PayoutCreated, PayoutStatusesChanged
+from payouts.metrics import (
+    PAYOUTS_CREATED,
+    PAYOUTS_IDEMPOTENCY_RACES_LOST,
+    PAYOUTS_IDEMPOTENT_REPLAYS,
+)
+from payouts.repositories import (
+    PayoutRepository,
+    PayoutStatusHistoryBuffer,
+    PayoutStatusHistoryRepository,
+    RecipientRepository,
+)
 
 logger = logging.getLogger(__name__)
 
+# Per-id outcomes reported by BulkChangeStatusUseCase (besides domain rejections)
+BULK_OUTCOME_UPDATED = "updated"
+BULK_OUTCOME_NOT_FOUND = "not_found"
+BULK_OUTCOME_CONFLICT = "conflict"
+
+# Upper bound for ids in a single IN (...) list
+BULK_STATUS_CHUNK_SIZE = 1000
+
 
 # payouts/application/use_cases.py
 class CreatePayoutUseCase:
@@ -32,6 +56,7 @@ class CreatePayoutUseCase:
     """
 
     @staticmethod
+    @traced()
     @transaction.atomic
     def execute(*, recipient_id, amount, currency, idempotency_key):
         # Fetch recipient entity through repository abstraction
@@ -50,6 +75,8 @@ class CreatePayoutUseCase:
                 key.value,
                 existing.id,
             )
+            PAYOUTS_IDEMPOTENT_REPLAYS.inc()
+            tracer.current_span().set_attribute("payout.id", existing.id)
             return existing, True
 
         # Instantiate domain entity via factory — keeps business rules in domain layer
@@ -73,6 +100,7 @@ class CreatePayoutUseCase:
                 payout.id,
                 recipient.id,
             )
+            PAYOUTS_IDEMPOTENCY_RACES_LOST.inc()
             return payout, True
 
         logger.info(
@@ -82,12 +110,16 @@ class CreatePayoutUseCase:
             money.amount,
             money.currency,
         )
+        tracer.current_span().set_attribute("payout.id", payout.id)
 
         # Publish domain event AFTER transaction is committed.
         # Guarantees event is sent only if DB write succeeded.
         transaction.on_commit(
             lambda: event_bus.publish(PayoutCreated(payout_id=payout.id))
         )
+        transaction.on_commit(
+            lambda: PAYOUTS_CREATED.labels(currency=money.currency).inc()
+        )
 
         return payout, False
 
@@ -99,16 +131,19 @@ class ChangeStatusUseCase:
     Responsibilities:
     - Validate and convert status value into domain VO
     - Delegate business rule enforcement to domain service
-    - Persist updated entity
+    - Persist the new status with a compare-and-set against the old one
+    - Append the transition to the status history
     - Keep all operations transactional
 
     This layer coordinates; it does NOT implement business rules.
     """
 
     @staticmethod
+    @traced()
     @transaction.atomic
-    def execute(*, payout, new_status, actor):
+    def execute(*, payout, new_status, actor, fencing_token=None):
         old_status = payout.status
+        entered_at = payout.updated_at
 
         # Translate raw status into domain Value Object — ensures validity
         status_vo = build_payout_status(new_status)
@@ -120,8 +155,23 @@ class ChangeStatusUseCase:
             actor=actor,
         )
 
-        # Persist updated entity
-        updated = PayoutRepository.save(payout)
+        # Persist only the status change; raises DomainConflictError if the
+        # row left old_status concurrently (lost race with another writer), or
+        # a newer processing lease claimed it (fencing_token no longer matches)
+        updated = PayoutRepository.update_status(
+            payout, expected_status=old_status, fencing_token=fencing_token
+        )
+
+        PayoutStatusHistoryRepository.add(
+            PayoutStatusHistoryRepository.build_entry(
+                payout_id=updated.id,
+                from_status=old_status,
+                to_status=updated.status,
+                entered_at=entered_at,
+                changed_at=updated.updated_at,
+                actor_id=getattr(actor, "id", None),
+            )
+        )
 
         logger.info(
             "Payout status changed: id=%s, %s -> %s, actor=%s",
@@ -132,3 +182,105 @@ class ChangeStatusUseCase:
         )
 
         return updated
+
+
+class BulkChangeStatusUseCase:
+    """
+    Application-level orchestration for moving many payouts to one status.
+
+    Responsibilities:
+    - Check actor permissions once for the whole batch
+    - Lock the affected rows and validate transitions as a set
+    - Apply one UPDATE per (chunk, current status) group
+    - Bulk-insert the status history rows
+    - Publish one batch event per group after commit
+    - Report a per-id outcome
+
+    This layer coordinates; transition rules live in the domain validators.
+    """
+
+    @staticmethod
+    @traced()
+    @transaction.atomic
+    def execute(*, payout_ids, new_status, actor) -> dict[int, str]:
+        status_vo = build_payout_status(new_status)
+        ensure_can_change_payout_status(
+            actor=actor,
+            payout=None,
+            new_status=status_vo,
+        )
+
+        # Chunks are locked in ascending id order across the whole request, so
+        # overlapping bulk requests cannot take row locks in opposite orders;
+        # the outcome map keeps request order
+        requested = list(dict.fromkeys(payout_ids))
+        ids = sorted(requested)
+        outcomes: dict[int, str] = {}
+        history = PayoutStatusHistoryBuffer()
+        changed_at = timezone.now()
+        actor_id = getattr(actor, "id", None)
+
+        for start in range(0, len(ids), BULK_STATUS_CHUNK_SIZE):
+            chunk = ids[start : start + BULK_STATUS_CHUNK_SIZE]
+
+            rows = PayoutRepository.lock_status_rows(chunk)
+            entered_at = {row[0]: row[3] for row in rows}
+            created_at = {row[0]: row[4] for row in rows}
+            allowed_by_status, rejected = group_bulk_status_transitions(
+                (row[:3] for row in rows), status_vo
+            )
+            outcomes.update(rejected)
+
+            for old_status, group_ids in allowed_by_status.items():
+                updated_ids = PayoutRepository.bulk_update_status(
+                    group_ids,
+                    created_at=[created_at[payout_id] for payout_id in group_ids],
+                    expected_status=old_status,
+                    new_status=status_vo.value,
+                    updated_at=changed_at,
+                )
+                # Rows are locked above; ids the UPDATE did not return are
+                # reported as conflicts and get no history row or event
+                outcomes.update(dict.fromkeys(group_ids, BULK_OUTCOME_CONFLICT))
+                outcomes.update(dict.fromkeys(updated_ids, BULK_OUTCOME_UPDATED))
+                if not updated_ids:
+                    continue
+
+                for payout_id in updated_ids:
+                    history.add(
+                        PayoutStatusHistoryRepository.build_entry(
+                            payout_id=payout_id,
+                            from_status=old_status,
+                            to_status=status_vo.value,
+                            entered_at=entered_at[payout_id],
+                            changed_at=changed_at,
+                            actor_id=actor_id,
+                        )
+                    )
+
+                transaction.on_commit(
+                    lambda ids=tuple(
+                        sorted(updated_ids)
+                    ), old=old_status: event_bus.publish(
+                        PayoutStatusesChanged(
+                            payout_ids=ids,
+                            old_status=old,
+                            new_status=status_vo.value,
+                        )
+                    )
+                )
+
+        history.flush()
+
+        for payout_id in ids:
+            outcomes.setdefault(payout_id, BULK_OUTCOME_NOT_FOUND)
+
+        logger.info(
+            "Bulk payout status change: target=%s, requested=%s, updated=%s, actor=%s",
+            status_vo.value,
+            len(ids),
+            sum(1 for o in outcomes.values() if o == BULK_OUTCOME_UPDATED),
+            getattr(actor, "id", None) if actor else "system",
+        )
+
+        return {payout_id: outcomes[payout_id] for payout_id in requested}
@@ -7,3 +7,6 @@ class PayoutsConfig(AppConfig):
 
     def ready(self) -> None:
         import infrastructure.payouts.event_handlers  # noqa: F401
+        from infrastructure.tracing import configure_tracing
+
+        configure_tracing()
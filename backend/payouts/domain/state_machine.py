@@ -0,0 +1,174 @@
+# payouts/domain/state_machine.py
+"""
+Declarative payout state machine.
+
+The legal ``current -> target`` status moves are declared once. Everything
+else is derived from that declaration when the machine is built:
+
+- lookup tables for single transitions, for source statuses of a target, and
+  for the set of legal (current, target) pairs
+- batch checks over many (current, target) pairs
+- a PostgreSQL trigger enforcing the same rules, so UPDATEs that bypass the
+  domain (set-based bulk updates, admin actions, ad-hoc SQL) cannot make an
+  illegal move either
+
+The trigger is installed by a migration built from a frozen copy of the
+transitions. When PAYOUT_STATUS_TRANSITIONS changes, add a migration that
+re-creates the trigger (tests fail until the installed function matches).
+"""
+from typing import Iterable, Mapping, Sequence
+
+from core.exceptions import DomainValidationError
+from payouts.models import Payout
+
+
+class StateMachine:
+    """Precomputed transition table for a set of string states."""
+
+    def __init__(self, transitions: Mapping[str, Iterable[str]]) -> None:
+        self.states: tuple[str, ...] = tuple(str(state) for state in transitions)
+        self.transitions: dict[str, frozenset[str]] = {
+            str(current): frozenset(str(target) for target in targets)
+            for current, targets in transitions.items()
+        }
+
+        unknown = set().union(*self.transitions.values()) - set(self.states)
+        if unknown:
+            raise ValueError(f"Transitions to undeclared states: {sorted(unknown)}")
+
+        self.pairs: frozenset[tuple[str, str]] = frozenset(
+            (current, target)
+            for current, targets in self.transitions.items()
+            for target in targets
+        )
+        self._sources: dict[str, frozenset[str]] = {
+            state: frozenset(
+                current
+                for current, targets in self.transitions.items()
+                if state in targets
+            )
+            for state in self.states
+        }
+        self.terminal: frozenset[str] = frozenset(
+            state for state, targets in self.transitions.items() if not targets
+        )
+
+    def allowed_targets(self, current: str) -> frozenset[str]:
+        return self.transitions.get(current, frozenset())
+
+    def sources(self, target: str) -> frozenset[str]:
+        """States from which ``target`` may be entered."""
+        return self._sources.get(target, frozenset())
+
+    def can(self, current: str, target: str) -> bool:
+        return (current, target) in self.pairs
+
+    def validate(self, current: str, target: str) -> None:
+        if (current, target) not in self.pairs:
+            raise DomainValidationError(
+                f"Invalid status transition from {current} to {target}"
+            )
+
+    def check_many(
+        self,
+        currents: Sequence[str],
+        targets: str | Sequence[str],
+    ) -> list[bool]:
+        """
+        Legality of each ``currents[i] -> targets[i]`` move.
+
+        :param currents: current statuses
+        :param targets: one target shared by the batch, or one per current
+        :return: one flag per current, in input order
+        """
+        if isinstance(targets, str):
+            sources = self.sources(targets)
+            return [current in sources for current in currents]
+        if len(targets) != len(currents):
+            raise ValueError("currents and targets must have the same length")
+        pairs = self.pairs
+        return [pair in pairs for pair in zip(currents, targets)]
+
+    # ------------------------------------------------------------------
+    # Database enforcement
+    # ------------------------------------------------------------------
+
+    def trigger_function_body(self, column: str) -> str:
+        """PL/pgSQL body rejecting illegal changes of ``column``."""
+        branches = "".join(
+            f"\n        WHEN {_literal(current)} THEN "
+            f"{_in_list(f'NEW.{_identifier(column)}', targets)}"
+            for current, targets in self.transitions.items()
+        )
+        return f"""
+BEGIN
+    IF NEW.{_identifier(column)} IS DISTINCT FROM OLD.{_identifier(column)}
+       AND NOT COALESCE(CASE OLD.{_identifier(column)}{branches}
+        ELSE FALSE
+    END, FALSE) THEN
+        RAISE EXCEPTION 'Invalid status transition from % to %',
+            OLD.{_identifier(column)}, NEW.{_identifier(column)}
+            USING ERRCODE = 'check_violation', TABLE = TG_TABLE_NAME;
+    END IF;
+    RETURN NEW;
+END
+"""
+
+    def create_trigger_sql(self, table: str, column: str) -> str:
+        """
+        SQL installing (or replacing) a BEFORE UPDATE OF ``column`` trigger on
+        ``table``. On a partitioned table the trigger is cloned to every
+        current and future partition.
+        """
+        function, trigger = _trigger_names(table, column)
+        return f"""
+CREATE OR REPLACE FUNCTION {function}() RETURNS trigger
+LANGUAGE plpgsql AS $body${self.trigger_function_body(column)}$body$;
+
+DROP TRIGGER IF EXISTS {trigger} ON {_identifier(table)};
+CREATE TRIGGER {trigger}
+    BEFORE UPDATE OF {_identifier(column)} ON {_identifier(table)}
+    FOR EACH ROW EXECUTE FUNCTION {function}();
+"""
+
+
+def drop_trigger_sql(table: str, column: str) -> str:
+    function, trigger = _trigger_names(table, column)
+    return f"""
+DROP TRIGGER IF EXISTS {trigger} ON {_identifier(table)};
+DROP FUNCTION IF EXISTS {function}();
+"""
+
+
+def trigger_function_name(table: str, column: str) -> str:
+    return _trigger_names(table, column)[0]
+
+
+def _trigger_names(table: str, column: str) -> tuple[str, str]:
+    return f"{table}_check_{column}_transition", f"{table}_{column}_transition"
+
+
+def _identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _literal(value: str) -> str:
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _in_list(expression: str, values: Iterable[str]) -> str:
+    values = sorted(values)
+    if not values:
+        return "FALSE"
+    return f"{expression} IN ({', '.join(_literal(value) for value in values)})"
+
+
+# Payout lifecycle: current status → statuses it may move to
+PAYOUT_STATUS_TRANSITIONS: dict[str, tuple[str, ...]] = {
+    Payout.Status.NEW: (Payout.Status.PROCESSING, Payout.Status.FAILED),
+    Payout.Status.PROCESSING: (Payout.Status.COMPLETED, Payout.Status.FAILED),
+    Payout.Status.COMPLETED: (),
+    Payout.Status.FAILED: (),
+}
+
+PAYOUT_STATUS_MACHINE = StateMachine(PAYOUT_STATUS_TRANSITIONS)
@@ -1,9 +1,21 @@
 # payouts/domain/validators.py
+from collections import defaultdict
+from typing import Iterable
 
 from core.exceptions import DomainPermissionError, DomainValidationError
+from payouts.domain.state_machine import PAYOUT_STATUS_MACHINE
 from payouts.domain.value_objects import PayoutStatus
 from payouts.models import Payout, Recipient
 
+# Current status → statuses it may move to (see domain.state_machine)
+ALLOWED_STATUS_TRANSITIONS: dict[str, frozenset[str]] = (
+    PAYOUT_STATUS_MACHINE.transitions
+)
+
+# Per-id rejection reasons reported by bulk transitions
+BULK_REJECT_INVALID_TRANSITION = "invalid_transition"
+BULK_REJECT_RECIPIENT_INACTIVE = "recipient_inactive"
+
 
 def validate_recipient_active(
     recipient: Recipient,
@@ -28,13 +40,6 @@ def validate_payout_status_transition(
     Validate that the payout status transition is allowed.
     Includes a rule for inactive recipients.
     """
-    allowed_transitions: dict[str, set[str]] = {
-        Payout.Status.NEW: {Payout.Status.PROCESSING, Payout.Status.FAILED},
-        Payout.Status.PROCESSING: {Payout.Status.COMPLETED, Payout.Status.FAILED},
-        Payout.Status.COMPLETED: set(),
-        Payout.Status.FAILED: set(),
-    }
-
     new_value = new_status.value
 
     # Domain rule for inactive recipient — reuse shared validator
@@ -43,19 +48,41 @@ def validate_payout_status_transition(
         message="Cannot process payout: recipient is no longer active.",
     )
 
-    current_status = payout.status
-    allowed = allowed_transitions.get(current_status, set())
+    PAYOUT_STATUS_MACHINE.validate(payout.status, new_value)
+
+
+def group_bulk_status_transitions(
+    rows: Iterable[tuple[int, str, bool]],
+    new_status: PayoutStatus,
+) -> tuple[dict[str, list[int]], dict[int, str]]:
+    """
+    Set-based counterpart of validate_payout_status_transition.
+
+    :param rows: (payout_id, current_status, recipient_is_active) tuples
+    :param new_status: target status shared by the whole batch
+    :return: allowed payout ids grouped by current status,
+             and rejected payout ids mapped to a rejection reason
+    """
+    source_statuses = PAYOUT_STATUS_MACHINE.sources(new_status.value)
+
+    allowed_by_status: dict[str, list[int]] = defaultdict(list)
+    rejected: dict[int, str] = {}
+
+    for payout_id, current_status, recipient_is_active in rows:
+        if not recipient_is_active:
+            rejected[payout_id] = BULK_REJECT_RECIPIENT_INACTIVE
+        elif current_status not in source_statuses:
+            rejected[payout_id] = BULK_REJECT_INVALID_TRANSITION
+        else:
+            allowed_by_status[current_status].append(payout_id)
 
-    if new_value not in allowed:
-        raise DomainValidationError(
-            f"Invalid status transition from {current_status} to {new_value}"
-        )
+    return dict(allowed_by_status), rejected
 
 
 def ensure_can_change_payout_status(
     *,
     actor,
-    payout: Payout,
+    payout: Payout | None,
     new_status: PayoutStatus,
 ) -> None:
     """
@@ -63,6 +90,7 @@ def ensure_can_change_payout_status(
 
     - HTTP requests pass actor=request.user
     - System calls (Celery, etc.) use actor=None
+    - Bulk transitions pass payout=None (the check is per actor, not per row)
     """
     # System calls (Celery, etc.) use actor=None
     if actor is None:
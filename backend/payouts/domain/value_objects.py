@@ -1,3 +1,5 @@
+import hashlib
+import uuid
 from dataclasses import dataclass
 from decimal import Decimal
 
@@ -23,6 +25,14 @@ class Money:
         object.__setattr__(self, "currency", code)
 
 
+def idempotency_key_hash(value: str) -> uuid.UUID:
+    """
+    Fixed-width (16-byte) digest of a normalized idempotency key: the first
+    half of its SHA-256, stored as a PostgreSQL uuid.
+    """
+    return uuid.UUID(bytes=hashlib.sha256(value.encode()).digest()[:16])
+
+
 @dataclass(frozen=True)
 class IdempotencyKey:
     value: str
@@ -33,6 +43,10 @@ class IdempotencyKey:
             raise DomainValidationError("Invalid idempotency key length.")
         object.__setattr__(self, "value", v)
 
+    @property
+    def hash(self) -> uuid.UUID:
+        return idempotency_key_hash(self.value)
+
 
 @dataclass(frozen=True)
 class PayoutStatus:
@@ -1,5 +1,6 @@
 # payouts/events.py
 from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass(frozen=True)
@@ -12,3 +13,12 @@ class PayoutStatusChanged:
     payout_id: int
     old_status: str
     new_status: str
+
+
+@dataclass(frozen=True)
+class PayoutStatusesChanged:
+    """Batch of payouts moved from one status to another in a single UPDATE."""
+
+    payout_ids: Tuple[int, ...]
+    old_status: str
+    new_status: str
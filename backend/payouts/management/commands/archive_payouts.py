@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from infrastructure.payouts.archive import archive_terminal_payouts
+
+
+class Command(BaseCommand):
+    help = (
+        "Move COMPLETED / FAILED payouts older than the cutoff from "
+        "payouts_payout into payouts_payout_archive."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.PAYOUT_ARCHIVE_AFTER_DAYS,
+            metavar="DAYS",
+            help="Archive terminal payouts created more than DAYS days ago.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PAYOUT_ARCHIVE_BATCH_SIZE,
+            help="Rows moved per transaction.",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: until done).",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than_days"] < 1:
+            raise CommandError("--older-than-days must be >= 1")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be >= 1")
+
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        archived = archive_terminal_payouts(
+            cutoff=cutoff,
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+        )
+        self.stdout.write(
+            f"Archived {archived} payout(s) created before {cutoff.isoformat()}"
+        )
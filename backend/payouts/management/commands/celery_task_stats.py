@@ -0,0 +1,57 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from config.celery import app
+from infrastructure.celery_metrics import sample_queue_depths, summarize_task_metrics
+
+
+def _seconds(value) -> str:
+    return "-" if value is None else f"{value:.3f}s"
+
+
+class Command(BaseCommand):
+    help = (
+        "Show broker queue depth and per-task queue wait / runtime / retries / "
+        "outcomes collected by this host's Celery workers "
+        "(reads PROMETHEUS_MULTIPROC_DIR when set)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--json",
+            action="store_true",
+            help="Print machine-readable JSON.",
+        )
+
+    def handle(self, *args, **options):
+        queues = sorted(app.amqp.queues.keys()) or [app.conf.task_default_queue]
+        depths = sample_queue_depths(queues)
+        tasks = summarize_task_metrics()
+
+        if options["json"]:
+            self.stdout.write(json.dumps({"queues": depths, "tasks": tasks}))
+            return
+
+        self.stdout.write("Queues:")
+        for queue, depth in depths.items():
+            self.stdout.write(f"  {queue}: {'unavailable' if depth is None else depth}")
+
+        self.stdout.write("Tasks:")
+        if not tasks:
+            self.stdout.write("  no samples collected")
+        for name, stats in sorted(tasks.items()):
+            wait, runtime = stats["queue_wait"], stats["runtime"]
+            outcomes = ", ".join(
+                f"{outcome}={count}"
+                for outcome, count in sorted(stats["outcomes"].items())
+            )
+            self.stdout.write(
+                f"  {name}\n"
+                f"    runs={runtime.get('count', 0)} retries={stats['retries']} "
+                f"outcomes: {outcomes or '-'}\n"
+                f"    queue wait mean={_seconds(wait.get('mean'))} "
+                f"p95={_seconds(wait.get('p95'))}\n"
+                f"    runtime    mean={_seconds(runtime.get('mean'))} "
+                f"p95={_seconds(runtime.get('p95'))}"
+            )
@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from infrastructure.payouts.idempotency import expire_idempotency_keys
+
+
+class Command(BaseCommand):
+    help = (
+        "Remove payout idempotency keys older than the retention window from "
+        "payouts_payout_idempotency_key."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=settings.PAYOUT_IDEMPOTENCY_KEY_RETENTION_DAYS,
+            metavar="DAYS",
+            help="Expire keys registered more than DAYS days ago.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.PAYOUT_IDEMPOTENCY_KEY_EXPIRY_BATCH_SIZE,
+            help="Keys deleted per transaction.",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="Stop after this many batches (default: until done).",
+        )
+
+    def handle(self, *args, **options):
+        if options["older_than_days"] < 1:
+            raise CommandError("--older-than-days must be >= 1")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be >= 1")
+
+        cutoff = timezone.now() - timedelta(days=options["older_than_days"])
+        expired = expire_idempotency_keys(
+            cutoff=cutoff,
+            batch_size=options["batch_size"],
+            max_batches=options["max_batches"],
+        )
+        self.stdout.write(
+            f"Expired {expired} idempotency key(s) registered before "
+            f"{cutoff.isoformat()}"
+        )
@@ -0,0 +1,22 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from config.interfaces.http.authentication import issue_token
+
+
+class Command(BaseCommand):
+    help = (
+        "Print a signed API bearer token for a user "
+        "(valid for API_TOKEN_MAX_AGE_SECONDS)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("username")
+
+    def handle(self, *args, **options):
+        User = get_user_model()
+        try:
+            user = User.objects.get(username=options["username"], is_active=True)
+        except User.DoesNotExist:
+            raise CommandError(f"No active user {options['username']!r}")
+        self.stdout.write(issue_token(user))
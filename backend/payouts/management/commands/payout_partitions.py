@@ -0,0 +1,53 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.payouts.partitions import (
+    add_months,
+    detach_payout_partitions,
+    ensure_payout_partitions,
+    list_payout_partitions,
+    payout_partition_name,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Manage monthly partitions of payouts_payout: create partitions ahead "
+        "of time and detach old ones."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ensure-ahead",
+            type=int,
+            metavar="MONTHS",
+            help="Create missing partitions up to MONTHS months in the future.",
+        )
+        parser.add_argument(
+            "--detach-older-than",
+            type=int,
+            metavar="MONTHS",
+            help="Detach partitions that ended more than MONTHS months ago.",
+        )
+
+    def handle(self, *args, **options):
+        ensure_ahead = options["ensure_ahead"]
+        detach_older_than = options["detach_older_than"]
+
+        if ensure_ahead is not None:
+            if ensure_ahead < 0:
+                raise CommandError("--ensure-ahead must be >= 0")
+            created = ensure_payout_partitions(months_ahead=ensure_ahead)
+            self.stdout.write(f"Created {len(created)} partition(s): {created}")
+
+        if detach_older_than is not None:
+            if detach_older_than < 1:
+                raise CommandError("--detach-older-than must be >= 1")
+            cutoff = add_months(date.today().replace(day=1), -detach_older_than)
+            detached = detach_payout_partitions(older_than=cutoff)
+            self.stdout.write(f"Detached {len(detached)} partition(s): {detached}")
+
+        if ensure_ahead is None and detach_older_than is None:
+            for month in list_payout_partitions():
+                self.stdout.write(payout_partition_name(month))
@@ -0,0 +1,52 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.payouts.rollups import (
+    recompute_payout_rollups,
+    refresh_payout_rollups,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute the daily payout rollups for days whose payouts changed, "
+        "or for every day in --from/--to (backfill, repair)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from",
+            dest="date_from",
+            type=date.fromisoformat,
+            metavar="YYYY-MM-DD",
+            help="First day to recompute, changed or not.",
+        )
+        parser.add_argument(
+            "--to",
+            dest="date_to",
+            type=date.fromisoformat,
+            metavar="YYYY-MM-DD",
+            help="Last day to recompute (default: --from).",
+        )
+        parser.add_argument(
+            "--max-days",
+            type=int,
+            default=None,
+            help="Without --from: stop after this many changed days.",
+        )
+
+    def handle(self, *args, **options):
+        date_from = options["date_from"]
+        if date_from is None:
+            if options["date_to"] is not None:
+                raise CommandError("--to requires --from")
+            days = len(refresh_payout_rollups(max_days=options["max_days"]))
+            self.stdout.write(f"Refreshed {days} changed day(s)")
+            return
+
+        date_to = options["date_to"] or date_from
+        if date_to < date_from:
+            raise CommandError("--to must not be before --from")
+        days = recompute_payout_rollups(date_from=date_from, date_to=date_to)
+        self.stdout.write(f"Recomputed {days} day(s)")
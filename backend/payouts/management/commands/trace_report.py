@@ -0,0 +1,105 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from infrastructure.tracing import read_spans
+
+# Attributes shown next to the span name
+_SHOWN_ATTRIBUTES = (
+    "http.status_code",
+    "payout.id",
+    "celery.task_id",
+    "celery.retries",
+    "celery.state",
+    "cache.result",
+)
+
+
+def _render(spans: list[dict]) -> list[str]:
+    """Span tree, children ordered by start time, offsets from trace start."""
+    ids = {span["span_id"] for span in spans}
+    children: dict[str | None, list[dict]] = {}
+    for span in spans:
+        parent = span["parent_id"] if span["parent_id"] in ids else None
+        children.setdefault(parent, []).append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda span: span["start_time"])
+
+    trace_start = min(span["start_time"] for span in spans)
+    lines = []
+
+    def walk(span: dict, depth: int) -> None:
+        offset_ms = (span["start_time"] - trace_start) * 1000
+        duration = span["duration_ms"]
+        resource = span.get("resource") or {}
+        details = " ".join(
+            f"{key}={span['attributes'][key]}"
+            for key in _SHOWN_ATTRIBUTES
+            if key in span["attributes"]
+        )
+        if span["status"] == "error":
+            details = f"ERROR({span['error'] or ''}) {details}"
+        lines.append(
+            f"{offset_ms:>10.1f}ms {duration if duration is not None else 0:>10.1f}ms  "
+            f"{'  ' * depth}{span['name']}  "
+            f"[{span['kind']} pid={resource.get('pid', '?')}] {details}".rstrip()
+        )
+        for child in children.get(span["span_id"], []):
+            walk(child, depth + 1)
+
+    for root in children.get(None, []):
+        walk(root, 0)
+    return lines
+
+
+class Command(BaseCommand):
+    help = (
+        "Print exported spans as a tree (offset from trace start, duration), "
+        "by trace id or for every trace touching a payout."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("trace_id", nargs="?", help="Trace id (X-Trace-Id).")
+        parser.add_argument(
+            "--payout-id",
+            type=int,
+            help="Show every trace with a span for this payout.",
+        )
+        parser.add_argument(
+            "--file",
+            default=settings.TRACING_EXPORT_PATH,
+            help="Span file written by FileSpanExporter.",
+        )
+
+    def handle(self, *args, **options):
+        trace_id, payout_id = options["trace_id"], options["payout_id"]
+        if (trace_id is None) == (payout_id is None):
+            raise CommandError("Pass either a trace id or --payout-id")
+        if not os.path.exists(options["file"]):
+            raise CommandError(f"No span file at {options['file']}")
+
+        spans = list(read_spans(options["file"]))
+        if trace_id is not None:
+            trace_ids = {trace_id}
+        else:
+            trace_ids = {
+                span["trace_id"]
+                for span in spans
+                if span["attributes"].get("payout.id") == payout_id
+            }
+
+        traces: dict[str, list[dict]] = {}
+        for span in spans:
+            if span["trace_id"] in trace_ids:
+                traces.setdefault(span["trace_id"], []).append(span)
+        if not traces:
+            raise CommandError("No matching spans found")
+
+        for current_id, trace_spans in sorted(
+            traces.items(), key=lambda item: min(s["start_time"] for s in item[1])
+        ):
+            self.stdout.write(f"Trace {current_id} ({len(trace_spans)} spans)")
+            self.stdout.write(f"{'offset':>12} {'duration':>12}  span")
+            for line in _render(trace_spans):
+                self.stdout.write(line)
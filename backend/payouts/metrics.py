@@ -0,0 +1,18 @@
+# payouts/metrics.py
+from prometheus_client import Counter
+
+PAYOUTS_CREATED = Counter(
+    "payouts_created_total",
+    "Payouts created by CreatePayoutUseCase.",
+    ["currency"],
+)
+
+PAYOUTS_IDEMPOTENT_REPLAYS = Counter(
+    "payouts_idempotent_replays_total",
+    "Create requests answered with an existing payout for the same key.",
+)
+
+PAYOUTS_IDEMPOTENCY_RACES_LOST = Counter(
+    "payouts_idempotency_races_lost_total",
+    "Create requests that lost a concurrent insert race on the idempotency key.",
+)
@@ -0,0 +1,273 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:07
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="payout",
+            options={
+                "ordering": ("-created_at",),
+                "verbose_name": "Payout request",
+                "verbose_name_plural": "Payout requests",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="recipient",
+            options={
+                "ordering": ("name", "id"),
+                "verbose_name": "Payout recipient",
+                "verbose_name_plural": "Payout recipients",
+            },
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="account_number_snapshot",
+            field=models.CharField(
+                help_text="Recipient account number at the time of payout creation.",
+                max_length=64,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="amount",
+            field=models.DecimalField(
+                decimal_places=2, help_text="Payout amount.", max_digits=12
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="bank_code_snapshot",
+            field=models.CharField(
+                blank=True,
+                help_text="Bank identifier at the time of payout creation.",
+                max_length=32,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True,
+                db_index=True,
+                help_text="When the payout request was created.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="currency",
+            field=models.CharField(
+                help_text="Currency code (ISO 4217, e.g. USD, EUR, UAH).", max_length=3
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="idempotency_key",
+            field=models.CharField(
+                help_text="Key used for idempotent payout creation.",
+                max_length=64,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="recipient",
+            field=models.ForeignKey(
+                help_text="Recipient to whom the payout is sent.",
+                on_delete=django.db.models.deletion.PROTECT,
+                related_name="payouts",
+                to="payouts.recipient",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="recipient_name_snapshot",
+            field=models.CharField(
+                help_text="Recipient name at the time of payout creation.",
+                max_length=255,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("NEW", "New"),
+                    ("PROCESSING", "Processing"),
+                    ("COMPLETED", "Completed"),
+                    ("FAILED", "Failed"),
+                ],
+                db_index=True,
+                default="NEW",
+                help_text="Current payout status.",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="payout",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, help_text="When the payout was last updated."
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="account_number",
+            field=models.CharField(
+                help_text="Account/card/IBAN number in its original form.",
+                max_length=64,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="bank_code",
+            field=models.CharField(
+                blank=True,
+                help_text="Bank identifier (MFO/BIC/SWIFT, etc.), if applicable.",
+                max_length=32,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="country",
+            field=models.CharField(
+                blank=True,
+                help_text="Country code (ISO 3166-1 alpha-2), e.g. UA, US, PL.",
+                max_length=2,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="created_at",
+            field=models.DateTimeField(
+                auto_now_add=True, help_text="When the recipient was created."
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="is_active",
+            field=models.BooleanField(
+                default=True,
+                help_text="Whether this recipient can be used for new payouts.",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="name",
+            field=models.CharField(
+                help_text="Full name or company name.", max_length=255
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="type",
+            field=models.CharField(
+                choices=[("INDIVIDUAL", "Individual"), ("BUSINESS", "Business")],
+                default="INDIVIDUAL",
+                help_text="Recipient type: individual or business.",
+                max_length=20,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="recipient",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, help_text="When the recipient was last updated."
+            ),
+        ),
+        migrations.CreateModel(
+            name="PayoutStatusHistory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "from_status",
+                    models.CharField(
+                        choices=[
+                            ("NEW", "New"),
+                            ("PROCESSING", "Processing"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        help_text="Status the payout left.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "to_status",
+                    models.CharField(
+                        choices=[
+                            ("NEW", "New"),
+                            ("PROCESSING", "Processing"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        help_text="Status the payout entered.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "time_in_from_status",
+                    models.DurationField(
+                        help_text="How long the payout stayed in from_status."
+                    ),
+                ),
+                (
+                    "actor_id",
+                    models.BigIntegerField(
+                        blank=True,
+                        help_text="User who made the change; empty for system transitions.",
+                        null=True,
+                    ),
+                ),
+                (
+                    "changed_at",
+                    models.DateTimeField(help_text="When the transition happened."),
+                ),
+                (
+                    "payout",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        help_text="Payout whose status changed (history outlives the payout).",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="status_history",
+                        to="payouts.payout",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Payout status change",
+                "verbose_name_plural": "Payout status history",
+                "db_table": "payouts_payout_status_history",
+                "ordering": ("-changed_at", "-id"),
+                "indexes": [
+                    models.Index(
+                        fields=["from_status", "changed_at"],
+                        name="payouts_pay_from_st_c7b1aa_idx",
+                    ),
+                    models.Index(
+                        fields=["payout", "changed_at"],
+                        name="payouts_pay_payout__49c5ee_idx",
+                    ),
+                    django.contrib.postgres.indexes.BrinIndex(
+                        fields=["changed_at"], name="payouts_pay_changed_77f681_brin"
+                    ),
+                ],
+            },
+        ),
+    ]
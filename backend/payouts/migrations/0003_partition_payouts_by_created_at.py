@@ -0,0 +1,190 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:10
+"""
+Converts payouts_payout into a table range-partitioned by created_at month.
+
+- PRIMARY KEY becomes (id, created_at): PostgreSQL requires the partition key
+  in every unique constraint, so idempotency uniqueness moves to the separate
+  payouts_payout_idempotency_key table (populated from existing rows).
+- Monthly partitions are created from the oldest payout up to
+  PARTITION_MONTHS_AHEAD months in the future; a DEFAULT partition catches
+  anything outside that range. Further partitions are created ahead of time by
+  ``manage.py payout_partitions --ensure-ahead``.
+- Existing index names are preserved (now as partitioned indexes).
+
+The conversion rewrites the table and is not reversible.
+"""
+
+from datetime import date
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+PARTITION_MONTHS_AHEAD = 3
+
+PARTITIONED_INDEXES = (
+    'CREATE INDEX "payouts_pay_recipie_98e0df_idx" '
+    'ON "payouts_payout" ("recipient_id", "created_at")',
+    'CREATE INDEX "payouts_pay_status_dd1f82_idx" '
+    'ON "payouts_payout" ("status", "created_at")',
+    'CREATE INDEX "payouts_payout_created_at_7bc7c94b" '
+    'ON "payouts_payout" ("created_at")',
+    'CREATE INDEX "payouts_payout_recipient_id_6e4ed98b" '
+    'ON "payouts_payout" ("recipient_id")',
+    'CREATE INDEX "payouts_payout_status_d3893f76" ON "payouts_payout" ("status")',
+    'CREATE INDEX "payouts_payout_status_d3893f76_like" '
+    'ON "payouts_payout" ("status" varchar_pattern_ops)',
+)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_payouts(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute('ALTER TABLE "payouts_payout" RENAME TO "payouts_payout_legacy"')
+
+        cursor.execute(
+            """
+            CREATE TABLE "payouts_payout" (
+                LIKE "payouts_payout_legacy" INCLUDING DEFAULTS
+            ) PARTITION BY RANGE ("created_at")
+            """
+        )
+
+        # Identity columns are not copied by LIKE; use an owned sequence so
+        # Django's sequence reset (pg_get_serial_sequence) keeps working.
+        cursor.execute('CREATE SEQUENCE "payouts_payout_partitioned_id_seq"')
+        cursor.execute(
+            'ALTER SEQUENCE "payouts_payout_partitioned_id_seq" '
+            'OWNED BY "payouts_payout"."id"'
+        )
+        cursor.execute(
+            'ALTER TABLE "payouts_payout" ALTER COLUMN "id" '
+            "SET DEFAULT nextval('payouts_payout_partitioned_id_seq')"
+        )
+        cursor.execute(
+            "SELECT setval('payouts_payout_partitioned_id_seq', "
+            'COALESCE((SELECT max("id") FROM "payouts_payout_legacy"), 0) + 1, false)'
+        )
+
+        cursor.execute(
+            """
+            SELECT date_trunc('month', min("created_at") AT TIME ZONE 'UTC')::date
+            FROM "payouts_payout_legacy"
+            """
+        )
+        (oldest,) = cursor.fetchone()
+        today = date.today().replace(day=1)
+        month = min(oldest or today, today)
+        last = _add_months(today, PARTITION_MONTHS_AHEAD)
+        while month <= last:
+            upper = _add_months(month, 1)
+            cursor.execute(
+                f'CREATE TABLE "payouts_payout_p{month:%Y_%m}" '
+                'PARTITION OF "payouts_payout" '
+                f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00:00+00') "
+                f"TO ('{upper:%Y-%m-%d} 00:00:00+00')"
+            )
+            month = upper
+        cursor.execute(
+            'CREATE TABLE "payouts_payout_default" '
+            'PARTITION OF "payouts_payout" DEFAULT'
+        )
+
+        cursor.execute(
+            'INSERT INTO "payouts_payout" SELECT * FROM "payouts_payout_legacy"'
+        )
+        cursor.execute(
+            """
+            INSERT INTO "payouts_payout_idempotency_key"
+                ("key", "payout_id", "payout_created_at", "created_at")
+            SELECT "idempotency_key", "id", "created_at", "created_at"
+            FROM "payouts_payout_legacy"
+            """
+        )
+
+        cursor.execute('DROP TABLE "payouts_payout_legacy"')
+        cursor.execute(
+            'ALTER SEQUENCE "payouts_payout_partitioned_id_seq" '
+            'RENAME TO "payouts_payout_id_seq"'
+        )
+
+        cursor.execute(
+            'ALTER TABLE "payouts_payout" ADD CONSTRAINT "payouts_payout_pkey" '
+            'PRIMARY KEY ("id", "created_at")'
+        )
+        cursor.execute(
+            'ALTER TABLE "payouts_payout" ADD CONSTRAINT '
+            '"payouts_payout_recipient_id_6e4ed98b_fk_payouts_recipient_id" '
+            'FOREIGN KEY ("recipient_id") REFERENCES "payouts_recipient" ("id") '
+            "DEFERRABLE INITIALLY DEFERRED"
+        )
+        for sql in PARTITIONED_INDEXES:
+            cursor.execute(sql)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("payouts", "0002_payout_status_history"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PayoutIdempotencyKey",
+            fields=[
+                (
+                    "key",
+                    models.CharField(
+                        help_text="Normalized client idempotency key.",
+                        max_length=64,
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "payout_created_at",
+                    models.DateTimeField(
+                        help_text="created_at of the payout (partition key, enables pruning)."
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="When the key was registered."
+                    ),
+                ),
+                (
+                    "payout",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        help_text="Payout created for this key.",
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to="payouts.payout",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Payout idempotency key",
+                "verbose_name_plural": "Payout idempotency keys",
+                "db_table": "payouts_payout_idempotency_key",
+            },
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="payout",
+                    name="idempotency_key",
+                    field=models.CharField(
+                        help_text="Key used for idempotent payout creation.",
+                        max_length=64,
+                    ),
+                ),
+            ],
+            database_operations=[
+                migrations.RunPython(partition_payouts),
+            ],
+        ),
+    ]
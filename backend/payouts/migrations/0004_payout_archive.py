@@ -0,0 +1,92 @@
+# Generated by Django 4.2.16 on 2026-10-18 22:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0003_partition_payouts_by_created_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PayoutArchive",
+            fields=[
+                (
+                    "id",
+                    models.BigIntegerField(
+                        help_text="Original payout id.",
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                ),
+                (
+                    "idempotency_key",
+                    models.CharField(
+                        help_text="Key used for idempotent payout creation.",
+                        max_length=64,
+                    ),
+                ),
+                (
+                    "amount",
+                    models.DecimalField(
+                        decimal_places=2, help_text="Payout amount.", max_digits=12
+                    ),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        help_text="Currency code (ISO 4217).", max_length=3
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("NEW", "New"),
+                            ("PROCESSING", "Processing"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        help_text="Final payout status.",
+                        max_length=20,
+                    ),
+                ),
+                ("recipient_name_snapshot", models.CharField(max_length=255)),
+                ("account_number_snapshot", models.CharField(max_length=64)),
+                ("bank_code_snapshot", models.CharField(blank=True, max_length=32)),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        help_text="When the payout request was created."
+                    ),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(help_text="When the payout was last updated."),
+                ),
+                (
+                    "archived_at",
+                    models.DateTimeField(
+                        help_text="When the payout was moved to the archive."
+                    ),
+                ),
+                (
+                    "recipient",
+                    models.ForeignKey(
+                        help_text="Recipient to whom the payout was sent.",
+                        on_delete=django.db.models.deletion.PROTECT,
+                        related_name="+",
+                        to="payouts.recipient",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Archived payout",
+                "verbose_name_plural": "Archived payouts",
+                "db_table": "payouts_payout_archive",
+            },
+        ),
+    ]
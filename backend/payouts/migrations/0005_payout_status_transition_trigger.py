@@ -0,0 +1,33 @@
+"""
+Enforces the payout state machine in the database.
+
+A BEFORE UPDATE OF status trigger on payouts_payout (cloned to every
+partition) rejects moves that PAYOUT_STATUS_MACHINE does not allow, raising
+check_violation. The transitions below are a frozen copy; a later change to
+the state machine needs its own migration re-creating the trigger.
+"""
+
+from django.db import migrations
+
+from payouts.domain.state_machine import StateMachine, drop_trigger_sql
+
+TRANSITIONS = {
+    "NEW": ("PROCESSING", "FAILED"),
+    "PROCESSING": ("COMPLETED", "FAILED"),
+    "COMPLETED": (),
+    "FAILED": (),
+}
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0004_payout_archive"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            StateMachine(TRANSITIONS).create_trigger_sql("payouts_payout", "status"),
+            drop_trigger_sql("payouts_payout", "status"),
+        ),
+    ]
@@ -0,0 +1,63 @@
+"""
+Stores idempotency keys as a 16-byte hash instead of varchar(64).
+
+Existing keys are hashed in place with the same function as
+``idempotency_key_hash`` (first 16 bytes of SHA-256, as uuid). The plain key
+column and its varchar_pattern_ops index are dropped; the registry's primary
+key index becomes fixed-width. An index on created_at serves the retention
+sweep (``manage.py expire_idempotency_keys``).
+
+Hashing is one-way, so the migration is not reversible.
+"""
+
+from django.db import migrations, models
+
+HASH_KEYS_SQL = """
+ALTER TABLE "payouts_payout_idempotency_key" ADD COLUMN "key_hash" uuid;
+UPDATE "payouts_payout_idempotency_key"
+SET "key_hash" = encode(
+    substring(sha256(convert_to("key", 'UTF8')) FROM 1 FOR 16), 'hex'
+)::uuid;
+ALTER TABLE "payouts_payout_idempotency_key" DROP COLUMN "key";
+ALTER TABLE "payouts_payout_idempotency_key"
+    ALTER COLUMN "key_hash" SET NOT NULL,
+    ADD CONSTRAINT "payouts_payout_idempotency_key_pkey" PRIMARY KEY ("key_hash");
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0005_payout_status_transition_trigger"),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            database_operations=[migrations.RunSQL(HASH_KEYS_SQL)],
+            state_operations=[
+                migrations.RemoveField(
+                    model_name="payoutidempotencykey",
+                    name="key",
+                ),
+                migrations.AddField(
+                    model_name="payoutidempotencykey",
+                    name="key_hash",
+                    field=models.UUIDField(
+                        help_text=(
+                            "Truncated SHA-256 of the normalized client "
+                            "idempotency key."
+                        ),
+                        primary_key=True,
+                        serialize=False,
+                    ),
+                    preserve_default=False,
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="payoutidempotencykey",
+            index=models.Index(
+                fields=["created_at"], name="payouts_pay_created_eba41a_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 4.2.16 on 2026-10-19 00:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0006_idempotency_key_hash"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="payout",
+            index=models.Index(
+                fields=["account_number_snapshot"],
+                name="payouts_pay_account_ee0d7f_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payout",
+            index=models.Index(
+                fields=["recipient_name_snapshot"],
+                name="payouts_pay_recipie_like_idx",
+                opclasses=("varchar_pattern_ops",),
+            ),
+        ),
+    ]
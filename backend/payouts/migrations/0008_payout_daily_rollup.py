@@ -0,0 +1,241 @@
+"""
+Daily payout rollup tables and the triggers that mark changed days.
+
+Statement-level AFTER triggers append the UTC created_at date of every
+inserted, updated or deleted payout to payouts_payout_rollup_dirty_day. They
+fire once per statement (bulk updates and archive batches included), on the
+partitioned parent. Deletes from the archive are tracked too; inserts into it
+come from payouts_payout deletes, which are already tracked.
+"""
+
+import django.contrib.postgres.indexes
+import django.db.models.deletion
+from django.db import migrations, models
+
+MARK_DIRTY_FUNCTION_SQL = """
+CREATE FUNCTION payouts_mark_rollup_days_dirty() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    -- changed_rows: NEW rows for INSERT / UPDATE, OLD rows for DELETE
+    INSERT INTO payouts_payout_rollup_dirty_day (day)
+    SELECT DISTINCT (created_at AT TIME ZONE 'UTC')::date FROM changed_rows;
+    RETURN NULL;
+END
+$$;
+"""
+
+TRIGGERS = (
+    ("payouts_payout", "INSERT", "NEW"),
+    ("payouts_payout", "UPDATE", "NEW"),
+    ("payouts_payout", "DELETE", "OLD"),
+    ("payouts_payout_archive", "DELETE", "OLD"),
+)
+
+
+def _trigger_name(table: str, event: str) -> str:
+    return f"{table}_rollup_{event.lower()}"
+
+
+CREATE_TRIGGERS_SQL = [MARK_DIRTY_FUNCTION_SQL] + [
+    f"CREATE TRIGGER {_trigger_name(table, event)} AFTER {event} ON {table} "
+    f"REFERENCING {rows} TABLE AS changed_rows FOR EACH STATEMENT "
+    "EXECUTE FUNCTION payouts_mark_rollup_days_dirty()"
+    for table, event, rows in TRIGGERS
+]
+
+DROP_TRIGGERS_SQL = [
+    f"DROP TRIGGER IF EXISTS {_trigger_name(table, event)} ON {table}"
+    for table, event, _ in TRIGGERS
+] + ["DROP FUNCTION IF EXISTS payouts_mark_rollup_days_dirty()"]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0007_payout_admin_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PayoutDailyRecipientRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(help_text="UTC date the payouts were created on."),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        help_text="Currency code (ISO 4217).", max_length=3
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("NEW", "New"),
+                            ("PROCESSING", "Processing"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        help_text="Current status of the counted payouts.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "payout_count",
+                    models.BigIntegerField(help_text="Number of payouts."),
+                ),
+                (
+                    "amount_total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Sum of payout amounts.",
+                        max_digits=20,
+                    ),
+                ),
+                (
+                    "computed_at",
+                    models.DateTimeField(help_text="When the day was last recomputed."),
+                ),
+            ],
+            options={
+                "verbose_name": "Payout daily recipient rollup",
+                "verbose_name_plural": "Payout daily recipient rollups",
+                "db_table": "payouts_payout_daily_recipient_rollup",
+            },
+        ),
+        migrations.CreateModel(
+            name="PayoutDailyRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(help_text="UTC date the payouts were created on."),
+                ),
+                (
+                    "currency",
+                    models.CharField(
+                        help_text="Currency code (ISO 4217).", max_length=3
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("NEW", "New"),
+                            ("PROCESSING", "Processing"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        help_text="Current status of the counted payouts.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "payout_count",
+                    models.BigIntegerField(help_text="Number of payouts."),
+                ),
+                (
+                    "amount_total",
+                    models.DecimalField(
+                        decimal_places=2,
+                        help_text="Sum of payout amounts.",
+                        max_digits=20,
+                    ),
+                ),
+                (
+                    "computed_at",
+                    models.DateTimeField(help_text="When the day was last recomputed."),
+                ),
+            ],
+            options={
+                "verbose_name": "Payout daily rollup",
+                "verbose_name_plural": "Payout daily rollups",
+                "db_table": "payouts_payout_daily_rollup",
+            },
+        ),
+        migrations.CreateModel(
+            name="PayoutRollupDirtyDay",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(
+                        help_text="UTC date of created_at of the changed payouts."
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Payout rollup dirty day",
+                "verbose_name_plural": "Payout rollup dirty days",
+                "db_table": "payouts_payout_rollup_dirty_day",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="payoutarchive",
+            index=django.contrib.postgres.indexes.BrinIndex(
+                fields=["created_at"], name="payouts_pay_created_838646_brin"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payoutrollupdirtyday",
+            index=models.Index(fields=["day"], name="payouts_pay_day_2ec874_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="payoutdailyrollup",
+            constraint=models.UniqueConstraint(
+                fields=("day", "currency", "status"), name="payouts_daily_rollup_unique"
+            ),
+        ),
+        migrations.AddField(
+            model_name="payoutdailyrecipientrollup",
+            name="recipient",
+            field=models.ForeignKey(
+                db_constraint=False,
+                help_text="Recipient of the counted payouts.",
+                on_delete=django.db.models.deletion.DO_NOTHING,
+                related_name="+",
+                to="payouts.recipient",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="payoutdailyrecipientrollup",
+            index=models.Index(
+                fields=["recipient", "day"], name="payouts_pay_recipie_da6e03_idx"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="payoutdailyrecipientrollup",
+            constraint=models.UniqueConstraint(
+                fields=("day", "currency", "status", "recipient"),
+                name="payouts_daily_recipient_rollup_unique",
+            ),
+        ),
+        migrations.RunSQL(CREATE_TRIGGERS_SQL, DROP_TRIGGERS_SQL),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.16 on 2026-10-19 00:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0008_payout_daily_rollup"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="payout",
+            name="fencing_token",
+            field=models.BigIntegerField(
+                blank=True,
+                editable=False,
+                help_text="Fencing token of the latest processing lease.",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+"""
+Marks both days of a payout whose created_at changes.
+
+The UPDATE trigger from 0008 read only the NEW transition table, so moving a
+payout to another day never marked the day it left, which kept counting it.
+The trigger now reads OLD and NEW rows and marks the days of both.
+"""
+
+from django.db import migrations
+
+MARK_DIRTY_ON_UPDATE_FUNCTION_SQL = """
+CREATE FUNCTION payouts_mark_rollup_days_dirty_on_update() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO payouts_payout_rollup_dirty_day (day)
+    SELECT (created_at AT TIME ZONE 'UTC')::date FROM old_rows
+    UNION
+    SELECT (created_at AT TIME ZONE 'UTC')::date FROM new_rows;
+    RETURN NULL;
+END
+$$;
+"""
+
+DROP_UPDATE_TRIGGER_SQL = (
+    "DROP TRIGGER IF EXISTS payouts_payout_rollup_update ON payouts_payout"
+)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payouts", "0009_payout_fencing_token"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            [
+                MARK_DIRTY_ON_UPDATE_FUNCTION_SQL,
+                DROP_UPDATE_TRIGGER_SQL,
+                "CREATE TRIGGER payouts_payout_rollup_update "
+                "AFTER UPDATE ON payouts_payout "
+                "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows "
+                "FOR EACH STATEMENT "
+                "EXECUTE FUNCTION payouts_mark_rollup_days_dirty_on_update()",
+            ],
+            [
+                DROP_UPDATE_TRIGGER_SQL,
+                "DROP FUNCTION IF EXISTS payouts_mark_rollup_days_dirty_on_update()",
+                "CREATE TRIGGER payouts_payout_rollup_update "
+                "AFTER UPDATE ON payouts_payout "
+                "REFERENCING NEW TABLE AS changed_rows FOR EACH STATEMENT "
+                "EXECUTE FUNCTION payouts_mark_rollup_days_dirty()",
+            ],
+        ),
+    ]
@@ -1,3 +1,4 @@
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import models
 
 
@@ -78,9 +79,11 @@ class Payout(models.Model):
 
     # Business parameters
 
+    # Uniqueness is enforced by PayoutIdempotencyKey: payouts_payout is
+    # partitioned by created_at, so a unique index here could only be
+    # per-partition.
     idempotency_key = models.CharField(
         max_length=64,
-        unique=True,
         help_text="Key used for idempotent payout creation.",
     )
 
@@ -132,7 +135,19 @@ class Payout(models.Model):
         help_text="When the payout was last updated.",
     )
 
+    # Set by the worker holding the processing lease; its status writes
+    # match on it, so a worker whose lease was taken over cannot commit
+    fencing_token = models.BigIntegerField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Fencing token of the latest processing lease.",
+    )
+
     class Meta:
+        # Range-partitioned by created_at month (see migration 0003 and the
+        # payout_partitions management command). Primary key is (id, created_at)
+        # at the database level.
         db_table = "payouts_payout"
         verbose_name = "Payout request"
         verbose_name_plural = "Payout requests"
@@ -144,6 +159,16 @@ class Payout(models.Model):
             models.Index(
                 fields=("recipient", "created_at"),
             ),
+            # Admin search (PayoutAdmin.get_search_results): exact account
+            # number and case-sensitive name prefix
+            models.Index(
+                fields=("account_number_snapshot",),
+            ),
+            models.Index(
+                fields=("recipient_name_snapshot",),
+                name="payouts_pay_recipie_like_idx",
+                opclasses=("varchar_pattern_ops",),
+            ),
         ]
 
     def __str__(self) -> str:
@@ -161,3 +186,350 @@ class Payout(models.Model):
         self.recipient_name_snapshot = self.recipient.name
         self.account_number_snapshot = self.recipient.account_number
         self.bank_code_snapshot = self.recipient.bank_code
+
+
+class PayoutArchive(models.Model):
+    """
+    Cold storage for terminal (COMPLETED / FAILED) payouts past the archive cutoff.
+
+    Same columns as Payout but only the primary key and the recipient FK index,
+    so archived rows stop weighing down the hot table's indexes. Reads fall back
+    here transparently through PayoutRepository.
+    """
+
+    id = models.BigIntegerField(
+        primary_key=True,
+        help_text="Original payout id.",
+    )
+
+    recipient = models.ForeignKey(
+        "Recipient",
+        on_delete=models.PROTECT,
+        related_name="+",
+        help_text="Recipient to whom the payout was sent.",
+    )
+
+    idempotency_key = models.CharField(
+        max_length=64,
+        help_text="Key used for idempotent payout creation.",
+    )
+
+    amount = models.DecimalField(
+        max_digits=12,
+        decimal_places=2,
+        help_text="Payout amount.",
+    )
+
+    currency = models.CharField(
+        max_length=3,
+        help_text="Currency code (ISO 4217).",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Payout.Status.choices,
+        help_text="Final payout status.",
+    )
+
+    recipient_name_snapshot = models.CharField(max_length=255)
+    account_number_snapshot = models.CharField(max_length=64)
+    bank_code_snapshot = models.CharField(max_length=32, blank=True)
+
+    created_at = models.DateTimeField(
+        help_text="When the payout request was created.",
+    )
+
+    updated_at = models.DateTimeField(
+        help_text="When the payout was last updated.",
+    )
+
+    archived_at = models.DateTimeField(
+        help_text="When the payout was moved to the archive.",
+    )
+
+    class Meta:
+        db_table = "payouts_payout_archive"
+        verbose_name = "Archived payout"
+        verbose_name_plural = "Archived payouts"
+        indexes = [
+            # Daily rollup recomputation; rows arrive roughly in created_at
+            # order (oldest archived first), so a BRIN range map is enough
+            BrinIndex(fields=("created_at",)),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"PayoutArchive(id={self.pk}, amount={self.amount} {self.currency}, "
+            f"status={self.status})"
+        )
+
+
+class PayoutIdempotencyKey(models.Model):
+    """
+    Global idempotency registry for payouts.
+
+    Lives outside the partitioned payouts table so that a key stays unique
+    across all partitions. Stores the payout's partition key for pruned lookups.
+
+    Keys are stored as a 16-byte hash (see ``idempotency_key_hash``), so the
+    primary key index is fixed-width however long client keys are. Entries
+    older than PAYOUT_IDEMPOTENCY_KEY_RETENTION_DAYS are removed by
+    ``manage.py expire_idempotency_keys``; a key reused after that creates a
+    new payout.
+    """
+
+    key_hash = models.UUIDField(
+        primary_key=True,
+        help_text="Truncated SHA-256 of the normalized client idempotency key.",
+    )
+
+    payout = models.ForeignKey(
+        "Payout",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        help_text="Payout created for this key.",
+    )
+
+    payout_created_at = models.DateTimeField(
+        help_text="created_at of the payout (partition key, enables pruning).",
+    )
+
+    created_at = models.DateTimeField(
+        auto_now_add=True,
+        help_text="When the key was registered.",
+    )
+
+    class Meta:
+        db_table = "payouts_payout_idempotency_key"
+        verbose_name = "Payout idempotency key"
+        verbose_name_plural = "Payout idempotency keys"
+        indexes = [
+            # Expiry sweep, oldest first
+            models.Index(fields=("created_at",)),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"PayoutIdempotencyKey(key_hash={self.key_hash}, "
+            f"payout_id={self.payout_id})"
+        )
+
+
+class PayoutStatusHistory(models.Model):
+    """
+    Append-only log of payout status transitions.
+
+    Each row records how long the payout spent in ``from_status`` before moving
+    to ``to_status``, so time-in-state metrics never touch ``payouts_payout``.
+    """
+
+    payout = models.ForeignKey(
+        "Payout",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="status_history",
+        help_text="Payout whose status changed (history outlives the payout).",
+    )
+
+    from_status = models.CharField(
+        max_length=20,
+        choices=Payout.Status.choices,
+        help_text="Status the payout left.",
+    )
+
+    to_status = models.CharField(
+        max_length=20,
+        choices=Payout.Status.choices,
+        help_text="Status the payout entered.",
+    )
+
+    time_in_from_status = models.DurationField(
+        help_text="How long the payout stayed in from_status.",
+    )
+
+    actor_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        help_text="User who made the change; empty for system transitions.",
+    )
+
+    changed_at = models.DateTimeField(
+        help_text="When the transition happened.",
+    )
+
+    class Meta:
+        db_table = "payouts_payout_status_history"
+        verbose_name = "Payout status change"
+        verbose_name_plural = "Payout status history"
+        ordering = ("-changed_at", "-id")
+        indexes = [
+            # Time-in-state percentiles per status over a window
+            models.Index(fields=("from_status", "changed_at")),
+            # Per-payout timeline
+            models.Index(fields=("payout", "changed_at")),
+            # Cheap range scans on the append-only, time-correlated column
+            BrinIndex(fields=("changed_at",)),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"PayoutStatusHistory(payout_id={self.payout_id}, "
+            f"{self.from_status} -> {self.to_status}, at={self.changed_at})"
+        )
+
+
+class PayoutDailyRollup(models.Model):
+    """
+    Payout count and amount per UTC day (of created_at), currency and status,
+    over live and archived payouts.
+
+    Derived from PayoutDailyRecipientRollup when a day is recomputed
+    (``infrastructure.payouts.rollups``). Reports that do not need the
+    recipient read this table, which stays a few rows per day however many
+    recipients there are.
+    """
+
+    day = models.DateField(
+        help_text="UTC date the payouts were created on.",
+    )
+
+    currency = models.CharField(
+        max_length=3,
+        help_text="Currency code (ISO 4217).",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Payout.Status.choices,
+        help_text="Current status of the counted payouts.",
+    )
+
+    payout_count = models.BigIntegerField(
+        help_text="Number of payouts.",
+    )
+
+    amount_total = models.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        help_text="Sum of payout amounts.",
+    )
+
+    computed_at = models.DateTimeField(
+        help_text="When the day was last recomputed.",
+    )
+
+    class Meta:
+        db_table = "payouts_payout_daily_rollup"
+        verbose_name = "Payout daily rollup"
+        verbose_name_plural = "Payout daily rollups"
+        constraints = [
+            # Also serves date-range reports
+            models.UniqueConstraint(
+                fields=("day", "currency", "status"),
+                name="payouts_daily_rollup_unique",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"PayoutDailyRollup(day={self.day}, {self.currency}, {self.status}, "
+            f"count={self.payout_count})"
+        )
+
+
+class PayoutDailyRecipientRollup(models.Model):
+    """
+    Payout count and amount per UTC day (of created_at), currency, status and
+    recipient, over live and archived payouts.
+
+    Maintained by ``infrastructure.payouts.rollups``: every day listed in
+    PayoutRollupDirtyDay is recomputed from scratch, so rows are never
+    incremented in place and recomputing a day is idempotent.
+    """
+
+    day = models.DateField(
+        help_text="UTC date the payouts were created on.",
+    )
+
+    currency = models.CharField(
+        max_length=3,
+        help_text="Currency code (ISO 4217).",
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=Payout.Status.choices,
+        help_text="Current status of the counted payouts.",
+    )
+
+    recipient = models.ForeignKey(
+        "Recipient",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+        help_text="Recipient of the counted payouts.",
+    )
+
+    payout_count = models.BigIntegerField(
+        help_text="Number of payouts.",
+    )
+
+    amount_total = models.DecimalField(
+        max_digits=20,
+        decimal_places=2,
+        help_text="Sum of payout amounts.",
+    )
+
+    computed_at = models.DateTimeField(
+        help_text="When the day was last recomputed.",
+    )
+
+    class Meta:
+        db_table = "payouts_payout_daily_recipient_rollup"
+        verbose_name = "Payout daily recipient rollup"
+        verbose_name_plural = "Payout daily recipient rollups"
+        constraints = [
+            # Also serves date-range reports
+            models.UniqueConstraint(
+                fields=("day", "currency", "status", "recipient"),
+                name="payouts_daily_recipient_rollup_unique",
+            ),
+        ]
+        indexes = [
+            # Reports for one recipient
+            models.Index(fields=("recipient", "day")),
+        ]
+
+    def __str__(self) -> str:
+        return (
+            f"PayoutDailyRecipientRollup(day={self.day}, {self.currency}, "
+            f"{self.status}, recipient_id={self.recipient_id}, "
+            f"count={self.payout_count})"
+        )
+
+
+class PayoutRollupDirtyDay(models.Model):
+    """
+    Days whose payouts changed since their rollup was last computed.
+
+    Statement-level triggers on payouts_payout (INSERT / UPDATE / DELETE) and
+    payouts_payout_archive (DELETE) append one row per affected day in the
+    same transaction as the change (migration 0008). Rows are append-only,
+    so concurrent writers never wait on each other here.
+    """
+
+    day = models.DateField(
+        help_text="UTC date of created_at of the changed payouts.",
+    )
+
+    class Meta:
+        db_table = "payouts_payout_rollup_dirty_day"
+        verbose_name = "Payout rollup dirty day"
+        verbose_name_plural = "Payout rollup dirty days"
+        indexes = [
+            models.Index(fields=("day",)),
+        ]
+
+    def __str__(self) -> str:
+        return f"PayoutRollupDirtyDay(day={self.day})"
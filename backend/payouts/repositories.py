@@ -1,12 +1,34 @@
-from typing import Optional
+import logging
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
 
-from core.exceptions import DomainNotFoundError
-from payouts.domain.value_objects import IdempotencyKey
-from payouts.models import Payout, Recipient
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from core.exceptions import DomainConflictError, DomainNotFoundError
+from core.tracing import traced
+from payouts.domain.value_objects import IdempotencyKey, idempotency_key_hash
+from payouts.models import (
+    Payout,
+    PayoutArchive,
+    PayoutIdempotencyKey,
+    PayoutStatusHistory,
+    Recipient,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rows per INSERT when writing status history in bulk
+PAYOUT_STATUS_HISTORY_BATCH_SIZE = 1000
+
+# Repository methods are @traced: each call is a span named after the method,
+# so database time shows up separately in a payout's trace.
 
 
 class RecipientRepository:
     @staticmethod
+    @traced(kind="client")
     def get_by_id(recipient_id: int) -> Recipient:
         try:
             return Recipient.objects.get(pk=recipient_id)
@@ -14,36 +36,295 @@ class RecipientRepository:
             raise DomainNotFoundError("Recipient not found")
 
 
+def _payout_from_archive(archived: PayoutArchive) -> Payout:
+    """Rehydrate an archived row as a (read-only in practice) Payout entity."""
+    payout = Payout(
+        id=archived.id,
+        recipient=archived.recipient,
+        idempotency_key=archived.idempotency_key,
+        amount=archived.amount,
+        currency=archived.currency,
+        status=archived.status,
+        recipient_name_snapshot=archived.recipient_name_snapshot,
+        account_number_snapshot=archived.account_number_snapshot,
+        bank_code_snapshot=archived.bank_code_snapshot,
+        created_at=archived.created_at,
+        updated_at=archived.updated_at,
+    )
+    payout._state.adding = False
+    payout._state.db = archived._state.db
+    return payout
+
+
 class PayoutRepository:
     @staticmethod
+    @traced(kind="client")
     def get_by_id(payout_id: int) -> Payout:
         try:
             return Payout.objects.select_related("recipient").get(pk=payout_id)
         except Payout.DoesNotExist:
+            pass
+
+        archived = PayoutRepository.get_archived_or_none(payout_id)
+        if archived is None:
             raise DomainNotFoundError("Payout not found")
+        return archived
+
+    @staticmethod
+    @traced(kind="client")
+    def get_archived_or_none(payout_id: int) -> Optional[Payout]:
+        """Look a payout up in the cold archive (terminal payouts past cutoff)."""
+        archived = (
+            PayoutArchive.objects.select_related("recipient")
+            .filter(pk=payout_id)
+            .first()
+        )
+        return _payout_from_archive(archived) if archived is not None else None
 
     @staticmethod
+    @traced(kind="client")
     def get_by_idempotency_key_or_none(key: IdempotencyKey) -> Optional[Payout]:
-        return (
+        """
+        Key registry first (hash PK lookup), then a partition-pruned fetch.
+
+        A registered key whose payout is neither live nor archived (e.g. its
+        partition was detached by hand) is released, so the request creates a
+        new payout instead of colliding with the stale entry.
+        """
+        row = (
+            PayoutIdempotencyKey.objects.filter(key_hash=key.hash)
+            .values_list("payout_id", "payout_created_at")
+            .first()
+        )
+        if row is None:
+            return None
+
+        payout_id, payout_created_at = row
+        payout = (
             Payout.objects.select_related("recipient")
-            .filter(idempotency_key=key.value)
+            .filter(pk=payout_id, created_at=payout_created_at)
             .first()
         )
+        if payout is None:
+            # Archived payouts keep their key registered
+            payout = PayoutRepository.get_archived_or_none(payout_id)
+        if payout is None:
+            logger.warning(
+                "Releasing idempotency key of missing payout: payout_id=%s",
+                payout_id,
+            )
+            PayoutIdempotencyKey.objects.filter(
+                key_hash=key.hash, payout_id=payout_id
+            ).delete()
+        return payout
 
     @staticmethod
+    @traced(kind="client")
     def get_by_idempotency_key(key: IdempotencyKey) -> Payout:
-        try:
-            return Payout.objects.select_related("recipient").get(
-                idempotency_key=key.value
-            )
-        except Payout.DoesNotExist:
+        payout = PayoutRepository.get_by_idempotency_key_or_none(key)
+        if payout is None:
             raise DomainNotFoundError("Payout not found")
+        return payout
 
     @staticmethod
+    @traced(kind="client")
     def save(payout: Payout) -> Payout:
         """
         Repository layer does not contain business logic.
         It receives a fully constructed domain entity and simply persists it.
+
+        New payouts also register their idempotency key; a duplicate key raises
+        IntegrityError with the savepoint rolled back, so the caller's
+        transaction stays usable.
         """
-        payout.save()
+        if payout.pk is not None:
+            payout.save()
+            return payout
+
+        with transaction.atomic():
+            payout.save()
+            PayoutIdempotencyKey.objects.create(
+                key_hash=idempotency_key_hash(payout.idempotency_key),
+                payout_id=payout.pk,
+                payout_created_at=payout.created_at,
+            )
+        return payout
+
+    @staticmethod
+    @traced(kind="client")
+    def delete(payout: Payout) -> None:
+        """Delete a payout (live or archived) and release its idempotency key."""
+        payout_id = payout.pk  # Model.delete() resets pk
+        with transaction.atomic():
+            PayoutIdempotencyKey.objects.filter(
+                key_hash=idempotency_key_hash(payout.idempotency_key),
+                payout_id=payout_id,
+            ).delete()
+            payout.delete()
+            PayoutArchive.objects.filter(pk=payout_id).delete()
+
+    @staticmethod
+    @traced(kind="client")
+    def update_status(
+        payout: Payout,
+        *,
+        expected_status: str,
+        fencing_token: int | None = None,
+    ) -> Payout:
+        """
+        Compare-and-set status write.
+
+        Issues UPDATE ... SET status, updated_at WHERE id = %s AND status = %s,
+        so only the two changed columns are written and a concurrent transition
+        is detected instead of silently overwritten. With a fencing_token the
+        row must also still carry that token (see claim_for_processing).
+        """
+        updated_at = timezone.now()
+        filters = {}
+        if fencing_token is not None:
+            filters["fencing_token"] = fencing_token
+        rows = Payout.objects.filter(
+            pk=payout.pk,
+            created_at=payout.created_at,  # partition pruning
+            status=expected_status,
+            **filters,
+        ).update(status=payout.status, updated_at=updated_at)
+        if rows == 0:
+            payout.status = expected_status
+            raise DomainConflictError(
+                "Payout status was changed concurrently. Reload and retry."
+            )
+
+        payout.updated_at = updated_at
         return payout
+
+    @staticmethod
+    @traced(kind="client")
+    def claim_for_processing(payout: Payout, *, fencing_token: int) -> bool:
+        """
+        Store a processing lease's fencing token on the payout row, unless a
+        newer lease already did. Returns False for a stale token.
+
+        Status writes made with the token then only match while no newer
+        lease holder has claimed the row.
+        """
+        rows = (
+            Payout.objects.filter(pk=payout.pk, created_at=payout.created_at)
+            .filter(Q(fencing_token__isnull=True) | Q(fencing_token__lt=fencing_token))
+            .update(fencing_token=fencing_token)
+        )
+        return rows == 1
+
+    @staticmethod
+    @traced(kind="client")
+    def lock_status_rows(
+        payout_ids: Sequence[int],
+    ) -> list[tuple[int, str, bool, datetime, datetime]]:
+        """
+        Lock payout rows (FOR UPDATE, in id order to avoid deadlocks) and return
+        (id, status, recipient_is_active, updated_at, created_at) without loading
+        full entities. Must be called inside a transaction.
+        """
+        return list(
+            Payout.objects.select_for_update(of=("self",))
+            .filter(pk__in=payout_ids)
+            .order_by("pk")
+            .values_list(
+                "pk", "status", "recipient__is_active", "updated_at", "created_at"
+            )
+        )
+
+    @staticmethod
+    @traced(kind="client")
+    def bulk_update_status(
+        payout_ids: Sequence[int],
+        *,
+        created_at: Sequence[datetime],
+        expected_status: str,
+        new_status: str,
+        updated_at: datetime,
+    ) -> list[int]:
+        """
+        Set-based compare-and-set: one UPDATE for a group of payouts that share
+        the same current status. Filtering on the rows' created_at lets
+        PostgreSQL prune partitions. Returns the ids that were actually updated.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {Payout._meta.db_table} "
+                "SET status = %s, updated_at = %s "
+                "WHERE id = ANY(%s) AND created_at = ANY(%s::timestamptz[]) "
+                "AND status = %s "
+                "RETURNING id",
+                [
+                    new_status,
+                    updated_at,
+                    list(payout_ids),
+                    list(created_at),
+                    expected_status,
+                ],
+            )
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PayoutStatusHistoryRepository:
+    @staticmethod
+    def build_entry(
+        *,
+        payout_id: int,
+        from_status: str,
+        to_status: str,
+        entered_at: datetime,
+        changed_at: datetime,
+        actor_id: int | None,
+    ) -> PayoutStatusHistory:
+        """
+        Build an unsaved history row.
+
+        ``entered_at`` is when the payout entered ``from_status``; status writes
+        always bump ``updated_at``, so callers pass the pre-transition value.
+        """
+        return PayoutStatusHistory(
+            payout_id=payout_id,
+            from_status=from_status,
+            to_status=to_status,
+            time_in_from_status=max(changed_at - entered_at, timedelta(0)),
+            actor_id=actor_id,
+            changed_at=changed_at,
+        )
+
+    @staticmethod
+    @traced(kind="client")
+    def add(entry: PayoutStatusHistory) -> PayoutStatusHistory:
+        entry.save(force_insert=True)
+        return entry
+
+    @staticmethod
+    @traced(kind="client")
+    def add_many(entries: Sequence[PayoutStatusHistory]) -> None:
+        """Multi-row INSERT for transitions that arrive as a batch."""
+        PayoutStatusHistory.objects.bulk_create(
+            entries,
+            batch_size=PAYOUT_STATUS_HISTORY_BATCH_SIZE,
+        )
+
+
+class PayoutStatusHistoryBuffer:
+    """
+    Collects history rows and writes them with multi-row INSERTs,
+    flushing automatically every ``batch_size`` rows.
+    """
+
+    def __init__(self, batch_size: int = PAYOUT_STATUS_HISTORY_BATCH_SIZE) -> None:
+        self.batch_size = batch_size
+        self._entries: list[PayoutStatusHistory] = []
+
+    def add(self, entry: PayoutStatusHistory) -> None:
+        self._entries.append(entry)
+        if len(self._entries) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._entries:
+            PayoutStatusHistoryRepository.add_many(self._entries)
+            self._entries = []
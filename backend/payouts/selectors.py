@@ -1,9 +1,141 @@
-from .models import Payout
+import json
+from datetime import date, datetime
 
+from django.db import connection, connections
+from django.db.models import Sum
 
-def list_payouts():
+from .models import (
+    Payout,
+    PayoutDailyRecipientRollup,
+    PayoutDailyRollup,
+    PayoutStatusHistory,
+)
+
+# Percentiles reported by time_in_state_percentiles()
+TIME_IN_STATE_PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+# Dimensions payout_volume_report() can group by, and the rollup columns
+REPORT_DIMENSIONS = {
+    "day": "day",
+    "currency": "currency",
+    "status": "status",
+    "recipient": "recipient_id",
+}
+
+# estimated_count() counts exactly when the planner expects fewer rows
+ESTIMATED_COUNT_EXACT_BELOW = 10_000
+
+
+def list_payouts(
+    *,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
+):
     """
     Base selector for listing payouts.
     Returns a queryset with deterministic ordering suitable for cursor pagination.
+
+    Optional created_at bounds let PostgreSQL prune payouts_payout partitions.
+    """
+    queryset = Payout.objects.select_related("recipient").order_by("-created_at", "-id")
+    if created_from is not None:
+        queryset = queryset.filter(created_at__gte=created_from)
+    if created_to is not None:
+        queryset = queryset.filter(created_at__lt=created_to)
+    return queryset
+
+
+def estimated_count(queryset) -> int:
+    """
+    Row count of ``queryset`` from the planner's estimate (EXPLAIN), without
+    scanning. Small results (under ESTIMATED_COUNT_EXACT_BELOW estimated rows)
+    are counted exactly, since that is cheap and an estimate is most visibly
+    wrong there.
+    """
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < ESTIMATED_COUNT_EXACT_BELOW:
+        return queryset.count()
+    return estimate
+
+
+def time_in_state_percentiles(*, since: datetime, until: datetime) -> dict[str, dict]:
+    """
+    Time-in-state statistics (seconds) per status for transitions that
+    happened in [since, until).
+
+    Reads only the status history table through its (from_status, changed_at)
+    index; payouts_payout is never scanned.
+    """
+    sql = f"""
+        SELECT
+            from_status,
+            count(*),
+            percentile_cont(%s::double precision[]) WITHIN GROUP (
+                ORDER BY extract(epoch FROM time_in_from_status)
+            ),
+            max(extract(epoch FROM time_in_from_status))
+        FROM {PayoutStatusHistory._meta.db_table}
+        WHERE changed_at >= %s AND changed_at < %s
+        GROUP BY from_status
+        ORDER BY from_status
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [list(TIME_IN_STATE_PERCENTILES), since, until])
+        rows = cursor.fetchall()
+
+    return {
+        status: {
+            "count": count,
+            **{
+                f"p{round(q * 100)}": round(value, 3)
+                for q, value in zip(TIME_IN_STATE_PERCENTILES, percentiles)
+            },
+            "max": round(float(max_seconds), 3),
+        }
+        for status, count, percentiles, max_seconds in rows
+    }
+
+
+def payout_volume_report(
+    *,
+    date_from: date,
+    date_to: date,
+    group_by: tuple[str, ...] = ("day", "currency", "status"),
+    currency: str | None = None,
+    status: str | None = None,
+    recipient_id: int | None = None,
+) -> list[dict]:
     """
-    return Payout.objects.select_related("recipient").order_by("-created_at", "-id")
+    Payout count and amount per ``group_by`` dimensions for created_at UTC
+    days in [date_from, date_to].
+
+    Reads the daily rollups only, so the result is as fresh as the last
+    refresh_payout_rollups run. The per-recipient rollup is read only when
+    grouping or filtering by recipient.
+    """
+    by_recipient = "recipient" in group_by or recipient_id is not None
+    model = PayoutDailyRecipientRollup if by_recipient else PayoutDailyRollup
+    queryset = model.objects.filter(day__gte=date_from, day__lte=date_to)
+    if currency is not None:
+        queryset = queryset.filter(currency=currency)
+    if status is not None:
+        queryset = queryset.filter(status=status)
+    if recipient_id is not None:
+        queryset = queryset.filter(recipient_id=recipient_id)
+
+    columns = [REPORT_DIMENSIONS[dimension] for dimension in group_by]
+    return list(
+        queryset.values(*columns)
+        .annotate(
+            payout_count=Sum("payout_count"),
+            amount_total=Sum("amount_total"),
+        )
+        .order_by(*columns)
+    )
@@ -0,0 +1,49 @@
+# backend/tests/conftest.py
+from contextlib import contextmanager
+
+import pytest
+
+from infrastructure.query_instrumentation import instrument_queries
+
+
+def _describe(stats) -> str:
+    lines = [f"{stats.count} queries, {stats.duration * 1000:.1f} ms:"]
+    for shape, shape_stats in sorted(
+        stats.shapes.items(), key=lambda item: item[1].count, reverse=True
+    ):
+        lines.append(f"  {shape_stats.count}x {shape}")
+        for frame in shape_stats.stack or []:
+            lines.append(f"      at {frame}")
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def query_budget():
+    """
+    Asserts a block stays within a query budget:
+
+        with query_budget(max_queries=3):
+            client.get("/api/payouts/")
+
+    ``max_repeats`` bounds how often one query shape may run (per-row queries
+    added by a serializer change show up here even when the total still fits).
+    The failure message lists every shape with the call site of its repeats.
+    """
+
+    @contextmanager
+    def budget(*, max_queries: int, max_repeats: int = 1):
+        with instrument_queries() as stats:
+            yield stats
+
+        problems = []
+        if stats.count > max_queries:
+            problems.append(f"{stats.count} queries > budget of {max_queries}")
+        repeated = stats.repeated(max_repeats + 1)
+        if repeated:
+            problems.append(
+                f"{len(repeated)} query shape(s) ran more than {max_repeats}x"
+            )
+        if problems:
+            pytest.fail(f"{'; '.join(problems)}\n{_describe(stats)}", pytrace=False)
+
+    return budget
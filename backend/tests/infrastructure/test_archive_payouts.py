@@ -0,0 +1,133 @@
+# backend/tests/infrastructure/test_archive_payouts.py
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from infrastructure.payouts.archive import archive_terminal_payouts
+from payouts.application.use_cases import CreatePayoutUseCase
+from payouts.models import Payout, PayoutArchive, Recipient
+from payouts.repositories import PayoutRepository
+
+User = get_user_model()
+
+
+def _create_recipient() -> Recipient:
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+
+def _create_payout(recipient: Recipient, key: str, status: str) -> Payout:
+    payout, _ = CreatePayoutUseCase.execute(
+        recipient_id=recipient.id,
+        amount=Decimal("10.00"),
+        currency="USD",
+        idempotency_key=key,
+    )
+    if status == "COMPLETED":
+        # The status trigger only allows COMPLETED to be entered from PROCESSING
+        Payout.objects.filter(pk=payout.pk).update(status="PROCESSING")
+    Payout.objects.filter(pk=payout.pk).update(status=status)
+    return payout
+
+
+@pytest.mark.django_db
+class TestArchiveTerminalPayouts:
+    def test_moves_only_terminal_payouts_before_cutoff(self):
+        recipient = _create_recipient()
+        completed = _create_payout(recipient, "idem-arch-1", "COMPLETED")
+        failed = _create_payout(recipient, "idem-arch-2", "FAILED")
+        new = _create_payout(recipient, "idem-arch-3", "NEW")
+
+        archived = archive_terminal_payouts(
+            cutoff=timezone.now() + timedelta(seconds=1), batch_size=1
+        )
+
+        assert archived == 2
+        assert list(Payout.objects.values_list("id", flat=True)) == [new.id]
+        assert set(PayoutArchive.objects.values_list("id", flat=True)) == {
+            completed.id,
+            failed.id,
+        }
+        row = PayoutArchive.objects.get(pk=completed.id)
+        assert row.idempotency_key == "idem-arch-1"
+        assert row.created_at == completed.created_at
+        assert row.archived_at is not None
+
+    def test_respects_cutoff(self):
+        recipient = _create_recipient()
+        _create_payout(recipient, "idem-arch-4", "COMPLETED")
+
+        archived = archive_terminal_payouts(
+            cutoff=timezone.now() - timedelta(days=90), batch_size=100
+        )
+
+        assert archived == 0
+        assert Payout.objects.count() == 1
+
+    def test_management_command(self):
+        _create_payout(_create_recipient(), "idem-arch-5", "COMPLETED")
+
+        call_command("archive_payouts", "--older-than-days", "1")
+
+        # Created just now: not past the 1-day cutoff
+        assert PayoutArchive.objects.count() == 0
+
+
+@pytest.mark.django_db
+class TestArchiveReadFallback:
+    def _archive(self, key: str) -> Payout:
+        payout = _create_payout(_create_recipient(), key, "COMPLETED")
+        archive_terminal_payouts(
+            cutoff=timezone.now() + timedelta(seconds=1), batch_size=100
+        )
+        return payout
+
+    def test_get_by_id_falls_back_to_archive(self):
+        payout = self._archive("idem-arch-r-1")
+
+        loaded = PayoutRepository.get_by_id(payout.id)
+
+        assert loaded.id == payout.id
+        assert loaded.status == Payout.Status.COMPLETED
+        assert loaded.recipient.name == "John Doe"
+
+    def test_idempotency_preserved_for_archived_key(self):
+        payout = self._archive("idem-arch-r-2")
+
+        again, is_duplicate = CreatePayoutUseCase.execute(
+            recipient_id=payout.recipient_id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-arch-r-2",
+        )
+
+        assert is_duplicate is True
+        assert again.id == payout.id
+        assert Payout.objects.count() == 0
+
+    def test_api_retrieve_and_delete_archived_payout(self):
+        payout = self._archive("idem-arch-r-3")
+        client = APIClient()
+
+        response = client.get(f"/api/payouts/{payout.id}/")
+        assert response.status_code == 200
+        assert response.json()["status"] == Payout.Status.COMPLETED
+
+        admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+        client.force_authenticate(user=admin)
+        response = client.delete(f"/api/payouts/{payout.id}/")
+        assert response.status_code == 204
+        assert not PayoutArchive.objects.filter(pk=payout.id).exists()
@@ -0,0 +1,147 @@
+# backend/tests/infrastructure/test_db_pool.py
+import threading
+import time
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+from django.db import connections
+from psycopg2 import extensions
+
+from infrastructure.db_pool.base import DatabaseWrapper
+from infrastructure.db_pool.pool import ConnectionPool, PoolSettings, PoolTimeout
+
+
+def _fake_connection(status=extensions.TRANSACTION_STATUS_IDLE):
+    connection = MagicMock()
+    connection.closed = 0
+    connection.autocommit = True
+    connection.info.transaction_status = status
+    return connection
+
+
+@pytest.fixture
+def make_pool():
+    pools = []
+
+    def _make(**options) -> ConnectionPool:
+        pool = ConnectionPool("test", PoolSettings.from_dict(options))
+        pools.append(pool)
+        return pool
+
+    yield _make
+    for pool in pools:
+        pool.close_idle()
+
+
+class TestConnectionPool:
+    def test_returned_connection_is_reused(self, make_pool):
+        pool = make_pool(max_size=2)
+        connect = MagicMock(side_effect=lambda: _fake_connection())
+
+        first = pool.getconn(connect)
+        pool.putconn(first)
+        second = pool.getconn(connect)
+
+        assert second.connection is first.connection
+        assert connect.call_count == 1
+        assert pool.stats() == {"idle": 0, "in_use": 1, "waiting": 0, "max_size": 2}
+
+    def test_exhausted_pool_times_out(self, make_pool):
+        pool = make_pool(max_size=1, timeout=0.05)
+        pool.getconn(_fake_connection)
+
+        with pytest.raises(PoolTimeout):
+            pool.getconn(_fake_connection)
+
+    def test_waiter_gets_returned_connection(self, make_pool):
+        pool = make_pool(max_size=1, timeout=2)
+        held = pool.getconn(_fake_connection)
+        threading.Timer(0.05, pool.putconn, args=[held]).start()
+
+        entry = pool.getconn(_fake_connection)
+
+        assert entry.connection is held.connection
+
+    def test_expired_connection_is_replaced(self, make_pool):
+        pool = make_pool(max_lifetime=0.01)
+        first = pool.getconn(_fake_connection)
+        time.sleep(0.02)
+
+        pool.putconn(first)
+        second = pool.getconn(_fake_connection)
+
+        first.connection.close.assert_called_once()
+        assert second.connection is not first.connection
+
+    def test_open_transaction_is_rolled_back_on_return(self, make_pool):
+        pool = make_pool()
+        connection = _fake_connection(extensions.TRANSACTION_STATUS_INTRANS)
+        entry = pool.getconn(lambda: connection)
+
+        pool.putconn(entry)
+
+        connection.rollback.assert_called_once()
+        assert pool.stats()["idle"] == 1
+
+    def test_connection_in_unknown_state_is_discarded(self, make_pool):
+        pool = make_pool()
+        connection = _fake_connection(extensions.TRANSACTION_STATUS_UNKNOWN)
+        pool.putconn(pool.getconn(lambda: connection))
+
+        connection.close.assert_called_once()
+        assert pool.stats()["idle"] == 0
+
+    def test_stale_connection_failing_health_check_is_replaced(self, make_pool):
+        pool = make_pool(check_after=0)
+        stale = _fake_connection()
+        stale.cursor.return_value.__enter__.return_value.execute.side_effect = (
+            psycopg2.OperationalError()
+        )
+        pool.putconn(pool.getconn(lambda: stale))
+
+        fresh = _fake_connection()
+        entry = pool.getconn(lambda: fresh)
+
+        assert entry.connection is fresh
+        stale.close.assert_called_once()
+
+    def test_reap_closes_idle_connections_above_min_idle(self, make_pool):
+        pool = make_pool(max_size=3, min_idle=1, max_idle_time=0)
+        entries = [pool.getconn(_fake_connection) for _ in range(3)]
+        for entry in entries:
+            pool.putconn(entry)
+
+        pool.reap()
+
+        assert pool.stats()["idle"] == 1
+        # Most recently used connection is the one kept
+        entries[-1].connection.close.assert_not_called()
+
+
+@pytest.mark.django_db
+def test_backend_returns_connections_to_pool():
+    settings_dict = {
+        **connections["default"].settings_dict,
+        "ENGINE": "infrastructure.db_pool",
+        "CONN_MAX_AGE": 0,
+        "POOL": {"max_size": 2},
+    }
+    wrapper = DatabaseWrapper(settings_dict, alias="pool_test")
+
+    try:
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT pg_backend_pid()")
+            first_pid = cursor.fetchone()[0]
+        wrapper.close()
+
+        assert wrapper.pool.stats()["idle"] == 1
+
+        with wrapper.cursor() as cursor:
+            cursor.execute("SELECT pg_backend_pid()")
+            second_pid = cursor.fetchone()[0]
+        wrapper.close()
+
+        assert second_pid == first_pid
+    finally:
+        wrapper.pool.close_idle()
@@ -0,0 +1,185 @@
+# backend/tests/infrastructure/test_db_router.py
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, router
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from config.interfaces.http.authentication import get_principal_cache, issue_token
+from infrastructure import db_router
+from infrastructure.db_router import replica_reads
+from payouts.models import Payout, Recipient
+
+User = get_user_model()
+
+pytestmark = [
+    # The replica alias mirrors the test database through its own connection,
+    # so fixtures must be committed to be visible there.
+    pytest.mark.django_db(transaction=True, databases=["default", "replica"]),
+]
+
+
+@pytest.fixture(autouse=True)
+def _replica_routing():
+    db_router._freshness.clear()
+    cache.clear()
+    with override_settings(DATABASE_REPLICAS=["replica"]):
+        yield
+    db_router._freshness.clear()
+
+
+def _create_payout() -> Payout:
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+    return Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal("10.00"),
+        currency="USD",
+        status=Payout.Status.NEW,
+        recipient_name_snapshot=recipient.name,
+        account_number_snapshot=recipient.account_number,
+        bank_code_snapshot=recipient.bank_code,
+        idempotency_key="idem-router-1",
+    )
+
+
+def test_reads_use_primary_outside_replica_block():
+    assert router.db_for_read(Payout) == DEFAULT_DB_ALIAS
+    with replica_reads():
+        assert router.db_for_read(Payout) == "replica"
+        assert router.db_for_write(Payout) == DEFAULT_DB_ALIAS
+
+
+def test_lagging_replica_falls_back_to_primary():
+    with override_settings(DB_REPLICA_MAX_LAG_SECONDS=-1), replica_reads():
+        assert router.db_for_read(Payout) == DEFAULT_DB_ALIAS
+
+
+def test_unavailable_replica_falls_back_to_primary():
+    broken = MagicMock()
+    broken.__getitem__.return_value.cursor.side_effect = OperationalError()
+
+    with patch.object(db_router, "connections", broken), replica_reads():
+        assert router.db_for_read(Payout) == DEFAULT_DB_ALIAS
+
+
+def test_get_reads_from_replica():
+    payout = _create_payout()
+
+    with CaptureQueriesContext(connections["replica"]) as replica_ctx:
+        response = APIClient().get(f"/api/payouts/{payout.id}/")
+
+    assert response.status_code == 200
+    assert any('FROM "payouts_payout"' in q["sql"] for q in replica_ctx)
+
+
+def test_client_is_pinned_to_primary_after_write():
+    payout = _create_payout()
+    client = APIClient()
+
+    response = client.post(
+        "/api/payouts/",
+        data={
+            "recipient_id": payout.recipient_id,
+            "amount": "5.00",
+            "currency": "USD",
+            "idempotency_key": "idem-router-2",
+        },
+        format="json",
+    )
+    assert response.status_code == 201
+
+    with CaptureQueriesContext(connections["replica"]) as replica_ctx:
+        response = client.get(f"/api/payouts/{response.json()['id']}/")
+
+    assert response.status_code == 200
+    assert len(replica_ctx) == 0
+
+
+def test_token_client_is_pinned_to_primary_after_write():
+    payout = _create_payout()
+    get_principal_cache().clear()
+    client = APIClient()
+    client.credentials(
+        HTTP_AUTHORIZATION=f"Bearer {issue_token(User.objects.create_user('api'))}"
+    )
+
+    response = client.post(
+        "/api/payouts/",
+        data={
+            "recipient_id": payout.recipient_id,
+            "amount": "5.00",
+            "currency": "USD",
+            "idempotency_key": "idem-router-3",
+        },
+        format="json",
+    )
+    assert response.status_code == 201
+
+    with CaptureQueriesContext(connections["replica"]) as replica_ctx:
+        response = client.get(f"/api/payouts/{response.json()['id']}/")
+
+    assert response.status_code == 200
+    assert len(replica_ctx) == 0
+
+
+def test_pinned_client_skips_cached_list_page():
+    payout = _create_payout()
+    writer = APIClient(REMOTE_ADDR="10.0.0.1")
+    reader = APIClient(REMOTE_ADDR="10.0.0.2")
+    assert len(reader.get("/api/payouts/").json()["results"]) == 1
+
+    # A page cached from a lagging replica under the current version
+    with patch("infrastructure.payouts.tasks.bump_payouts_list_cache_version"):
+        response = writer.post(
+            "/api/payouts/",
+            data={
+                "recipient_id": payout.recipient_id,
+                "amount": "5.00",
+                "currency": "USD",
+                "idempotency_key": "idem-router-4",
+            },
+            format="json",
+        )
+    assert response.status_code == 201
+
+    assert len(reader.get("/api/payouts/").json()["results"]) == 1
+    assert len(writer.get("/api/payouts/").json()["results"]) == 2
+
+
+@override_settings(CLIENT_IP_PROXY_COUNT=1)
+def test_anonymous_client_is_pinned_by_forwarded_ip():
+    payout = _create_payout()
+    writer = APIClient(REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="203.0.113.1")
+    other = APIClient(REMOTE_ADDR="10.0.0.1", HTTP_X_FORWARDED_FOR="203.0.113.2")
+
+    response = writer.post(
+        "/api/payouts/",
+        data={
+            "recipient_id": payout.recipient_id,
+            "amount": "5.00",
+            "currency": "USD",
+            "idempotency_key": "idem-router-5",
+        },
+        format="json",
+    )
+    assert response.status_code == 201
+
+    with CaptureQueriesContext(connections["replica"]) as replica_ctx:
+        other.get(f"/api/payouts/{payout.id}/")
+    assert len(replica_ctx) > 0
+
+    with CaptureQueriesContext(connections["replica"]) as replica_ctx:
+        writer.get(f"/api/payouts/{payout.id}/")
+    assert len(replica_ctx) == 0
@@ -0,0 +1,123 @@
+# backend/tests/infrastructure/test_generator_payouts.py
+import random
+from datetime import datetime, timedelta, timezone
+from io import StringIO
+
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import connection
+
+from infrastructure.payouts.generator import IN_FLIGHT_SECONDS, PayoutRowGenerator
+from payouts.domain.value_objects import IdempotencyKey
+from payouts.models import Payout, PayoutIdempotencyKey, Recipient
+from payouts.repositories import PayoutRepository
+
+UNTIL = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def generator() -> PayoutRowGenerator:
+    recipients = Recipient.objects.bulk_create(
+        Recipient(
+            type=Recipient.Type.INDIVIDUAL,
+            name=f"R{index}",
+            account_number=f"UA{index}",
+            bank_code="000001",
+        )
+        for index in range(50)
+    )
+    return PayoutRowGenerator(
+        random.Random(1),
+        first_recipient_id=recipients[0].id,
+        recipients=len(recipients),
+        until=UNTIL,
+        years=2,
+        skew=1.1,
+    )
+
+
+def _rows(generator: PayoutRowGenerator, seed: float, count: int = 2000):
+    with connection.cursor() as cursor:
+        return generator.rows(cursor, seed, 1000, 0, count, "gen1-")
+
+
+@pytest.mark.django_db
+def test_rows_are_deterministic_per_seed(generator):
+    assert _rows(generator, 0.1) == _rows(generator, 0.1)
+    assert _rows(generator, 0.1) != _rows(generator, 0.2)
+
+
+@pytest.mark.django_db
+def test_rows_are_skewed_and_ordered_by_time(generator):
+    rows = _rows(generator, 0.1)
+    ids = [row[0] for row in rows]
+    created = [row[9] for row in rows]
+
+    assert ids == list(range(1000, 1000 + len(rows)))
+    assert created == sorted(created)
+    assert UNTIL - timedelta(days=731) <= created[0] and created[-1] <= UNTIL
+
+    # Hot recipients: the busiest of 50 gets far more than an even 2%
+    per_recipient = {}
+    for row in rows:
+        per_recipient[row[1]] = per_recipient.get(row[1], 0) + 1
+    assert max(per_recipient.values()) > len(rows) * 0.1
+
+    in_flight_cutoff = UNTIL - timedelta(seconds=IN_FLIGHT_SECONDS)
+    for row, created_at in zip(rows, created):
+        if created_at < in_flight_cutoff:
+            assert row[5] in ("COMPLETED", "FAILED")
+        assert created_at <= row[10] <= UNTIL
+
+
+def _schema() -> set[str]:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT indexname FROM pg_indexes
+            WHERE tablename IN ('payouts_payout', 'payouts_payout_idempotency_key')
+            UNION ALL
+            SELECT conname FROM pg_constraint
+            WHERE conrelid IN (
+                'payouts_payout'::regclass, 'payouts_payout_idempotency_key'::regclass
+            )
+            """
+        )
+        return {row[0] for row in cursor.fetchall()}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("options", [[], ["--defer-indexes"]])
+def test_command_loads_payouts_and_key_registry(options):
+    out = StringIO()
+    schema = _schema()
+
+    call_command(
+        "generate_payouts",
+        "--recipients=20",
+        "--payouts=250",
+        "--batch-size=100",
+        "--years=1",
+        "--until=2026-01-01",
+        "--seed=7",
+        *options,
+        stdout=out,
+    )
+
+    # Deferred indexes and constraints are rebuilt under their own names
+    assert _schema() == schema
+
+    assert "Generated 20 recipients and 250 payouts" in out.getvalue()
+    assert Recipient.objects.count() == 20
+    assert Payout.objects.count() == 250
+    assert PayoutIdempotencyKey.objects.count() == 250
+
+    payout = PayoutRepository.get_by_idempotency_key(
+        IdempotencyKey("gen7-000000000042")
+    )
+    assert payout.idempotency_key == "gen7-000000000042"
+    assert payout.recipient_name_snapshot == payout.recipient.name
+
+    # Keys derive from the seed: a rerun would collide
+    with pytest.raises(CommandError, match="seed 7 already exist"):
+        call_command("generate_payouts", "--seed=7", stdout=StringIO())
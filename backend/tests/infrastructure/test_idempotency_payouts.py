@@ -0,0 +1,69 @@
+# backend/tests/infrastructure/test_idempotency_payouts.py
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from infrastructure.payouts.idempotency import expire_idempotency_keys
+from payouts.application.use_cases import CreatePayoutUseCase
+from payouts.domain.value_objects import IdempotencyKey
+from payouts.models import Payout, PayoutIdempotencyKey, Recipient
+
+
+def _create_payout(key: str, *, registered_days_ago: int = 0) -> Payout:
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+    payout, _ = CreatePayoutUseCase.execute(
+        recipient_id=recipient.id,
+        amount=Decimal("10.00"),
+        currency="USD",
+        idempotency_key=key,
+    )
+    PayoutIdempotencyKey.objects.filter(payout_id=payout.id).update(
+        created_at=timezone.now() - timedelta(days=registered_days_ago)
+    )
+    return payout
+
+
+@pytest.mark.django_db
+class TestIdempotencyKeyExpiry:
+    def test_registry_stores_fixed_width_hash(self):
+        payout = _create_payout("idem-hash-1")
+
+        entry = PayoutIdempotencyKey.objects.get(payout_id=payout.id)
+        assert entry.key_hash == IdempotencyKey("  idem-hash-1 ").hash
+        assert len(entry.key_hash.bytes) == 16
+
+    def test_expires_only_keys_past_cutoff_in_batches(self):
+        old = [_create_payout(f"idem-exp-{i}", registered_days_ago=40) for i in (1, 2)]
+        fresh = _create_payout("idem-exp-3", registered_days_ago=1)
+
+        expired = expire_idempotency_keys(
+            cutoff=timezone.now() - timedelta(days=30), batch_size=1
+        )
+
+        assert expired == 2
+        remaining = PayoutIdempotencyKey.objects.values_list("payout_id", flat=True)
+        assert list(remaining) == [fresh.id]
+        # Payouts themselves are kept
+        assert Payout.objects.filter(pk__in=[p.id for p in old]).count() == 2
+
+    def test_expired_key_creates_new_payout(self):
+        first = _create_payout("idem-exp-4", registered_days_ago=40)
+        call_command("expire_idempotency_keys", "--older-than-days", "30")
+
+        again, is_duplicate = CreatePayoutUseCase.execute(
+            recipient_id=first.recipient_id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-exp-4",
+        )
+
+        assert is_duplicate is False
+        assert again.id != first.id
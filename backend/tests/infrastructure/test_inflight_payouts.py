@@ -0,0 +1,153 @@
+# backend/tests/infrastructure/test_inflight_payouts.py
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+import redis
+from rest_framework.test import APIClient
+
+from infrastructure.payouts import inflight
+from infrastructure.payouts.inflight import InflightCreate
+from payouts.models import Payout, Recipient
+
+
+class FakeRedis:
+    """
+    In-memory stand-in for the commands and scripts InflightCreate uses.
+    ``on_get`` runs before every GET, so a test can act "while waiting".
+    """
+
+    def __init__(self, on_get=None):
+        self.values: dict[str, tuple[str, float]] = {}
+        self.on_get = on_get
+
+    def _live(self, key):
+        value = self.values.get(key)
+        if value is not None and value[1] <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    def get(self, key):
+        if self.on_get is not None:
+            self.on_get(self)
+        value = self._live(key)
+        return value[0] if value is not None else None
+
+    def set(self, key, value, nx=False, px=None):
+        if nx and self._live(key) is not None:
+            return None
+        self.values[key] = (value, time.monotonic() + px / 1000)
+        return True
+
+    def register_script(self, lua):
+        def publish(keys, args):
+            self.set(keys[1], args[1], px=int(args[2]))
+            release(keys[:1], args[:1])
+
+        def release(keys, args):
+            if self.get(keys[0]) == args[0]:
+                del self.values[keys[0]]
+
+        return publish if lua == inflight._PUBLISH_SCRIPT else release
+
+
+def _inflight(client, **overrides) -> InflightCreate:
+    options = {"lease_ms": 1000, "wait_ms": 1000, "result_ttl_ms": 1000}
+    return InflightCreate("idem-inflight-1", client=client, **{**options, **overrides})
+
+
+class TestInflightCreate:
+    @pytest.fixture(autouse=True)
+    def _no_transaction(self, monkeypatch):
+        # Outside a transaction on_commit callbacks run immediately
+        monkeypatch.setattr(inflight.transaction, "on_commit", lambda func: func())
+
+    def test_duplicate_returns_leader_result_without_creating(self):
+        client = FakeRedis()
+        calls = []
+
+        def create():
+            calls.append(1)
+            return {"id": 1}, False
+
+        assert _inflight(client).run(create) == ({"id": 1}, False)
+        assert _inflight(client).run(create) == ({"id": 1}, True)
+        assert len(calls) == 1
+
+    def test_waiter_receives_result_published_while_waiting(self):
+        leader = _inflight(FakeRedis())
+        client = FakeRedis()
+        client.set(leader.lease_key, leader.token, px=1000)
+        gets = []
+
+        def leader_finishes(fake):
+            gets.append(1)
+            if len(gets) == 3:
+                fake.register_script(inflight._PUBLISH_SCRIPT)(
+                    keys=[leader.lease_key, leader.result_key],
+                    args=[leader.token, '{"id": 2}', 1000],
+                )
+
+        client.on_get = leader_finishes
+
+        assert _inflight(client).run(pytest.fail) == ({"id": 2}, True)
+
+    def test_failed_leader_hands_over_to_waiters(self):
+        client = FakeRedis()
+
+        def fail():
+            raise RuntimeError("provider down")
+
+        with pytest.raises(RuntimeError):
+            _inflight(client).run(fail)
+
+        assert _inflight(client).run(lambda: ({"id": 3}, False)) == ({"id": 3}, False)
+
+    def test_stale_lease_expires_and_is_taken_over(self):
+        client = FakeRedis()
+        crashed = _inflight(client, lease_ms=30)
+        client.set(crashed.lease_key, crashed.token, nx=True, px=30)
+
+        result = _inflight(client).run(lambda: ({"id": 4}, False))
+
+        assert result == ({"id": 4}, False)
+
+    def test_runs_without_coalescing_when_redis_is_down(self):
+        client = FakeRedis()
+        client.get = lambda key: (_ for _ in ()).throw(redis.ConnectionError())
+
+        assert _inflight(client).run(lambda: ({"id": 5}, False)) == ({"id": 5}, False)
+
+
+@pytest.mark.django_db
+def test_api_duplicate_is_answered_without_database(
+    settings, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    settings.PAYOUT_INFLIGHT_COALESCING_ENABLED = True
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+    body = {
+        "recipient_id": recipient.id,
+        "amount": "10.00",
+        "currency": "USD",
+        "idempotency_key": "idem-inflight-api",
+    }
+    client = APIClient()
+
+    with patch.object(inflight, "get_redis_client", return_value=FakeRedis()):
+        with django_capture_on_commit_callbacks(execute=True):
+            first = client.post("/api/payouts/", body, format="json")
+        with django_assert_num_queries(0):
+            second = client.post("/api/payouts/", body, format="json")
+
+    assert first.status_code == 201
+    assert second.status_code == 200
+    assert second.json() == first.json()
+    assert Payout.objects.count() == 1
+    assert Decimal(second.json()["amount"]) == Decimal("10.00")
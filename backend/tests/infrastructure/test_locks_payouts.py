@@ -0,0 +1,182 @@
+# backend/tests/infrastructure/test_locks_payouts.py
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from django.test import override_settings
+from prometheus_client import REGISTRY
+
+from core.exceptions import DomainConflictError
+from infrastructure.payouts import locks
+from infrastructure.payouts.locks import LockLostError, PayoutExecutionLock
+from infrastructure.payouts.tasks import _process_payout, process_payout_task
+from payouts.models import Payout, Recipient
+
+
+def _fake_client(*, acquire=1, extend=1, release=1):
+    """Redis client double whose registered scripts return fixed values."""
+    scripts = {
+        locks._ACQUIRE_SCRIPT: MagicMock(return_value=acquire),
+        locks._EXTEND_SCRIPT: MagicMock(return_value=extend),
+        locks._RELEASE_SCRIPT: MagicMock(return_value=release),
+    }
+    client = MagicMock()
+    client.register_script.side_effect = lambda lua: scripts[lua]
+    return client, scripts
+
+
+def _suppressed_count() -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "payouts_task_duplicates_suppressed_total",
+            {"task": "process_payout_task"},
+        )
+        or 0.0
+    )
+
+
+class TestPayoutExecutionLock:
+    def test_acquire_returns_fencing_token(self):
+        client, scripts = _fake_client(acquire=7)
+        lock = PayoutExecutionLock(42, client=client, ttl_ms=3000)
+
+        assert lock.acquire() is True
+        assert lock.fencing_token == 7
+        lock.ensure_held()
+
+        lock.release()
+        scripts[locks._RELEASE_SCRIPT].assert_called_once_with(
+            keys=["payouts:lock:process:42"], args=[7]
+        )
+
+    def test_acquire_fails_when_already_held(self):
+        client, _ = _fake_client(acquire=0)
+        lock = PayoutExecutionLock(42, client=client, ttl_ms=3000)
+
+        assert lock.acquire() is False
+        assert lock.fencing_token is None
+
+    def test_acquire_fails_open_when_redis_unavailable(self):
+        client, scripts = _fake_client()
+        scripts[locks._ACQUIRE_SCRIPT].side_effect = redis.ConnectionError()
+        lock = PayoutExecutionLock(42, client=client, ttl_ms=3000)
+
+        assert lock.acquire() is True
+        assert lock.degraded is True
+        lock.ensure_held()
+        lock.release()
+
+    def test_ensure_held_raises_after_takeover(self):
+        client, _ = _fake_client(acquire=3, extend=0)
+        lock = PayoutExecutionLock(42, client=client, ttl_ms=30)
+
+        assert lock.acquire() is True
+        lock._renewer.join(timeout=1)
+
+        with pytest.raises(LockLostError):
+            lock.ensure_held()
+        lock.release()
+
+
+def _create_payout(idempotency_key: str) -> Payout:
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+    return Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal("50.00"),
+        currency="USD",
+        status=Payout.Status.NEW,
+        recipient_name_snapshot=recipient.name,
+        account_number_snapshot=recipient.account_number,
+        bank_code_snapshot=recipient.bank_code,
+        idempotency_key=idempotency_key,
+    )
+
+
+def _held_lock(payout: Payout, token: int) -> PayoutExecutionLock:
+    client, _ = _fake_client(acquire=token)
+    lock = PayoutExecutionLock(payout.id, client=client, ttl_ms=60_000)
+    assert lock.acquire() is True
+    return lock
+
+
+@pytest.mark.django_db
+@override_settings(PAYOUT_TASK_LOCK_ENABLED=True)
+def test_process_payout_task_skips_duplicate_delivery():
+    payout = _create_payout("idem-lock-1")
+    client, _ = _fake_client(acquire=0)
+    suppressed_before = _suppressed_count()
+
+    with patch(
+        "infrastructure.payouts.locks.get_redis_client", return_value=client
+    ), patch(
+        "infrastructure.payouts.tasks.PayoutRepository.get_by_id"
+    ) as mock_get_by_id:
+        process_payout_task(payout.id)
+
+    mock_get_by_id.assert_not_called()
+    payout.refresh_from_db()
+    assert payout.status == Payout.Status.NEW
+    assert _suppressed_count() == suppressed_before + 1
+
+
+@pytest.mark.django_db
+def test_stale_lease_cannot_commit_after_newer_claim():
+    payout = _create_payout("idem-lock-2")
+    lock = _held_lock(payout, token=5)
+
+    def taken_over(payout):
+        # A newer lease holder claims the row during the provider call
+        Payout.objects.filter(pk=payout.pk).update(fencing_token=6)
+
+    try:
+        with patch(
+            "infrastructure.payouts.tasks.send_payout", side_effect=taken_over
+        ), pytest.raises(DomainConflictError):
+            _process_payout(MagicMock(), payout.id, lock=lock)
+    finally:
+        lock.release()
+
+    payout.refresh_from_db()
+    assert payout.status == Payout.Status.NEW
+
+
+@pytest.mark.django_db
+def test_stale_lease_skips_payout_claimed_by_newer_lease():
+    payout = _create_payout("idem-lock-3")
+    Payout.objects.filter(pk=payout.pk).update(fencing_token=9)
+    lock = _held_lock(payout, token=5)
+
+    try:
+        with patch("infrastructure.payouts.tasks.send_payout") as mock_send:
+            _process_payout(MagicMock(), payout.id, lock=lock)
+    finally:
+        lock.release()
+
+    mock_send.assert_not_called()
+    payout.refresh_from_db()
+    assert payout.status == Payout.Status.NEW
+    assert payout.fencing_token == 9
+
+
+@pytest.mark.django_db
+def test_lease_holder_completes_with_its_token():
+    payout = _create_payout("idem-lock-4")
+    lock = _held_lock(payout, token=5)
+
+    try:
+        with patch("infrastructure.payouts.tasks.send_payout"):
+            _process_payout(MagicMock(), payout.id, lock=lock)
+    finally:
+        lock.release()
+
+    payout.refresh_from_db()
+    assert payout.status == Payout.Status.COMPLETED
+    assert payout.fencing_token == 5
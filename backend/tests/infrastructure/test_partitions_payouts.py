@@ -0,0 +1,213 @@
+# backend/tests/infrastructure/test_partitions_payouts.py
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+
+from infrastructure.payouts.partitions import (
+    add_months,
+    detach_payout_partitions,
+    ensure_payout_partitions,
+    list_payout_partitions,
+    payout_partition_name,
+)
+from payouts.application.use_cases import CreatePayoutUseCase
+from payouts.domain.value_objects import IdempotencyKey
+from payouts.models import Payout, PayoutIdempotencyKey, Recipient
+from payouts.repositories import PayoutRepository
+from payouts.selectors import list_payouts
+
+
+def _create_recipient() -> Recipient:
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+
+def _create_payout_at(recipient: Recipient, created_at: datetime, key: str) -> Payout:
+    payout = Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal("10.00"),
+        currency="USD",
+        status=Payout.Status.COMPLETED,
+        recipient_name_snapshot=recipient.name,
+        account_number_snapshot=recipient.account_number,
+        bank_code_snapshot=recipient.bank_code,
+        idempotency_key=key,
+    )
+    # auto_now_add ignores explicit values on create
+    Payout.objects.filter(pk=payout.pk).update(created_at=created_at)
+    return payout
+
+
+def _partition_of(payout_id: int) -> str:
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT tableoid::regclass::text FROM payouts_payout WHERE id = %s",
+            [payout_id],
+        )
+        return cursor.fetchone()[0]
+
+
+@pytest.mark.django_db
+class TestPayoutPartitions:
+    def test_migration_creates_current_and_future_partitions(self):
+        current = date.today().replace(day=1)
+        months = list_payout_partitions()
+
+        assert current in months
+        assert add_months(current, 3) in months
+
+    def test_ensure_moves_rows_out_of_default_partition(self):
+        old_month = add_months(date.today().replace(day=1), -24)
+        payout = _create_payout_at(
+            _create_recipient(),
+            datetime(old_month.year, old_month.month, 15, tzinfo=timezone.utc),
+            "idem-part-1",
+        )
+        assert _partition_of(payout.id) == "payouts_payout_default"
+
+        created = ensure_payout_partitions(months_ahead=3, start=old_month)
+
+        assert payout_partition_name(old_month) in created
+        assert _partition_of(payout.id) == payout_partition_name(old_month)
+
+    def test_detach_old_partitions(self):
+        old_month = add_months(date.today().replace(day=1), -24)
+        payout = _create_payout_at(
+            _create_recipient(),
+            datetime(old_month.year, old_month.month, 15, tzinfo=timezone.utc),
+            "idem-part-2",
+        )
+        ensure_payout_partitions(months_ahead=3, start=old_month)
+
+        detached = detach_payout_partitions(older_than=add_months(old_month, 1))
+
+        assert detached == [payout_partition_name(old_month)]
+        assert not Payout.objects.filter(pk=payout.pk).exists()
+        assert old_month not in list_payout_partitions()
+
+    def test_management_command_ensures_partitions(self):
+        call_command("payout_partitions", "--ensure-ahead", "6")
+
+        assert add_months(date.today().replace(day=1), 6) in list_payout_partitions()
+
+    def test_list_with_created_from_prunes_partitions(self):
+        old_month = add_months(date.today().replace(day=1), -12)
+        ensure_payout_partitions(months_ahead=3, start=old_month)
+        current = date.today().replace(day=1)
+
+        plan = list_payouts(
+            created_from=datetime(current.year, current.month, 1, tzinfo=timezone.utc)
+        ).explain()
+
+        assert payout_partition_name(current) in plan
+        assert payout_partition_name(old_month) not in plan
+
+
+@pytest.mark.django_db
+class TestIdempotencyAcrossPartitions:
+    def test_create_registers_idempotency_key(self):
+        recipient = _create_recipient()
+
+        payout, _ = CreatePayoutUseCase.execute(
+            recipient_id=recipient.id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-part-key-1",
+        )
+
+        entry = PayoutIdempotencyKey.objects.get(
+            key_hash=IdempotencyKey("idem-part-key-1").hash
+        )
+        assert entry.payout_id == payout.id
+        assert entry.payout_created_at == payout.created_at
+
+    def test_lost_race_resolves_to_existing_payout(self):
+        """
+        The idempotency check misses (concurrent request not yet visible), the
+        key insert then conflicts and the existing payout is returned.
+        """
+        recipient = _create_recipient()
+        first, _ = CreatePayoutUseCase.execute(
+            recipient_id=recipient.id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-part-key-2",
+        )
+
+        lookup = PayoutRepository.get_by_idempotency_key_or_none
+        with patch.object(
+            PayoutRepository,
+            "get_by_idempotency_key_or_none",
+            side_effect=[None, lookup(IdempotencyKey("idem-part-key-2"))],
+        ):
+            second, is_duplicate = CreatePayoutUseCase.execute(
+                recipient_id=recipient.id,
+                amount=Decimal("10.00"),
+                currency="USD",
+                idempotency_key="idem-part-key-2",
+            )
+
+        assert is_duplicate is True
+        assert second.id == first.id
+        assert Payout.objects.count() == 1
+
+    def test_replay_after_detach_creates_new_payout(self):
+        recipient = _create_recipient()
+        old_month = add_months(date.today().replace(day=1), -24)
+        created_at = datetime(old_month.year, old_month.month, 15, tzinfo=timezone.utc)
+        payout = _create_payout_at(recipient, created_at, "idem-part-key-3")
+        PayoutIdempotencyKey.objects.create(
+            key_hash=IdempotencyKey("idem-part-key-3").hash,
+            payout_id=payout.id,
+            payout_created_at=created_at,
+        )
+        ensure_payout_partitions(months_ahead=3, start=old_month)
+        detach_payout_partitions(older_than=add_months(old_month, 1))
+
+        assert not PayoutIdempotencyKey.objects.filter(payout_id=payout.id).exists()
+
+        replayed, is_duplicate = CreatePayoutUseCase.execute(
+            recipient_id=recipient.id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-part-key-3",
+        )
+
+        assert is_duplicate is False
+        assert replayed.id != payout.id
+
+    def test_registered_key_of_missing_payout_is_released(self):
+        recipient = _create_recipient()
+        first, _ = CreatePayoutUseCase.execute(
+            recipient_id=recipient.id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-part-key-4",
+        )
+        # Payout gone without its key, e.g. a partition detached by hand
+        Payout.objects.filter(pk=first.pk).delete()
+
+        second, is_duplicate = CreatePayoutUseCase.execute(
+            recipient_id=recipient.id,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-part-key-4",
+        )
+
+        assert is_duplicate is False
+        assert (
+            PayoutIdempotencyKey.objects.get(
+                key_hash=IdempotencyKey("idem-part-key-4").hash
+            ).payout_id
+            == second.id
+        )
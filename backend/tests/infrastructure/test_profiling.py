@@ -0,0 +1,157 @@
+# backend/tests/infrastructure/test_profiling.py
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from config.interfaces.http.authentication import get_principal_cache, issue_token
+from infrastructure import profiling
+from infrastructure.payouts.tasks import process_payout_task
+from infrastructure.profiling import PROFILE_TASK_HEADER, StackSampler
+from payouts.api import api
+from payouts.models import Payout, Recipient
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def profiling_settings(settings, tmp_path):
+    settings.PROFILING_OUTPUT_DIR = str(tmp_path)
+    settings.PROFILING_INTERVAL_MS = 1
+    return settings
+
+
+@pytest.fixture
+def slow_list_view():
+    # Requests must outlast a few sampling intervals to leave samples
+    original = api.get_paginated_payouts_response_with_cache
+
+    def slow(**kwargs):
+        time.sleep(0.02)
+        return original(**kwargs)
+
+    with patch.object(api, "get_paginated_payouts_response_with_cache", slow):
+        yield
+
+
+def _slow_function(stop: threading.Event) -> None:
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+def test_stack_sampler_folds_stacks_of_target_thread():
+    stop = threading.Event()
+    worker = threading.Thread(target=_slow_function, args=(stop,))
+    worker.start()
+    sampler = StackSampler(worker.ident, interval=0.001).start()
+    time.sleep(0.05)
+    samples = sampler.stop()
+    stop.set()
+    worker.join()
+
+    assert sum(samples.values()) > 5
+    stack = samples.most_common(1)[0][0]
+    assert stack[-1].startswith("_slow_function (tests/infrastructure/")
+
+
+@pytest.mark.django_db
+def test_unsampled_requests_are_not_profiled(tmp_path):
+    with patch.object(profiling, "Profile") as profile:
+        response = APIClient().get("/api/payouts/", HTTP_X_PROFILE="1")
+
+    assert response.status_code == 200
+    profile.assert_not_called()
+    assert "X-Profile-File" not in response
+
+
+@pytest.mark.django_db
+def test_staff_header_profiles_request(slow_list_view, tmp_path):
+    client = APIClient()
+    client.force_login(
+        User.objects.create_user(username="staff", password="pass", is_staff=True)
+    )
+
+    response = client.get("/api/payouts/", HTTP_X_PROFILE="1")
+
+    (path,) = tmp_path.iterdir()
+    assert response["X-Profile-File"] == path.name
+    assert path.name.startswith("http-GET_payouts-list-create-")
+    lines = path.read_text().splitlines()
+    assert lines
+    assert all(line.startswith("http_GET_payouts-list-create;") for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+@pytest.mark.django_db
+def test_staff_token_header_profiles_request(slow_list_view, tmp_path):
+    get_principal_cache().clear()
+    staff = User.objects.create_user(username="staff", is_staff=True)
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {issue_token(staff)}")
+
+    response = client.get("/api/payouts/", HTTP_X_PROFILE="1")
+
+    (path,) = tmp_path.iterdir()
+    assert response["X-Profile-File"] == path.name
+
+
+@pytest.mark.django_db
+def test_sample_rate_profiles_anonymous_requests(
+    slow_list_view, profiling_settings, tmp_path
+):
+    profiling_settings.PROFILING_SAMPLE_RATE = 1.0
+
+    response = APIClient().get("/api/payouts/")
+
+    assert len(list(tmp_path.iterdir())) == 1
+    # File names are only disclosed to staff
+    assert "X-Profile-File" not in response
+
+
+@pytest.mark.django_db
+def test_tasks_are_profiled_by_rate_and_tagged(profiling_settings, tmp_path):
+    profiling_settings.PROFILING_TASK_SAMPLE_RATE = 1.0
+    profiling_settings.PAYOUT_PROVIDER_LATENCY_SECONDS = 0.02
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+    payout = Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal("10.00"),
+        currency="USD",
+        status=Payout.Status.NEW,
+        recipient_name_snapshot=recipient.name,
+        account_number_snapshot=recipient.account_number,
+        idempotency_key="idem-profile-1",
+    )
+
+    process_payout_task.apply(args=[payout.id])
+
+    (path,) = tmp_path.iterdir()
+    assert path.name.startswith(
+        "task-infrastructure.payouts.tasks.process_payout_task-"
+    )
+    assert "send_payout (infrastructure/payouts/provider.py" in path.read_text()
+
+
+def test_profiled_scope_marks_published_tasks():
+    headers = {}
+    profiling._on_before_task_publish(headers=headers)
+    assert PROFILE_TASK_HEADER not in headers
+
+    profile = profiling.start_profile("http", sample_rate=0, forced=True)
+    try:
+        profiling._on_before_task_publish(headers=headers)
+        # Already profiling this context: no nested profile
+        assert profiling.start_profile("task", sample_rate=1.0) is None
+    finally:
+        profile.finish("test")
+
+    assert headers[PROFILE_TASK_HEADER] == "1"
@@ -0,0 +1,168 @@
+# backend/tests/infrastructure/test_query_instrumentation.py
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from infrastructure.payouts.tasks import process_payout_task
+from infrastructure.query_instrumentation import (
+    _can_analyze,
+    instrument_queries,
+    query_shape,
+)
+from payouts.models import Payout, Recipient
+
+User = get_user_model()
+
+
+def _recipient() -> Recipient:
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+
+def _payout(recipient: Recipient, key: str) -> Payout:
+    return Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal("10.00"),
+        currency="USD",
+        status=Payout.Status.NEW,
+        recipient_name_snapshot=recipient.name,
+        account_number_snapshot=recipient.account_number,
+        bank_code_snapshot=recipient.bank_code,
+        idempotency_key=key,
+    )
+
+
+def test_query_shape_collapses_literals_and_in_lists():
+    assert query_shape(
+        "SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = 'x''y'\n LIMIT 21"
+    ) == query_shape("SELECT * FROM t WHERE id IN (%s) AND name = 'z' LIMIT 5")
+    assert query_shape('SAVEPOINT "s140_x1"') == 'SAVEPOINT "?"'
+    assert query_shape("SELECT 1 FROM payouts_payout_2024_01") == (
+        "SELECT ? FROM payouts_payout_2024_01"
+    )
+
+
+@pytest.mark.django_db
+def test_repeated_shapes_are_reported_with_call_site():
+    recipient = _recipient()
+    payouts = [_payout(recipient, f"idem-n1-{index}") for index in range(3)]
+
+    with instrument_queries() as stats:
+        for payout in Payout.objects.filter(pk__in=[p.pk for p in payouts]):
+            payout.recipient.name  # per-row query (no select_related)
+
+    assert stats.count == 4
+    assert stats.duplicates == 2
+    ((shape, shape_stats),) = stats.repeated(3)
+    assert '"payouts_recipient"' in shape
+    assert shape_stats.count == 3
+    assert any(
+        "test_query_instrumentation.py" in frame and "in test_repeated" in frame
+        for frame in shape_stats.stack
+    )
+
+
+@pytest.mark.django_db
+def test_slow_queries_get_explain_plans(settings):
+    settings.QUERY_SLOW_MS = 0
+    recipient = _recipient()
+
+    with instrument_queries() as stats:
+        list(Recipient.objects.filter(pk=recipient.pk))
+        Recipient.objects.filter(pk=recipient.pk).update(name="Jane Doe")
+
+    select, update = stats.slow
+    assert "Execution Time" in select.plan  # ANALYZE, BUFFERS
+    # Writes are only planned, never executed a second time
+    assert update.plan.startswith("Update on")
+    assert "actual" not in update.plan
+    assert stats.count == 2
+
+
+@pytest.mark.django_db
+def test_locking_and_volatile_selects_are_only_planned(settings):
+    settings.QUERY_SLOW_MS = 0
+    recipient = _recipient()
+
+    with transaction.atomic(), instrument_queries() as stats:
+        list(Recipient.objects.select_for_update().filter(pk=recipient.pk))
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", [42])
+
+    locking, advisory = stats.slow
+    assert "actual" not in locking.plan
+    assert "actual" not in advisory.plan
+
+
+def test_can_analyze_only_read_only_selects():
+    assert _can_analyze(
+        'SELECT COUNT(*) FROM "t" WHERE "t"."id" IN (SELECT "id" FROM "u")'
+    )
+    assert _can_analyze("SELECT * FROM t WHERE name = 'nextval(x)'")
+    assert not _can_analyze("SELECT * FROM t WHERE id = 1 FOR UPDATE OF t")
+    assert not _can_analyze("SELECT * FROM t FOR NO KEY UPDATE SKIP LOCKED")
+    assert not _can_analyze("SELECT nextval('t_id_seq')")
+    assert not _can_analyze("SELECT setval('t_id_seq', 10)")
+    assert not _can_analyze("SELECT my_schema.do_work(1)")
+    assert not _can_analyze("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d")
+
+
+@pytest.mark.django_db
+def test_staff_responses_carry_query_headers(settings):
+    settings.QUERY_N_PLUS_ONE_THRESHOLD = 1
+    payout = _payout(_recipient(), "idem-headers-1")
+    url = f"/api/payouts/{payout.id}/"
+
+    anonymous = APIClient().get(url)
+    assert "X-DB-Queries" not in anonymous
+
+    client = APIClient()
+    client.force_login(
+        User.objects.create_user(username="staff", password="pass", is_staff=True)
+    )
+    response = client.get(url)
+
+    assert int(response["X-DB-Queries"]) >= 1
+    assert float(response["X-DB-Time-Ms"]) >= 0
+    assert response["X-DB-Slow-Queries"] == "0"
+    assert response["X-DB-N-Plus-One"].startswith("1x ")
+    assert response["Server-Timing"].startswith("db;dur=")
+
+
+@pytest.mark.django_db
+def test_tasks_are_measured_per_task(settings):
+    settings.QUERY_N_PLUS_ONE_THRESHOLD = 2
+    labels = {"scope": "task", "name": process_payout_task.name}
+    before = REGISTRY.get_sample_value("db_queries_per_scope_count", labels) or 0
+    n_plus_one = REGISTRY.get_sample_value("db_n_plus_one_total", labels) or 0
+    payout = _payout(_recipient(), "idem-task-scope-1")
+
+    with patch("infrastructure.payouts.provider.sleep"):
+        process_payout_task.apply(args=[payout.id])
+
+    assert REGISTRY.get_sample_value("db_queries_per_scope_count", labels) == (
+        before + 1
+    )
+    # Two status transitions repeat the UPDATE / history INSERT shapes
+    assert REGISTRY.get_sample_value("db_n_plus_one_total", labels) == n_plus_one + 1
+
+
+@pytest.mark.django_db
+def test_query_budget_fixture_fails_on_repeats(query_budget):
+    recipient = _recipient()
+
+    with pytest.raises(pytest.fail.Exception, match="ran more than 1x"):
+        with query_budget(max_queries=10):
+            Recipient.objects.get(pk=recipient.pk)
+            Recipient.objects.get(pk=recipient.pk)
@@ -0,0 +1,153 @@
+# backend/tests/infrastructure/test_rollups_payouts.py
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from infrastructure.payouts.archive import archive_terminal_payouts
+from infrastructure.payouts.rollups import (
+    recompute_payout_rollup_day,
+    refresh_payout_rollups,
+)
+from payouts.models import (
+    Payout,
+    PayoutDailyRecipientRollup,
+    PayoutDailyRollup,
+    PayoutRollupDirtyDay,
+    Recipient,
+)
+
+DAY = date(2024, 3, 14)
+OTHER_DAY = date(2024, 5, 2)
+
+
+def _recipient() -> Recipient:
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+
+
+def _payout(recipient, amount: str, *, day: date = DAY, currency="USD") -> Payout:
+    payout = Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal(amount),
+        currency=currency,
+        idempotency_key=f"idem-rollup-{amount}-{day}-{currency}",
+    )
+    created_at = datetime.combine(day, datetime.min.time(), tzinfo=timezone.utc)
+    Payout.objects.filter(pk=payout.pk).update(
+        created_at=created_at + timedelta(hours=12)
+    )
+    return payout
+
+
+def _rollup() -> set[tuple]:
+    return set(
+        PayoutDailyRecipientRollup.objects.values_list(
+            "day", "currency", "status", "recipient_id", "payout_count", "amount_total"
+        )
+    )
+
+
+def _computed(day: date) -> set[tuple]:
+    return set(
+        PayoutDailyRecipientRollup.objects.filter(day=day).values_list(
+            "id", "computed_at"
+        )
+    )
+
+
+@pytest.mark.django_db
+class TestPayoutRollups:
+    def test_refresh_recomputes_only_changed_days(self):
+        recipient = _recipient()
+        first = _payout(recipient, "10.00")
+        _payout(recipient, "5.50")
+        _payout(recipient, "7.00", currency="EUR")
+        other = _payout(recipient, "3.00", day=OTHER_DAY)
+        refresh_payout_rollups()
+        assert not PayoutRollupDirtyDay.objects.exists()
+
+        assert _rollup() == {
+            (DAY, "USD", "NEW", recipient.id, 2, Decimal("15.50")),
+            (DAY, "EUR", "NEW", recipient.id, 1, Decimal("7.00")),
+            (OTHER_DAY, "USD", "NEW", recipient.id, 1, Decimal("3.00")),
+        }
+        totals = PayoutDailyRollup.objects.filter(day=DAY).values_list(
+            "currency", "status", "payout_count", "amount_total"
+        )
+        assert set(totals) == {
+            ("USD", "NEW", 2, Decimal("15.50")),
+            ("EUR", "NEW", 1, Decimal("7.00")),
+        }
+        day_rows = _computed(DAY)
+
+        # A change on another day leaves DAY's rows alone (a recompute would
+        # replace them: new ids and computed_at)
+        Payout.objects.filter(pk=other.pk).update(status=Payout.Status.FAILED)
+        assert refresh_payout_rollups() == [OTHER_DAY]
+        assert _computed(DAY) == day_rows
+        assert refresh_payout_rollups() == []
+
+        Payout.objects.filter(pk=first.pk).update(status=Payout.Status.FAILED)
+        assert refresh_payout_rollups() == [DAY]
+        assert {row for row in _rollup() if row[0] == DAY} == {
+            (DAY, "USD", "NEW", recipient.id, 1, Decimal("5.50")),
+            (DAY, "USD", "FAILED", recipient.id, 1, Decimal("10.00")),
+            (DAY, "EUR", "NEW", recipient.id, 1, Decimal("7.00")),
+        }
+
+        Payout.objects.filter(pk=first.pk).delete()
+        assert refresh_payout_rollups() == [DAY]
+        assert (
+            DAY,
+            "USD",
+            "FAILED",
+            recipient.id,
+            1,
+            Decimal("10.00"),
+        ) not in _rollup()
+
+    def test_moving_created_at_recomputes_both_days(self):
+        recipient = _recipient()
+        payout = _payout(recipient, "10.00")
+        PayoutRollupDirtyDay.objects.all().delete()
+        recompute_payout_rollup_day(DAY)
+
+        Payout.objects.filter(pk=payout.pk).update(
+            created_at=datetime.combine(OTHER_DAY, time(12), tzinfo=timezone.utc)
+        )
+
+        assert refresh_payout_rollups() == [DAY, OTHER_DAY]
+        assert _rollup() == {
+            (OTHER_DAY, "USD", "NEW", recipient.id, 1, Decimal("10.00"))
+        }
+
+    def test_recompute_is_idempotent_and_counts_archived_payouts(self):
+        recipient = _recipient()
+        archived = _payout(recipient, "10.00")
+        _payout(recipient, "20.00")
+        Payout.objects.filter(pk=archived.pk).update(status=Payout.Status.FAILED)
+        refresh_payout_rollups()
+        before = _rollup()
+
+        archive_terminal_payouts(cutoff=datetime.now(timezone.utc), batch_size=10)
+        assert refresh_payout_rollups() == [DAY]
+        assert recompute_payout_rollup_day(DAY) == 2
+
+        assert _rollup() == before
+
+    def test_command_recomputes_a_date_range(self):
+        recipient = _recipient()
+        _payout(recipient, "10.00")
+        PayoutRollupDirtyDay.objects.all().delete()
+
+        call_command(
+            "rollup_payouts", "--from", str(DAY - timedelta(days=1)), "--to", str(DAY)
+        )
+
+        assert _rollup() == {(DAY, "USD", "NEW", recipient.id, 1, Decimal("10.00"))}
@@ -0,0 +1,115 @@
+# backend/tests/infrastructure/test_throttling.py
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from django.contrib.auth import get_user_model
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from infrastructure import throttling
+from infrastructure.throttling import GCRAThrottle, parse_rate
+from payouts.api.api import PayoutListCreateAPIView
+
+User = get_user_model()
+
+RATES = {"anon": "100/day", "user": "1000/day", "payouts_create": "2/min"}
+
+
+@pytest.fixture(autouse=True)
+def throttle_rates(settings):
+    settings.REST_FRAMEWORK = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": RATES,
+    }
+
+
+@pytest.fixture(autouse=True)
+def unregistered_script(monkeypatch):
+    monkeypatch.setattr(throttling, "_gcra", None)
+
+
+def _script(result):
+    script = MagicMock(return_value=result)
+    client = MagicMock()
+    client.register_script.return_value = script
+    return patch.object(throttling, "get_redis_client", return_value=client), script
+
+
+def _request(method="post", user=None) -> Request:
+    request = Request(getattr(APIRequestFactory(), method)("/api/payouts/"))
+    request.user = user or SimpleNamespace(is_authenticated=False)
+    return request
+
+
+VIEW = SimpleNamespace(throttle_scopes={"POST": "payouts_create"})
+
+
+def test_script_registered_once():
+    patcher, script = _script([1, 0, 0])
+
+    with patcher as get_client:
+        for _ in range(3):
+            assert GCRAThrottle().allow_request(_request(), VIEW) is True
+
+    get_client.return_value.register_script.assert_called_once()
+    assert script.call_count == 3
+
+
+def test_parse_rate():
+    assert parse_rate("30/min") == (30, 60)
+    assert parse_rate("1000/day") == (1000, 86400)
+
+
+def test_all_limits_checked_in_one_call():
+    patcher, script = _script([1, 0, 0])
+
+    with patcher:
+        assert GCRAThrottle().allow_request(_request(), VIEW) is True
+
+    script.assert_called_once_with(
+        keys=["throttle:anon:127.0.0.1", "throttle:payouts_create:127.0.0.1"],
+        # emission interval and burst tolerance (ms) per limit
+        args=[864000.0, 85536000.0, 30000.0, 30000.0],
+    )
+
+
+def test_users_are_limited_by_id_and_unscoped_methods_by_base_rate():
+    patcher, script = _script([1, 0, 0])
+    user = SimpleNamespace(is_authenticated=True, pk=7)
+
+    with patcher:
+        GCRAThrottle().allow_request(_request("get", user), VIEW)
+
+    assert script.call_args.kwargs["keys"] == ["throttle:user:user:7"]
+
+
+def test_throttled_request_reports_wait():
+    patcher, _ = _script([0, 1500, 2])
+    throttle = GCRAThrottle()
+
+    with patcher:
+        assert throttle.allow_request(_request(), VIEW) is False
+
+    assert throttle.wait() == 1.5
+
+
+def test_fails_open_when_redis_is_down():
+    patcher, script = _script(None)
+    script.side_effect = redis.ConnectionError()
+
+    with patcher:
+        assert GCRAThrottle().allow_request(_request(), VIEW) is True
+
+
+@pytest.mark.django_db
+def test_api_returns_429_with_retry_after(monkeypatch):
+    monkeypatch.setattr(PayoutListCreateAPIView, "throttle_classes", [GCRAThrottle])
+    patcher, _ = _script([0, 20000, 2])
+
+    with patcher:
+        response = APIClient().post("/api/payouts/", {}, format="json")
+
+    assert response.status_code == 429
+    assert response["Retry-After"] == "20"
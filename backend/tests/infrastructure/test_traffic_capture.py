@@ -0,0 +1,105 @@
+# backend/tests/infrastructure/test_traffic_capture.py
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from infrastructure.traffic_capture import anonymize, pseudonym
+from payouts.models import Recipient
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def capture_settings(settings, tmp_path):
+    settings.TRAFFIC_CAPTURE_ENABLED = True
+    settings.TRAFFIC_CAPTURE_DIR = str(tmp_path)
+    return settings
+
+
+def _captured(tmp_path) -> list[dict]:
+    (path,) = tmp_path.glob("traffic-*.jsonl")
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_anonymize_keeps_numbers_and_plain_fields():
+    data = {
+        "recipient_id": 7,
+        "amount": "10.00",
+        "currency": "USD",
+        "idempotency_key": "idem-capture-1",
+        "ids": [1, 2],
+    }
+
+    anonymized = anonymize(data)
+
+    assert anonymized["recipient_id"] == 7
+    assert anonymized["amount"] == "10.00"
+    assert anonymized["currency"] == "USD"
+    assert anonymized["ids"] == [1, 2]
+    # Stable pseudonym: retries with one key replay with one key
+    assert anonymized["idempotency_key"] == pseudonym("idem-capture-1")
+    assert anonymized["idempotency_key"].startswith("anon-")
+    assert "idem-capture-1" not in json.dumps(anonymized)
+
+
+@pytest.mark.django_db
+def test_api_requests_are_captured_anonymized(tmp_path):
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+    client = APIClient()
+
+    client.post(
+        "/api/payouts/",
+        {
+            "recipient_id": recipient.id,
+            "amount": "10.00",
+            "currency": "USD",
+            "idempotency_key": "idem-capture-2",
+        },
+        format="json",
+    )
+    client.get("/api/payouts/", {"created_from": "2026-01-01T00:00:00Z"})
+    client.get("/health/live/")
+
+    create, listing = _captured(tmp_path)
+    assert create["method"] == "POST"
+    assert create["route"] == "/api/payouts/"
+    assert create["status"] == 201
+    assert create["body"]["idempotency_key"] == pseudonym("idem-capture-2")
+    assert create["body"]["currency"] == "USD"
+    assert create["staff"] is False
+    assert create["duration_ms"] > 0
+    assert create["client"].startswith("anon-")
+    assert listing["query"] == {"created_from": ["2026-01-01T00:00:00Z"]}
+    assert "John Doe" not in json.dumps([create, listing])
+
+
+@pytest.mark.django_db
+def test_detail_route_and_staff_flag(tmp_path):
+    client = APIClient()
+    client.force_login(
+        User.objects.create_user(username="staff", password="pass", is_staff=True)
+    )
+
+    client.get("/api/payouts/999/")
+
+    (entry,) = _captured(tmp_path)
+    assert entry["path"] == "/api/payouts/999/"
+    assert entry["route"] == "/api/payouts/<int:pk>/"
+    assert entry["status"] == 404
+    assert entry["staff"] is True
+
+
+@pytest.mark.django_db
+def test_nothing_is_captured_when_disabled(capture_settings, tmp_path):
+    capture_settings.TRAFFIC_CAPTURE_ENABLED = False
+
+    APIClient().get("/api/payouts/")
+
+    assert not list(tmp_path.iterdir())
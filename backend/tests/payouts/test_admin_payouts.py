@@ -0,0 +1,120 @@
+# backend/tests/payouts/test_admin_payouts.py
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+
+from payouts.admin import PayoutAdmin
+from payouts.domain.value_objects import idempotency_key_hash
+from payouts.models import Payout, PayoutIdempotencyKey, Recipient
+from payouts.selectors import estimated_count
+
+User = get_user_model()
+
+CHANGELIST_URL = "/admin/payouts/payout/"
+
+
+@pytest.fixture
+def admin_client_():
+    client = Client()
+    client.force_login(User.objects.create_superuser(username="admin", password="pass"))
+    return client
+
+
+def _create_payouts(count: int, *, status: str = Payout.Status.NEW) -> list[Payout]:
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+    return [
+        Payout.objects.create(
+            recipient=recipient,
+            amount=Decimal("10.00"),
+            currency="USD",
+            status=status,
+            recipient_name_snapshot=recipient.name,
+            account_number_snapshot=f"UA{index:010d}",
+            idempotency_key=f"idem-admin-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_changelist_pages_by_keyset_without_count(admin_client_, monkeypatch):
+    payouts = _create_payouts(3)
+    monkeypatch.setattr(PayoutAdmin, "list_per_page", 2)
+
+    with CaptureQueriesContext(connection) as queries:
+        first = admin_client_.get(CHANGELIST_URL)
+    older_url = first.context["cl"].older_url
+    second = admin_client_.get(CHANGELIST_URL + older_url)
+
+    payout_sql = [q["sql"] for q in queries if "payouts_payout" in q["sql"]]
+    assert not any("OFFSET" in sql for sql in payout_sql)
+    assert not any("INNER JOIN" in sql for sql in payout_sql)
+    assert [p.pk for p in first.context["cl"].result_list] == [
+        payouts[2].pk,
+        payouts[1].pk,
+    ]
+    assert [p.pk for p in second.context["cl"].result_list] == [payouts[0].pk]
+    assert second.context["cl"].older_url is None
+    assert "Newest" in second.content.decode()
+
+
+@pytest.mark.django_db
+def test_estimated_count_uses_planner_for_large_results(monkeypatch):
+    _create_payouts(2)
+    assert estimated_count(Payout.objects.all()) == 2
+
+    monkeypatch.setattr("payouts.selectors.ESTIMATED_COUNT_EXACT_BELOW", 0)
+    with CaptureQueriesContext(connection) as queries:
+        estimated_count(Payout.objects.all())
+
+    assert [q["sql"].split()[0] for q in queries] == ["EXPLAIN"]
+
+
+@pytest.mark.django_db
+def test_search_matches_indexed_snapshot_fields_and_idempotency_key(admin_client_):
+    payouts = _create_payouts(3)
+    PayoutIdempotencyKey.objects.create(
+        key_hash=idempotency_key_hash(payouts[1].idempotency_key),
+        payout=payouts[1],
+        payout_created_at=payouts[1].created_at,
+    )
+
+    def search(term: str) -> list[int]:
+        response = admin_client_.get(CHANGELIST_URL, {"q": term})
+        return [p.pk for p in response.context["cl"].result_list]
+
+    assert search("UA0000000002") == [payouts[2].pk]
+    assert search("idem-admin-1") == [payouts[1].pk]
+    assert search(str(payouts[0].pk)) == [payouts[0].pk]
+    assert len(search("John")) == 3
+
+
+@pytest.mark.django_db
+def test_bulk_action_changes_status_through_use_case(admin_client_):
+    new = _create_payouts(1)[0]
+    completed = _create_payouts(1, status=Payout.Status.COMPLETED)[0]
+
+    response = admin_client_.post(
+        CHANGELIST_URL,
+        {
+            "action": "mark_processing",
+            "_selected_action": [new.pk, completed.pk],
+        },
+        follow=True,
+    )
+
+    new.refresh_from_db()
+    completed.refresh_from_db()
+    assert new.status == Payout.Status.PROCESSING
+    assert completed.status == Payout.Status.COMPLETED
+    assert new.status_history.filter(to_status=Payout.Status.PROCESSING).exists()
+    assert "1 payout(s) moved to PROCESSING; 1 skipped" in response.content.decode()
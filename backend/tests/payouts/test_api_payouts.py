@@ -1,5 +1,6 @@
 # backend/tests/payouts/test_api_payouts.py
 from decimal import Decimal
+from unittest.mock import patch
 
 import pytest
 from django.contrib.auth import get_user_model
@@ -300,3 +301,27 @@ class TestPayoutDetailAPI:
         assert "detail" in data
         payout.refresh_from_db()
         assert payout.status == Payout.Status.COMPLETED
+
+    def test_patch_payout_status_lost_race_returns_409(self):
+        payout = self._create_payout(status=Payout.Status.NEW)
+        stale = Payout.objects.select_related("recipient").get(pk=payout.pk)
+
+        # A worker moves the payout after the view has loaded it
+        Payout.objects.filter(pk=payout.pk).update(status=Payout.Status.PROCESSING)
+
+        admin = User.objects.create_user(
+            username="admin3",
+            password="adminpass3",
+            is_staff=True,
+        )
+        self.client.force_authenticate(user=admin)
+
+        url = f"/api/payouts/{payout.id}/"
+        payload = {"status": Payout.Status.FAILED}
+
+        with patch("payouts.api.api.PayoutRepository.get_by_id", return_value=stale):
+            response = self.client.patch(url, data=payload, format="json")
+
+        assert response.status_code == 409
+        payout.refresh_from_db()
+        assert payout.status == Payout.Status.PROCESSING
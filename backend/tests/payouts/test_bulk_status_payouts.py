@@ -0,0 +1,255 @@
+# backend/tests/payouts/test_bulk_status_payouts.py
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.exceptions import DomainPermissionError
+from payouts.application.use_cases import BulkChangeStatusUseCase
+from payouts.events import PayoutStatusesChanged
+from payouts.models import Payout, PayoutStatusHistory, Recipient
+from payouts.repositories import PayoutRepository
+
+User = get_user_model()
+
+API_BULK_URL = "/api/payouts/bulk-status/"
+
+
+@pytest.mark.django_db
+class TestBulkChangeStatusUseCase:
+    def _create_recipient(self, *, is_active: bool = True) -> Recipient:
+        return Recipient.objects.create(
+            type=Recipient.Type.INDIVIDUAL,
+            name="John Doe",
+            account_number="UA1234567890",
+            bank_code="MFO123",
+            country="UA",
+            is_active=is_active,
+        )
+
+    def _create_payout(self, recipient: Recipient, status: str, key: str) -> Payout:
+        return Payout.objects.create(
+            recipient=recipient,
+            amount=Decimal("10.00"),
+            currency="USD",
+            status=status,
+            recipient_name_snapshot=recipient.name,
+            account_number_snapshot=recipient.account_number,
+            bank_code_snapshot=recipient.bank_code,
+            idempotency_key=key,
+        )
+
+    def _create_admin(self) -> User:
+        return User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+
+    def test_bulk_fail_reports_per_id_outcome(self):
+        active = self._create_recipient()
+        inactive = self._create_recipient(is_active=False)
+        new = self._create_payout(active, Payout.Status.NEW, "idem-bulk-1")
+        processing = self._create_payout(
+            active, Payout.Status.PROCESSING, "idem-bulk-2"
+        )
+        completed = self._create_payout(active, Payout.Status.COMPLETED, "idem-bulk-3")
+        blocked = self._create_payout(inactive, Payout.Status.NEW, "idem-bulk-4")
+
+        outcomes = BulkChangeStatusUseCase.execute(
+            payout_ids=[new.id, processing.id, completed.id, blocked.id, 9999],
+            new_status=Payout.Status.FAILED,
+            actor=self._create_admin(),
+        )
+
+        assert outcomes == {
+            new.id: "updated",
+            processing.id: "updated",
+            completed.id: "invalid_transition",
+            blocked.id: "recipient_inactive",
+            9999: "not_found",
+        }
+        statuses = dict(Payout.objects.values_list("id", "status"))
+        assert statuses[new.id] == Payout.Status.FAILED
+        assert statuses[processing.id] == Payout.Status.FAILED
+        assert statuses[completed.id] == Payout.Status.COMPLETED
+        assert statuses[blocked.id] == Payout.Status.NEW
+
+    def test_bulk_issues_one_update_per_current_status(self):
+        recipient = self._create_recipient()
+        ids = [
+            self._create_payout(recipient, status, f"idem-bulk-q-{i}").id
+            for i, status in enumerate(
+                [Payout.Status.NEW] * 5 + [Payout.Status.PROCESSING] * 5
+            )
+        ]
+
+        with CaptureQueriesContext(connection) as ctx:
+            BulkChangeStatusUseCase.execute(
+                payout_ids=ids,
+                new_status=Payout.Status.FAILED,
+                actor=None,
+            )
+
+        updates = [q for q in ctx if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 2
+
+    def test_bulk_locks_chunks_in_ascending_id_order(self):
+        recipient = self._create_recipient()
+        ids = [
+            self._create_payout(recipient, Payout.Status.NEW, f"idem-bulk-o-{i}").id
+            for i in range(5)
+        ]
+        requested = ids[::-1]
+
+        with patch("payouts.application.use_cases.BULK_STATUS_CHUNK_SIZE", 2), patch(
+            "payouts.application.use_cases.PayoutRepository.lock_status_rows",
+            wraps=PayoutRepository.lock_status_rows,
+        ) as lock_rows:
+            outcomes = BulkChangeStatusUseCase.execute(
+                payout_ids=requested,
+                new_status=Payout.Status.FAILED,
+                actor=None,
+            )
+
+        assert [list(c.args[0]) for c in lock_rows.call_args_list] == [
+            ids[0:2],
+            ids[2:4],
+            ids[4:5],
+        ]
+        assert list(outcomes) == requested
+
+    def test_bulk_publishes_batch_event_per_group(
+        self, django_capture_on_commit_callbacks
+    ):
+        recipient = self._create_recipient()
+        new = self._create_payout(recipient, Payout.Status.NEW, "idem-bulk-e-1")
+
+        with patch("payouts.application.use_cases.event_bus.publish") as publish:
+            with django_capture_on_commit_callbacks(execute=True):
+                BulkChangeStatusUseCase.execute(
+                    payout_ids=[new.id],
+                    new_status=Payout.Status.PROCESSING,
+                    actor=None,
+                )
+
+        publish.assert_called_once_with(
+            PayoutStatusesChanged(
+                payout_ids=(new.id,),
+                old_status=Payout.Status.NEW,
+                new_status=Payout.Status.PROCESSING,
+            )
+        )
+
+    def test_bulk_conflict_writes_no_history_or_event(
+        self, django_capture_on_commit_callbacks
+    ):
+        recipient = self._create_recipient()
+        kept = self._create_payout(recipient, Payout.Status.NEW, "idem-bulk-c-1")
+        moved = self._create_payout(recipient, Payout.Status.NEW, "idem-bulk-c-2")
+        bulk_update_status = PayoutRepository.bulk_update_status
+
+        def move_one_then_update(payout_ids, **kwargs):
+            Payout.objects.filter(pk=moved.pk).update(status=Payout.Status.FAILED)
+            return bulk_update_status(payout_ids, **kwargs)
+
+        with patch(
+            "payouts.application.use_cases.PayoutRepository.bulk_update_status",
+            side_effect=move_one_then_update,
+        ), patch("payouts.application.use_cases.event_bus.publish") as publish:
+            with django_capture_on_commit_callbacks(execute=True):
+                outcomes = BulkChangeStatusUseCase.execute(
+                    payout_ids=[kept.id, moved.id],
+                    new_status=Payout.Status.PROCESSING,
+                    actor=None,
+                )
+
+        assert outcomes == {kept.id: "updated", moved.id: "conflict"}
+        assert list(
+            PayoutStatusHistory.objects.values_list("payout_id", flat=True)
+        ) == [kept.id]
+        publish.assert_called_once_with(
+            PayoutStatusesChanged(
+                payout_ids=(kept.id,),
+                old_status=Payout.Status.NEW,
+                new_status=Payout.Status.PROCESSING,
+            )
+        )
+
+    def test_bulk_forbidden_for_non_staff(self):
+        user = User.objects.create_user(username="user", password="pass")
+
+        with pytest.raises(DomainPermissionError):
+            BulkChangeStatusUseCase.execute(
+                payout_ids=[1],
+                new_status=Payout.Status.FAILED,
+                actor=user,
+            )
+
+
+@pytest.mark.django_db
+class TestPayoutBulkStatusAPI:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_bulk_status_as_staff(self):
+        recipient = Recipient.objects.create(
+            type=Recipient.Type.INDIVIDUAL,
+            name="John Doe",
+            account_number="UA1234567890",
+            is_active=True,
+        )
+        payout = Payout.objects.create(
+            recipient=recipient,
+            amount=Decimal("10.00"),
+            currency="USD",
+            status=Payout.Status.PROCESSING,
+            recipient_name_snapshot=recipient.name,
+            account_number_snapshot=recipient.account_number,
+            idempotency_key="idem-bulk-api-1",
+        )
+        admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.post(
+            API_BULK_URL,
+            data={"ids": [payout.id, 9999], "status": Payout.Status.COMPLETED},
+            format="json",
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": Payout.Status.COMPLETED,
+            "updated": 1,
+            "results": [
+                {"id": payout.id, "outcome": "updated"},
+                {"id": 9999, "outcome": "not_found"},
+            ],
+        }
+
+    def test_bulk_status_forbidden_for_anonymous(self):
+        response = self.client.post(
+            API_BULK_URL,
+            data={"ids": [1], "status": Payout.Status.FAILED},
+            format="json",
+        )
+
+        assert response.status_code == 403
+
+    def test_bulk_status_rejects_empty_ids(self):
+        admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.post(
+            API_BULK_URL,
+            data={"ids": [], "status": Payout.Status.FAILED},
+            format="json",
+        )
+
+        assert response.status_code == 400
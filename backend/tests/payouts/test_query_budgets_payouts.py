@@ -0,0 +1,132 @@
+# backend/tests/payouts/test_query_budgets_payouts.py
+"""
+Query budgets for the payout endpoints. Lists are queried with several rows so
+per-row queries (N+1) fail the max_repeats check, not just the total.
+"""
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from rest_framework.test import APIClient
+
+from payouts.models import Payout, Recipient
+
+User = get_user_model()
+
+API_LIST_URL = "/api/payouts/"
+ROWS = 5
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+
+
+@pytest.fixture
+def recipient():
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+
+@pytest.fixture
+def payouts(recipient):
+    return [
+        Payout.objects.create(
+            recipient=recipient,
+            amount=Decimal("10.00") + index,
+            currency="USD",
+            status=Payout.Status.PROCESSING,
+            recipient_name_snapshot=recipient.name,
+            account_number_snapshot=recipient.account_number,
+            bank_code_snapshot=recipient.bank_code,
+            idempotency_key=f"idem-budget-{index}",
+        )
+        for index in range(ROWS)
+    ]
+
+
+@pytest.fixture
+def admin_client():
+    client = APIClient()
+    client.force_authenticate(
+        User.objects.create_user(username="admin", password="pass", is_staff=True)
+    )
+    return client
+
+
+@pytest.mark.django_db
+def test_list_budget(query_budget, payouts):
+    client = APIClient()
+
+    with query_budget(max_queries=1):
+        response = client.get(API_LIST_URL)
+    assert len(response.json()["results"]) == ROWS
+
+    # Cached page: no database at all
+    with query_budget(max_queries=0):
+        client.get(API_LIST_URL)
+
+
+@pytest.mark.django_db
+def test_detail_budget(query_budget, payouts):
+    with query_budget(max_queries=1):
+        response = APIClient().get(f"{API_LIST_URL}{payouts[0].id}/")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_create_budget(query_budget, recipient):
+    payload = {
+        "recipient_id": recipient.id,
+        "amount": "10.00",
+        "currency": "USD",
+        "idempotency_key": "idem-budget-create",
+    }
+    client = APIClient()
+
+    # Counts include the SAVEPOINT / RELEASE pairs the test transaction turns
+    # each atomic block into.
+    # recipient, key lookup, payout + key registry inserts
+    with query_budget(max_queries=8, max_repeats=2):
+        assert client.post(API_LIST_URL, payload, format="json").status_code == 201
+
+    # Replay: recipient, key registry, payout
+    with query_budget(max_queries=5):
+        assert client.post(API_LIST_URL, payload, format="json").status_code == 200
+
+
+@pytest.mark.django_db
+def test_bulk_status_budget(query_budget, payouts, admin_client):
+    # lock rows, one UPDATE per current status, one history INSERT
+    with query_budget(max_queries=5):
+        response = admin_client.post(
+            f"{API_LIST_URL}bulk-status/",
+            {"ids": [payout.id for payout in payouts], "status": "COMPLETED"},
+            format="json",
+        )
+    assert response.json()["updated"] == ROWS
+
+
+@pytest.mark.django_db
+def test_patch_status_budget(query_budget, payouts, admin_client):
+    # fetch, compare-and-set UPDATE, history INSERT
+    with query_budget(max_queries=5, max_repeats=2):
+        response = admin_client.patch(
+            f"{API_LIST_URL}{payouts[0].id}/",
+            {"status": "COMPLETED"},
+            format="json",
+        )
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_time_in_state_budget(query_budget, admin_client):
+    with query_budget(max_queries=1):
+        assert admin_client.get(f"{API_LIST_URL}time-in-state/").status_code == 200
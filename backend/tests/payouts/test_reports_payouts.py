@@ -0,0 +1,180 @@
+# backend/tests/payouts/test_reports_payouts.py
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from payouts.models import PayoutDailyRecipientRollup, PayoutDailyRollup, Recipient
+
+User = get_user_model()
+
+API_REPORTS_URL = "/api/payouts/reports/"
+
+
+@pytest.mark.django_db
+class TestPayoutReportAPI:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def _login_admin(self) -> None:
+        admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+
+    def _rollups(self) -> tuple[Recipient, Recipient]:
+        first, second = (
+            Recipient.objects.create(
+                type=Recipient.Type.INDIVIDUAL,
+                name=name,
+                account_number="UA1234567890",
+                is_active=True,
+            )
+            for name in ("John Doe", "Jane Doe")
+        )
+        rows = [
+            (date(2026, 5, 1), "USD", "COMPLETED", first, 3, "30.00"),
+            (date(2026, 5, 1), "USD", "COMPLETED", second, 1, "5.00"),
+            (date(2026, 5, 1), "EUR", "FAILED", first, 2, "8.00"),
+            (date(2026, 5, 2), "USD", "COMPLETED", first, 4, "40.00"),
+            (date(2026, 5, 3), "USD", "COMPLETED", first, 9, "90.00"),
+        ]
+        PayoutDailyRecipientRollup.objects.bulk_create(
+            PayoutDailyRecipientRollup(
+                day=day,
+                currency=currency,
+                status=status,
+                recipient=recipient,
+                payout_count=count,
+                amount_total=Decimal(amount),
+                computed_at=timezone.now(),
+            )
+            for day, currency, status, recipient, count, amount in rows
+        )
+        totals = {}
+        for day, currency, status, _, count, amount in rows:
+            total = totals.setdefault((day, currency, status), [0, Decimal("0")])
+            total[0] += count
+            total[1] += Decimal(amount)
+        PayoutDailyRollup.objects.bulk_create(
+            PayoutDailyRollup(
+                day=day,
+                currency=currency,
+                status=status,
+                payout_count=count,
+                amount_total=amount,
+                computed_at=timezone.now(),
+            )
+            for (day, currency, status), (count, amount) in totals.items()
+        )
+        return first, second
+
+    def test_groups_rollups_within_date_range(self):
+        self._rollups()
+        self._login_admin()
+
+        response = self.client.get(
+            API_REPORTS_URL, {"date_from": "2026-05-01", "date_to": "2026-05-02"}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["rows"] == [
+            {
+                "day": "2026-05-01",
+                "currency": "EUR",
+                "status": "FAILED",
+                "payout_count": 2,
+                "amount_total": "8.00",
+            },
+            {
+                "day": "2026-05-01",
+                "currency": "USD",
+                "status": "COMPLETED",
+                "payout_count": 4,
+                "amount_total": "35.00",
+            },
+            {
+                "day": "2026-05-02",
+                "currency": "USD",
+                "status": "COMPLETED",
+                "payout_count": 4,
+                "amount_total": "40.00",
+            },
+        ]
+
+    def test_filters_and_custom_grouping(self):
+        first, _ = self._rollups()
+        self._login_admin()
+
+        response = self.client.get(
+            API_REPORTS_URL,
+            {
+                "date_from": "2026-05-01",
+                "date_to": "2026-05-31",
+                "group_by": "recipient,currency",
+                "currency": "USD",
+                "recipient_id": first.id,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["rows"] == [
+            {
+                "recipient_id": first.id,
+                "currency": "USD",
+                "payout_count": 16,
+                "amount_total": "160.00",
+            }
+        ]
+
+    def test_query_is_normalized(self):
+        first, _ = self._rollups()
+        self._login_admin()
+
+        response = self.client.get(
+            API_REPORTS_URL,
+            {
+                "date_from": "2026-05-01",
+                "date_to": "2026-05-31",
+                "group_by": "recipient, ,currency",
+                "currency": "usd",
+                "recipient_id": first.id,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json()["rows"] == [
+            {
+                "recipient_id": first.id,
+                "currency": "USD",
+                "payout_count": 16,
+                "amount_total": "160.00",
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"date_from": "2026-05-01", "date_to": "2026-05-02", "group_by": " , "},
+            {"date_from": "2026-05-02", "date_to": "2026-05-01"},
+            {"date_from": "2025-01-01", "date_to": "2026-05-01"},
+            {"date_from": "2026-05-01", "date_to": "2026-05-02", "group_by": "week"},
+        ],
+    )
+    def test_invalid_query_returns_400(self, params):
+        self._login_admin()
+
+        assert self.client.get(API_REPORTS_URL, params).status_code == 400
+
+    def test_forbidden_for_non_staff(self):
+        user = User.objects.create_user(username="user", password="pass")
+        self.client.force_authenticate(user=user)
+
+        response = self.client.get(
+            API_REPORTS_URL, {"date_from": "2026-05-01", "date_to": "2026-05-02"}
+        )
+
+        assert response.status_code == 403
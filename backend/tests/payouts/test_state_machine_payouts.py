@@ -0,0 +1,96 @@
+# backend/tests/payouts/test_state_machine_payouts.py
+from decimal import Decimal
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+
+from core.exceptions import DomainValidationError
+from payouts.domain.state_machine import (
+    PAYOUT_STATUS_MACHINE,
+    StateMachine,
+    trigger_function_name,
+)
+from payouts.models import Payout, Recipient
+
+
+def test_machine_precomputes_tables():
+    machine = PAYOUT_STATUS_MACHINE
+
+    assert machine.allowed_targets("NEW") == {"PROCESSING", "FAILED"}
+    assert machine.sources("FAILED") == {"NEW", "PROCESSING"}
+    assert machine.sources("NEW") == frozenset()
+    assert machine.terminal == {"COMPLETED", "FAILED"}
+    assert machine.can("PROCESSING", "COMPLETED")
+    assert not machine.can("NEW", "COMPLETED")
+
+    with pytest.raises(DomainValidationError, match="from COMPLETED to NEW"):
+        machine.validate("COMPLETED", "NEW")
+
+
+def test_check_many_with_shared_and_per_row_targets():
+    machine = PAYOUT_STATUS_MACHINE
+    currents = ["NEW", "PROCESSING", "COMPLETED", "UNKNOWN"]
+
+    assert machine.check_many(currents, "FAILED") == [True, True, False, False]
+    targets = ["PROCESSING", "NEW", "FAILED", "NEW"]
+    assert machine.check_many(currents, targets) == [True, False, False, False]
+
+    with pytest.raises(ValueError):
+        machine.check_many(currents, ["NEW"])
+
+
+def test_undeclared_target_state_is_rejected():
+    with pytest.raises(ValueError, match="undeclared"):
+        StateMachine({"A": ("B",)})
+
+
+@pytest.mark.django_db
+class TestStatusTransitionTrigger:
+    def _create_payout(self) -> Payout:
+        recipient = Recipient.objects.create(
+            type=Recipient.Type.INDIVIDUAL,
+            name="John Doe",
+            account_number="UA1234567890",
+            is_active=True,
+        )
+        return Payout.objects.create(
+            recipient=recipient,
+            amount=Decimal("10.00"),
+            currency="USD",
+            idempotency_key="idem-trigger-1",
+            recipient_name_snapshot=recipient.name,
+            account_number_snapshot=recipient.account_number,
+        )
+
+    def test_set_based_update_cannot_skip_states(self):
+        payout = self._create_payout()
+
+        with pytest.raises(IntegrityError, match="from NEW to COMPLETED"):
+            with transaction.atomic():
+                Payout.objects.filter(pk=payout.pk).update(status="COMPLETED")
+
+        Payout.objects.filter(pk=payout.pk).update(status="PROCESSING")
+        Payout.objects.filter(pk=payout.pk).update(status="COMPLETED")
+        # Rewriting the same status is not a transition
+        Payout.objects.filter(pk=payout.pk).update(status="COMPLETED")
+
+        with pytest.raises(IntegrityError, match="from COMPLETED to FAILED"):
+            with transaction.atomic():
+                Payout.objects.filter(pk=payout.pk).update(status="FAILED")
+
+        payout.refresh_from_db()
+        assert payout.status == Payout.Status.COMPLETED
+
+    def test_installed_trigger_matches_state_machine(self):
+        """
+        Fails when PAYOUT_STATUS_TRANSITIONS changed without a migration
+        re-creating the trigger.
+        """
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT prosrc FROM pg_proc WHERE proname = %s",
+                [trigger_function_name("payouts_payout", "status")],
+            )
+            (installed,) = cursor.fetchone()
+
+        assert installed == PAYOUT_STATUS_MACHINE.trigger_function_body("status")
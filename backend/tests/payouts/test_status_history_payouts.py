@@ -0,0 +1,149 @@
+# backend/tests/payouts/test_status_history_payouts.py
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from payouts.application.use_cases import BulkChangeStatusUseCase, ChangeStatusUseCase
+from payouts.models import Payout, PayoutStatusHistory, Recipient
+
+User = get_user_model()
+
+API_TIME_IN_STATE_URL = "/api/payouts/time-in-state/"
+
+
+def _create_recipient() -> Recipient:
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+
+def _create_payout(recipient: Recipient, key: str, status=Payout.Status.NEW):
+    return Payout.objects.create(
+        recipient=recipient,
+        amount=Decimal("10.00"),
+        currency="USD",
+        status=status,
+        recipient_name_snapshot=recipient.name,
+        account_number_snapshot=recipient.account_number,
+        bank_code_snapshot=recipient.bank_code,
+        idempotency_key=key,
+    )
+
+
+@pytest.mark.django_db
+class TestStatusHistoryWrites:
+    def test_change_status_appends_history_row(self):
+        payout = _create_payout(_create_recipient(), "idem-history-1")
+        entered_at = timezone.now() - timedelta(minutes=5)
+        Payout.objects.filter(pk=payout.pk).update(updated_at=entered_at)
+        payout.refresh_from_db()
+
+        ChangeStatusUseCase.execute(
+            payout=payout,
+            new_status=Payout.Status.PROCESSING,
+            actor=None,
+        )
+
+        entry = PayoutStatusHistory.objects.get(payout_id=payout.id)
+        assert entry.from_status == Payout.Status.NEW
+        assert entry.to_status == Payout.Status.PROCESSING
+        assert entry.actor_id is None
+        assert entry.changed_at == payout.updated_at
+        assert timedelta(minutes=5) <= entry.time_in_from_status < timedelta(minutes=6)
+
+    def test_bulk_change_status_bulk_inserts_history(self):
+        recipient = _create_recipient()
+        ids = [_create_payout(recipient, f"idem-history-b-{i}").id for i in range(5)]
+
+        with CaptureQueriesContext(connection) as ctx:
+            BulkChangeStatusUseCase.execute(
+                payout_ids=ids,
+                new_status=Payout.Status.FAILED,
+                actor=None,
+            )
+
+        inserts = [
+            q
+            for q in ctx
+            if q["sql"].startswith('INSERT INTO "payouts_payout_status_history"')
+        ]
+        assert len(inserts) == 1
+        assert PayoutStatusHistory.objects.filter(
+            payout_id__in=ids,
+            from_status=Payout.Status.NEW,
+            to_status=Payout.Status.FAILED,
+        ).count() == len(ids)
+
+
+@pytest.mark.django_db
+class TestTimeInStateAPI:
+    def setup_method(self):
+        self.client = APIClient()
+
+    def test_time_in_state_percentiles(self):
+        payout = _create_payout(_create_recipient(), "idem-history-api-1")
+        now = timezone.now()
+        PayoutStatusHistory.objects.bulk_create(
+            [
+                PayoutStatusHistory(
+                    payout_id=payout.id,
+                    from_status=Payout.Status.NEW,
+                    to_status=Payout.Status.PROCESSING,
+                    time_in_from_status=timedelta(seconds=seconds),
+                    changed_at=now - timedelta(minutes=1),
+                )
+                for seconds in (1, 2, 3, 4, 100)
+            ]
+            + [
+                # Outside the default 24h window
+                PayoutStatusHistory(
+                    payout_id=payout.id,
+                    from_status=Payout.Status.PROCESSING,
+                    to_status=Payout.Status.COMPLETED,
+                    time_in_from_status=timedelta(seconds=10),
+                    changed_at=now - timedelta(days=2),
+                )
+            ]
+        )
+        admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get(API_TIME_IN_STATE_URL)
+
+        assert response.status_code == 200
+        statuses = response.json()["statuses"]
+        assert set(statuses) == {Payout.Status.NEW}
+        assert statuses[Payout.Status.NEW]["count"] == 5
+        assert statuses[Payout.Status.NEW]["p50"] == 3.0
+        assert statuses[Payout.Status.NEW]["max"] == 100.0
+
+    def test_time_in_state_rejects_inverted_window(self):
+        admin = User.objects.create_user(
+            username="admin", password="pass", is_staff=True
+        )
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get(
+            API_TIME_IN_STATE_URL,
+            {"since": "2025-01-02T00:00:00Z", "until": "2025-01-01T00:00:00Z"},
+        )
+
+        assert response.status_code == 400
+
+    def test_time_in_state_forbidden_for_anonymous(self):
+        response = self.client.get(API_TIME_IN_STATE_URL)
+
+        assert response.status_code == 403
@@ -3,8 +3,14 @@ from decimal import Decimal
 
 import pytest
 from django.contrib.auth import get_user_model
-
-from core.exceptions import DomainPermissionError, DomainValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.exceptions import (
+    DomainConflictError,
+    DomainPermissionError,
+    DomainValidationError,
+)
 from payouts.application.use_cases import ChangeStatusUseCase, CreatePayoutUseCase
 from payouts.models import Payout, Recipient
 
@@ -171,3 +177,37 @@ class TestChangeStatusUseCase:
 
         payout.refresh_from_db()
         assert payout.status == Payout.Status.NEW
+
+    def test_change_status_writes_only_status_columns(self):
+        payout = self._create_payout(status=Payout.Status.NEW)
+
+        with CaptureQueriesContext(connection) as ctx:
+            ChangeStatusUseCase.execute(
+                payout=payout,
+                new_status=Payout.Status.PROCESSING,
+                actor=None,
+            )
+
+        updates = [q["sql"] for q in ctx if q["sql"].startswith("UPDATE")]
+        assert len(updates) == 1
+        assert '"amount"' not in updates[0]
+        assert '"status" = ' in updates[0].split("WHERE")[1]
+
+    def test_change_status_lost_race_raises_conflict(self):
+        """
+        A concurrent writer moved the row first: the stale instance must not
+        overwrite it.
+        """
+        payout = self._create_payout(status=Payout.Status.NEW)
+        Payout.objects.filter(pk=payout.pk).update(status=Payout.Status.FAILED)
+
+        with pytest.raises(DomainConflictError):
+            ChangeStatusUseCase.execute(
+                payout=payout,
+                new_status=Payout.Status.PROCESSING,
+                actor=None,
+            )
+
+        assert payout.status == Payout.Status.NEW
+        payout.refresh_from_db()
+        assert payout.status == Payout.Status.FAILED
@@ -0,0 +1,115 @@
+# backend/tests/test_authentication.py
+import time
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from config.interfaces.http import authentication
+from config.interfaces.http.authentication import get_principal_cache, issue_token
+from payouts.models import Payout, Recipient
+
+User = get_user_model()
+
+
+@pytest.fixture(autouse=True)
+def clear_principals():
+    get_principal_cache().clear()
+    yield
+    get_principal_cache().clear()
+
+
+def _payout() -> Payout:
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        is_active=True,
+    )
+    return Payout.objects.create(
+        recipient=recipient,
+        amount="10.00",
+        currency="USD",
+        status=Payout.Status.NEW,
+        idempotency_key="idem-auth-1",
+    )
+
+
+def _client(user) -> APIClient:
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {issue_token(user)}")
+    return client
+
+
+def _auth_queries(queries) -> list[str]:
+    return [
+        q["sql"]
+        for q in queries
+        if "auth_user" in q["sql"] or "django_session" in q["sql"]
+    ]
+
+
+@pytest.mark.django_db
+def test_staff_token_changes_status_without_auth_queries_once_cached():
+    payout = _payout()
+    admin = User.objects.create_user(username="admin", is_staff=True)
+    client = _client(admin)
+
+    assert client.get(f"/api/payouts/{payout.id}/").status_code == 200
+    with CaptureQueriesContext(connection) as queries:
+        response = client.patch(
+            f"/api/payouts/{payout.id}/",
+            {"status": Payout.Status.PROCESSING},
+            format="json",
+        )
+
+    assert response.status_code == 200
+    assert _auth_queries(queries.captured_queries) == []
+    history = payout.status_history.get(to_status=Payout.Status.PROCESSING)
+    assert history.actor_id == admin.id
+
+
+@pytest.mark.django_db
+def test_non_staff_token_cannot_change_status():
+    payout = _payout()
+    user = User.objects.create_user(username="user")
+
+    response = _client(user).patch(
+        f"/api/payouts/{payout.id}/",
+        {"status": Payout.Status.PROCESSING},
+        format="json",
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.django_db
+def test_tampered_and_expired_tokens_are_rejected(settings):
+    payout = _payout()
+    user = User.objects.create_user(username="admin", is_staff=True)
+    token = issue_token(user)
+    client = APIClient()
+
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token[:-1]}x")
+    assert client.delete(f"/api/payouts/{payout.id}/").status_code == 403
+
+    settings.API_TOKEN_MAX_AGE_SECONDS = -1
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+    assert client.delete(f"/api/payouts/{payout.id}/").status_code == 403
+    assert Payout.objects.filter(id=payout.id).exists()
+
+
+@pytest.mark.django_db
+def test_deactivation_applies_after_cache_ttl(monkeypatch):
+    user = User.objects.create_user(username="user")
+    client = _client(user)
+    assert client.get("/api/payouts/").status_code == 200
+
+    User.objects.filter(pk=user.pk).update(is_active=False)
+    assert client.get("/api/payouts/").status_code == 200  # still cached
+
+    later = time.monotonic() + get_principal_cache().ttl_seconds
+    monkeypatch.setattr(authentication.time, "monotonic", lambda: later)
+    assert client.get("/api/payouts/").status_code == 403
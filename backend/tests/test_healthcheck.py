@@ -1,7 +1,26 @@
 # backend/tests/test_healthcheck.py
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
+from django.test import override_settings
 from rest_framework.test import APIClient
 
+from infrastructure.health import HealthMonitor
+
+
+def _ok():
+    return None
+
+
+def _fail():
+    raise ConnectionError("down")
+
+
+def _monitor(**probes) -> HealthMonitor:
+    probes = {"database": _ok, "cache": _ok, "broker": _ok, **probes}
+    return HealthMonitor(probes, background=False, interval=0, timeout=0.2)
+
 
 @pytest.mark.django_db
 def test_healthcheck_basic():
@@ -12,3 +31,93 @@ def test_healthcheck_basic():
     assert "database" in data
     assert "redis" in data
     assert "status" in data
+
+
+@pytest.mark.django_db
+def test_healthcheck_reports_database_latency():
+    resp = APIClient().get("/health/ready/")
+
+    database = resp.json()["checks"]["database"]
+    assert database["ok"] is True
+    assert database["latency_ms"] >= 0
+
+
+def test_liveness_does_not_probe_dependencies():
+    with patch("config.interfaces.http.healthcheck.get_health_monitor") as monitor:
+        resp = APIClient().get("/health/live/")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "alive"}
+    monitor.assert_not_called()
+
+
+def test_readiness_ready_when_all_probes_pass():
+    with patch(
+        "config.interfaces.http.healthcheck.get_health_monitor",
+        return_value=_monitor(),
+    ):
+        resp = APIClient().get("/health/ready/")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["status"] == "ready"
+    assert set(data["checks"]) == {"database", "cache", "broker"}
+
+
+def test_readiness_not_ready_when_probe_fails():
+    with patch(
+        "config.interfaces.http.healthcheck.get_health_monitor",
+        return_value=_monitor(broker=_fail),
+    ):
+        resp = APIClient().get("/health/ready/")
+
+    assert resp.status_code == 503
+    broker = resp.json()["checks"]["broker"]
+    assert broker["ok"] is False
+    assert broker["error"] == "ConnectionError"
+
+
+def test_slow_probe_times_out_without_blocking_others():
+    monitor = _monitor(cache=lambda: time.sleep(1), broker=lambda: time.sleep(0.1))
+
+    started = time.monotonic()
+    snapshot = monitor.refresh()
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.5
+    assert snapshot.checks["cache"].error == "timeout"
+    # Probes run concurrently: the 0.1s broker probe fit in the 0.2s budget
+    assert snapshot.checks["broker"].ok is True
+
+
+def test_background_monitor_serves_cached_snapshot():
+    probe = MagicMock(return_value=None)
+    monitor = HealthMonitor(
+        {"database": probe, "cache": _ok, "broker": _ok},
+        background=True,
+        interval=60,
+        timeout=0.2,
+    )
+
+    for _ in range(5):
+        assert monitor.snapshot().ok is True
+
+    probe.assert_called_once()
+
+
+@override_settings(HEALTHCHECK_STALE_AFTER_SECONDS=0)
+def test_stale_snapshot_is_not_ready():
+    monitor = HealthMonitor(
+        {"database": _ok, "cache": _ok, "broker": _ok},
+        background=True,
+        interval=60,
+        timeout=0.2,
+    )
+
+    with patch(
+        "config.interfaces.http.healthcheck.get_health_monitor",
+        return_value=monitor,
+    ):
+        resp = APIClient().get("/health/ready/")
+
+    assert resp.status_code == 503
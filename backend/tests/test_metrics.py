@@ -0,0 +1,104 @@
+# backend/tests/test_metrics.py
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+from rest_framework.test import APIClient
+
+from payouts.application.use_cases import CreatePayoutUseCase
+from payouts.domain.value_objects import IdempotencyKey
+from payouts.models import Recipient
+from payouts.repositories import PayoutRepository
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def _create_recipient() -> Recipient:
+    return Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+
+def _create(recipient: Recipient, key: str):
+    return CreatePayoutUseCase.execute(
+        recipient_id=recipient.id,
+        amount=Decimal("10.00"),
+        currency="USD",
+        idempotency_key=key,
+    )
+
+
+@pytest.mark.django_db
+def test_metrics_endpoint_exposes_prometheus_text():
+    client = APIClient()
+    client.get("/api/payouts/")
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain")
+    body = response.content.decode()
+    assert "http_request_duration_seconds_bucket" in body
+    assert 'view="payouts-list-create"' in body
+
+
+@pytest.mark.django_db
+def test_list_page_cache_hit_and_miss_counters():
+    client = APIClient()
+    misses = _sample("payouts_list_page_cache_total", result="miss")
+    hits = _sample("payouts_list_page_cache_total", result="hit")
+
+    client.get("/api/payouts/?page_size=7")
+    client.get("/api/payouts/?page_size=7")
+
+    assert _sample("payouts_list_page_cache_total", result="miss") == misses + 1
+    assert _sample("payouts_list_page_cache_total", result="hit") == hits + 1
+
+
+@pytest.mark.django_db
+def test_http_latency_labelled_by_view_method_and_status():
+    labels = {"view": "payouts-detail", "method": "GET", "status": "404"}
+    before = _sample("http_request_duration_seconds_count", **labels)
+
+    APIClient().get("/api/payouts/999999/")
+
+    assert _sample("http_request_duration_seconds_count", **labels) == before + 1
+
+
+@pytest.mark.django_db
+def test_create_and_replay_counters(django_capture_on_commit_callbacks):
+    recipient = _create_recipient()
+    created = _sample("payouts_created_total", currency="USD")
+    replays = _sample("payouts_idempotent_replays_total")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        _create(recipient, "idem-metrics-1")
+    _create(recipient, "idem-metrics-1")
+
+    assert _sample("payouts_created_total", currency="USD") == created + 1
+    assert _sample("payouts_idempotent_replays_total") == replays + 1
+
+
+@pytest.mark.django_db
+def test_lost_idempotency_race_counter():
+    recipient = _create_recipient()
+    _create(recipient, "idem-metrics-2")
+    races = _sample("payouts_idempotency_races_lost_total")
+
+    lookup = PayoutRepository.get_by_idempotency_key_or_none
+    with patch.object(
+        PayoutRepository,
+        "get_by_idempotency_key_or_none",
+        side_effect=[None, lookup(IdempotencyKey("idem-metrics-2"))],
+    ):
+        _create(recipient, "idem-metrics-2")
+
+    assert _sample("payouts_idempotency_races_lost_total") == races + 1
@@ -0,0 +1,208 @@
+# backend/tests/test_tracing.py
+import json
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from core.tracing import (
+    TRACEPARENT_HEADER,
+    SpanContext,
+    parse_traceparent,
+    traced,
+    tracer,
+)
+from infrastructure import tracing as celery_tracing
+from infrastructure.tracing import FileSpanExporter
+from payouts.models import Recipient
+
+REMOTE_TRACEPARENT = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+
+class ListExporter:
+    def __init__(self):
+        self.spans = []
+
+    def export(self, span):
+        self.spans.append(span)
+
+    def named(self, prefix):
+        return [span for span in self.spans if span.name.startswith(prefix)]
+
+
+@pytest.fixture
+def exporter():
+    exporter = ListExporter()
+    tracer.configure(exporter)
+    yield exporter
+    tracer.configure(None)
+
+
+def test_parse_traceparent():
+    context = parse_traceparent(REMOTE_TRACEPARENT)
+
+    assert context == SpanContext(
+        "4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7", sampled=True
+    )
+    assert context.to_traceparent() == REMOTE_TRACEPARENT
+    assert parse_traceparent(REMOTE_TRACEPARENT[:-2] + "00").sampled is False
+    # Future versions may append fields; version 00 may not
+    assert parse_traceparent("01-" + REMOTE_TRACEPARENT[3:] + "-extra") is not None
+    assert parse_traceparent(REMOTE_TRACEPARENT + "-extra") is None
+    assert parse_traceparent("00-" + "0" * 32 + "-00f067aa0ba902b7-01") is None
+    assert parse_traceparent("ff" + REMOTE_TRACEPARENT[2:]) is None
+    assert parse_traceparent("garbage") is None
+    assert parse_traceparent(None) is None
+
+
+def test_spans_nest_and_record_errors(exporter):
+    @traced()
+    def inner():
+        raise ValueError("boom")
+
+    with tracer.start_span("outer") as outer, pytest.raises(ValueError):
+        inner()
+
+    inner_span, outer_span = exporter.spans
+    assert inner_span.name.endswith("inner")
+    assert inner_span.parent_id == outer.context.span_id
+    assert inner_span.context.trace_id == outer.context.trace_id
+    assert inner_span.status == "error"
+    assert inner_span.error == "ValueError: boom"
+    assert outer_span.parent_id is None
+    assert tracer.current_span().recording is False
+
+
+def test_unsampled_traces_propagate_but_are_not_exported(exporter):
+    tracer.sample_rate = 0.0
+    headers = {}
+
+    with tracer.start_span("root") as root:
+        tracer.inject(headers)
+
+    assert exporter.spans == []
+    assert headers[TRACEPARENT_HEADER] == root.context.to_traceparent()
+    assert headers[TRACEPARENT_HEADER].endswith("-00")
+
+
+def test_disabled_tracer_is_noop():
+    with tracer.start_span("ignored") as span:
+        span.set_attribute("key", "value")
+
+    assert span.recording is False
+
+
+def test_celery_headers_carry_trace_context(exporter):
+    headers = {"id": "task-1"}
+
+    with tracer.start_span("HTTP POST") as request_span:
+        celery_tracing._on_before_task_publish(sender="some.task", headers=headers)
+        celery_tracing._on_after_task_publish(sender="some.task", headers=headers)
+
+    # Worker side: the custom header arrives as a request attribute
+    task = MagicMock()
+    task.name = "some.task"
+    task.request.traceparent = headers[TRACEPARENT_HEADER]
+    task.request.retries = 0
+    celery_tracing._on_task_prerun(task_id="task-1", task=task)
+    with tracer.start_span("work"):
+        pass
+    celery_tracing._on_task_postrun(task_id="task-1", state="SUCCESS")
+
+    (publish,) = exporter.named("celery.publish")
+    (run,) = exporter.named("celery.run")
+    (work,) = exporter.named("work")
+    assert publish.parent_id == request_span.context.span_id
+    assert run.parent_id == publish.context.span_id
+    assert run.context.trace_id == request_span.context.trace_id
+    assert work.parent_id == run.context.span_id
+    assert run.attributes["celery.state"] == "SUCCESS"
+
+
+# Real commits: on_commit callbacks run inside the request, as in production
+@pytest.mark.django_db(transaction=True)
+def test_payout_trace_spans_request_event_bus_and_task(exporter):
+    recipient = Recipient.objects.create(
+        type=Recipient.Type.INDIVIDUAL,
+        name="John Doe",
+        account_number="UA1234567890",
+        bank_code="MFO123",
+        country="UA",
+        is_active=True,
+    )
+
+    with patch("infrastructure.payouts.provider.sleep"):
+        response = APIClient().post(
+            "/api/payouts/",
+            {
+                "recipient_id": recipient.id,
+                "amount": "10.00",
+                "currency": "USD",
+                "idempotency_key": "idem-trace-1",
+            },
+            format="json",
+            HTTP_TRACEPARENT=REMOTE_TRACEPARENT,
+        )
+
+    assert response.status_code == 201
+    remote = parse_traceparent(REMOTE_TRACEPARENT)
+    assert response["X-Trace-Id"] == remote.trace_id
+    assert {span.context.trace_id for span in exporter.spans} == {remote.trace_id}
+
+    by_id = {span.context.span_id: span for span in exporter.spans}
+
+    def chain(span):
+        names = []
+        while span is not None:
+            names.append(span.name)
+            span = by_id.get(span.parent_id)
+        return names
+
+    (provider,) = exporter.named("provider.send_payout")
+    assert chain(provider) == [
+        "provider.send_payout",
+        "celery.run infrastructure.payouts.tasks.process_payout_task",
+        "event PayoutCreated",
+        "CreatePayoutUseCase.execute",
+        "HTTP POST payouts-list-create",
+    ]
+    (server,) = exporter.named("HTTP POST")
+    assert server.parent_id == remote.span_id
+    assert server.attributes["http.status_code"] == 201
+    payout_id = response.json()["id"]
+    assert provider.attributes["payout.id"] == payout_id
+    assert exporter.named("PayoutRepository.save")
+    assert exporter.named("cache.")
+
+
+def test_file_exporter_and_trace_report(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracer.configure(FileSpanExporter(str(path)))
+    try:
+        with tracer.start_span("HTTP POST", kind="server") as root:
+            with tracer.start_span("CreatePayoutUseCase.execute") as span:
+                span.set_attribute("payout.id", 7)
+        with tracer.start_span("unrelated"):
+            pass
+    finally:
+        tracer.configure(None)
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [record["name"] for record in records] == [
+        "CreatePayoutUseCase.execute",
+        "HTTP POST",
+        "unrelated",
+    ]
+    assert records[0]["resource"]["pid"]
+
+    out = StringIO()
+    call_command("trace_report", "--payout-id", "7", "--file", str(path), stdout=out)
+
+    lines = out.getvalue().splitlines()
+    assert lines[0] == f"Trace {root.context.trace_id} (2 spans)"
+    assert "HTTP POST" in lines[2]
+    assert "  CreatePayoutUseCase.execute" in lines[3]
+    assert "payout.id=7" in lines[3]
+    assert "unrelated" not in out.getvalue()